@@ -0,0 +1,58 @@
+"""add_price_history
+
+Revision ID: a6b7c8d9e0f1
+Revises: z5a6b7c8d9e0
+Create Date: 2026-10-17
+
+Preisverlauf (Tages-Buckets pro Komponente/Terminal) und Preis-Rollups pro Komponente.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6b7c8d9e0f1'
+down_revision: Union[str, Sequence[str], None] = 'z5a6b7c8d9e0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('item_price_history',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('component_id', sa.Integer(), nullable=False),
+        sa.Column('terminal_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('price_buy', sa.Integer(), nullable=True),
+        sa.Column('price_sell', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['component_id'], ['components.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_item_price_history_component_terminal_day', 'item_price_history',
+                    ['component_id', 'terminal_id', 'day'], unique=True)
+    op.create_index('ix_item_price_history_day', 'item_price_history', ['day'], unique=False)
+
+    op.create_table('component_price_rollups',
+        sa.Column('component_id', sa.Integer(), nullable=False),
+        sa.Column('min_buy', sa.Integer(), nullable=True),
+        sa.Column('min_buy_terminal', sa.String(length=200), nullable=True),
+        sa.Column('max_sell', sa.Integer(), nullable=True),
+        sa.Column('max_sell_terminal', sa.String(length=200), nullable=True),
+        sa.Column('median_buy', sa.Integer(), nullable=True),
+        sa.Column('median_sell', sa.Integer(), nullable=True),
+        sa.Column('terminal_count', sa.Integer(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.ForeignKeyConstraint(['component_id'], ['components.id'], ),
+        sa.PrimaryKeyConstraint('component_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('component_price_rollups')
+    op.drop_index('ix_item_price_history_day', table_name='item_price_history')
+    op.drop_index('ix_item_price_history_component_terminal_day', table_name='item_price_history')
+    op.drop_table('item_price_history')
@@ -0,0 +1,41 @@
+"""add_sc_import_checkpoints
+
+Revision ID: b7c8d9e0f1a2
+Revises: a6b7c8d9e0f1
+Create Date: 2026-10-17
+
+Checkpoints für den SC-Wiki-Import (Fortsetzen nach Abbruch).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c8d9e0f1a2'
+down_revision: Union[str, Sequence[str], None] = 'a6b7c8d9e0f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('sc_import_checkpoints',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('sc_version', sa.String(length=20), nullable=True),
+        sa.Column('last_completed_page', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_pages', sa.Integer(), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False, server_default='running'),
+        sa.Column('started_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_sc_import_checkpoints_id'), 'sc_import_checkpoints', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_sc_import_checkpoints_id'), table_name='sc_import_checkpoints')
+    op.drop_table('sc_import_checkpoints')
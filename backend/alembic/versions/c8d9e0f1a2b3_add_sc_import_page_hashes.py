@@ -0,0 +1,41 @@
+"""add_sc_import_page_hashes
+
+Revision ID: c8d9e0f1a2b3
+Revises: b7c8d9e0f1a2
+Create Date: 2026-10-17
+
+Inhalts-Hashes/ETags je API-Seite, damit der SC-Import unveränderte Seiten überspringt.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d9e0f1a2b3'
+down_revision: Union[str, Sequence[str], None] = 'b7c8d9e0f1a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('sc_import_page_hashes',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('page_key', sa.String(length=200), nullable=False),
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('etag', sa.String(length=200), nullable=True),
+        sa.Column('sc_version', sa.String(length=20), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_sc_import_page_hashes_id'), 'sc_import_page_hashes', ['id'], unique=False)
+    op.create_index(op.f('ix_sc_import_page_hashes_page_key'), 'sc_import_page_hashes', ['page_key'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_sc_import_page_hashes_page_key'), table_name='sc_import_page_hashes')
+    op.drop_index(op.f('ix_sc_import_page_hashes_id'), table_name='sc_import_page_hashes')
+    op.drop_table('sc_import_page_hashes')
@@ -0,0 +1,86 @@
+"""add_component_search_fts
+
+Revision ID: e0f1a2b3c4d5
+Revises: d9e0f1a2b3c4
+Create Date: 2026-10-17
+
+Komponentensuche über einen FTS5-Trigram-Index statt LIKE '%x%'.
+Dafür bekommt auch der Hersteller eine persistierte Normalform.
+"""
+from typing import Sequence, Union
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e0f1a2b3c4d5'
+down_revision: Union[str, Sequence[str], None] = 'd9e0f1a2b3c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Stand der DDL zum Zeitpunkt dieser Revision (siehe app.models.component)
+FTS_DDL = [
+    """CREATE VIRTUAL TABLE components_fts USING fts5(
+        search_name, search_manufacturer,
+        content='components', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER components_fts_ai AFTER INSERT ON components BEGIN
+        INSERT INTO components_fts(rowid, search_name, search_manufacturer)
+        VALUES (new.id, new.search_name, new.search_manufacturer);
+    END""",
+    """CREATE TRIGGER components_fts_ad AFTER DELETE ON components BEGIN
+        INSERT INTO components_fts(components_fts, rowid, search_name, search_manufacturer)
+        VALUES ('delete', old.id, old.search_name, old.search_manufacturer);
+    END""",
+    """CREATE TRIGGER components_fts_au AFTER UPDATE OF search_name, search_manufacturer ON components BEGIN
+        INSERT INTO components_fts(components_fts, rowid, search_name, search_manufacturer)
+        VALUES ('delete', old.id, old.search_name, old.search_manufacturer);
+        INSERT INTO components_fts(rowid, search_name, search_manufacturer)
+        VALUES (new.id, new.search_name, new.search_manufacturer);
+    END""",
+]
+
+
+def _normalize(text):
+    # Gleiche Normalisierung wie app.models.component.normalize_search
+    return re.sub(r'[-_\s.]', '', (text or "").lower())
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('components') as batch_op:
+        batch_op.add_column(sa.Column('search_manufacturer', sa.String(length=100), nullable=True))
+        # Der B-Tree-Index hilft bei Teilstring-Suche nicht
+        batch_op.drop_index('ix_components_search_name')
+
+    # Beide Suchspalten in Python befüllen (Unicode-fähiges lower())
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, name, manufacturer FROM components")).fetchall()
+    if rows:
+        bind.execute(
+            sa.text("UPDATE components SET search_name = :search_name, search_manufacturer = :search_manufacturer WHERE id = :id"),
+            [
+                {"id": row[0], "search_name": _normalize(row[1]), "search_manufacturer": _normalize(row[2])}
+                for row in rows
+            ]
+        )
+
+    if bind.dialect.name == "sqlite":
+        for statement in FTS_DDL:
+            op.execute(statement)
+        op.execute("INSERT INTO components_fts(components_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        for trigger in ("components_fts_ai", "components_fts_ad", "components_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS components_fts")
+
+    with op.batch_alter_table('components') as batch_op:
+        batch_op.create_index('ix_components_search_name', ['search_name'], unique=False)
+        batch_op.drop_column('search_manufacturer')
@@ -0,0 +1,41 @@
+"""add_component_search_name
+
+Revision ID: v1w2x3y4z5a6
+Revises: a2741982a77b
+Create Date: 2026-10-17
+
+Persistierte Normalform des Komponentennamens für die Fuzzy-Suche in SQL.
+"""
+from typing import Sequence, Union
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'v1w2x3y4z5a6'
+down_revision: Union[str, Sequence[str], None] = 'a2741982a77b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('components', sa.Column('search_name', sa.String(length=200), nullable=True))
+    op.create_index(op.f('ix_components_search_name'), 'components', ['search_name'], unique=False)
+
+    # Bestehende Komponenten befüllen (gleiche Normalisierung wie app.models.component.normalize_search)
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, name FROM components")).fetchall()
+    if rows:
+        bind.execute(
+            sa.text("UPDATE components SET search_name = :search_name WHERE id = :id"),
+            [{"id": row[0], "search_name": re.sub(r'[-_\s.]', '', (row[1] or "").lower())} for row in rows]
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_components_search_name'), table_name='components')
+    op.drop_column('components', 'search_name')
@@ -0,0 +1,43 @@
+"""add_ocr_result_cache
+
+Revision ID: w2x3y4z5a6b7
+Revises: v1w2x3y4z5a6
+Create Date: 2026-10-17
+
+Inhaltsadressierter Cache für OCR-Ergebnisse (SHA-256 des Screenshots).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'w2x3y4z5a6b7'
+down_revision: Union[str, Sequence[str], None] = 'v1w2x3y4z5a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ocr_result_cache',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('cache_key', sa.String(length=100), nullable=False),
+        sa.Column('names', sa.Text(), nullable=False),
+        sa.Column('hit_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.Column('last_used_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_ocr_result_cache_id'), 'ocr_result_cache', ['id'], unique=False)
+    op.create_index(op.f('ix_ocr_result_cache_cache_key'), 'ocr_result_cache', ['cache_key'], unique=True)
+    op.create_index(op.f('ix_ocr_result_cache_last_used_at'), 'ocr_result_cache', ['last_used_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_ocr_result_cache_last_used_at'), table_name='ocr_result_cache')
+    op.drop_index(op.f('ix_ocr_result_cache_cache_key'), table_name='ocr_result_cache')
+    op.drop_index(op.f('ix_ocr_result_cache_id'), table_name='ocr_result_cache')
+    op.drop_table('ocr_result_cache')
@@ -0,0 +1,94 @@
+"""move_screenshots_to_blob_store
+
+Revision ID: x3y4z5a6b7c8
+Revises: w2x3y4z5a6b7
+Create Date: 2026-10-17
+
+Screenshots der Anwesenheits-Sessions wandern aus der Datenbank in den
+inhaltsadressierten Blob Store (inkl. WebP-Thumbnail). Die DB hält nur noch
+die Schlüssel.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'x3y4z5a6b7c8'
+down_revision: Union[str, Sequence[str], None] = 'w2x3y4z5a6b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    from app.services.blob_store import get_blob_store
+    from app.services.screenshot_store import create_thumbnail, detect_content_type
+
+    with op.batch_alter_table('attendance_sessions') as batch_op:
+        batch_op.add_column(sa.Column('screenshot_key', sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column('screenshot_content_type', sa.String(length=50), nullable=True))
+        batch_op.add_column(sa.Column('screenshot_size', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('thumbnail_key', sa.String(length=64), nullable=True))
+        batch_op.create_index('ix_attendance_sessions_screenshot_key', ['screenshot_key'], unique=False)
+
+    # Vorhandene Screenshots in den Blob Store verschieben (einzeln, um den Speicher klein zu halten)
+    conn = op.get_bind()
+    store = get_blob_store()
+    session_ids = [row[0] for row in conn.execute(sa.text(
+        "SELECT id FROM attendance_sessions WHERE screenshot_data IS NOT NULL"
+    ))]
+    for session_id in session_ids:
+        data = conn.execute(
+            sa.text("SELECT screenshot_data FROM attendance_sessions WHERE id = :id"),
+            {"id": session_id}
+        ).scalar()
+        if not data:
+            continue
+        data = bytes(data)
+        thumbnail = create_thumbnail(data)
+        conn.execute(
+            sa.text(
+                "UPDATE attendance_sessions SET screenshot_key = :key, screenshot_content_type = :ctype, "
+                "screenshot_size = :size, thumbnail_key = :thumb WHERE id = :id"
+            ),
+            {
+                "key": store.put(data),
+                "ctype": detect_content_type(data),
+                "size": len(data),
+                "thumb": store.put(thumbnail) if thumbnail else None,
+                "id": session_id,
+            }
+        )
+
+    with op.batch_alter_table('attendance_sessions') as batch_op:
+        batch_op.drop_column('screenshot_data')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    from app.services.blob_store import get_blob_store
+
+    with op.batch_alter_table('attendance_sessions') as batch_op:
+        batch_op.add_column(sa.Column('screenshot_data', sa.LargeBinary(), nullable=True))
+
+    # Screenshots aus dem Blob Store zurück in die DB (Blobs bleiben liegen)
+    conn = op.get_bind()
+    store = get_blob_store()
+    rows = conn.execute(sa.text(
+        "SELECT id, screenshot_key FROM attendance_sessions WHERE screenshot_key IS NOT NULL"
+    )).fetchall()
+    for session_id, key in rows:
+        if store.exists(key):
+            conn.execute(
+                sa.text("UPDATE attendance_sessions SET screenshot_data = :data WHERE id = :id"),
+                {"data": store.read(key), "id": session_id}
+            )
+
+    with op.batch_alter_table('attendance_sessions') as batch_op:
+        batch_op.drop_index('ix_attendance_sessions_screenshot_key')
+        batch_op.drop_column('thumbnail_key')
+        batch_op.drop_column('screenshot_size')
+        batch_op.drop_column('screenshot_content_type')
+        batch_op.drop_column('screenshot_key')
@@ -0,0 +1,52 @@
+"""add_item_prices_staging
+
+Revision ID: y4z5a6b7c8d9
+Revises: x3y4z5a6b7c8
+Create Date: 2026-10-17
+
+Staging-Tabelle für den UEX-Sync (atomarer Austausch von item_prices)
+sowie Laufzeit und Zeilenrate im Sync-Log.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'y4z5a6b7c8d9'
+down_revision: Union[str, Sequence[str], None] = 'x3y4z5a6b7c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('item_prices_staging',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('component_id', sa.Integer(), nullable=True),
+        sa.Column('uex_id', sa.Integer(), nullable=True),
+        sa.Column('item_uuid', sa.String(length=50), nullable=True),
+        sa.Column('item_name', sa.String(length=200), nullable=False),
+        sa.Column('terminal_id', sa.Integer(), nullable=True),
+        sa.Column('terminal_name', sa.String(length=200), nullable=False),
+        sa.Column('price_buy', sa.Float(), nullable=True),
+        sa.Column('price_sell', sa.Float(), nullable=True),
+        sa.Column('category_id', sa.Integer(), nullable=True),
+        sa.Column('date_added', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('date_modified', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    with op.batch_alter_table('uex_sync_logs') as batch_op:
+        batch_op.add_column(sa.Column('duration_ms', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('rows_per_second', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('uex_sync_logs') as batch_op:
+        batch_op.drop_column('rows_per_second')
+        batch_op.drop_column('duration_ms')
+
+    op.drop_table('item_prices_staging')
@@ -0,0 +1,43 @@
+"""add_uex_diff_sync
+
+Revision ID: z5a6b7c8d9e0
+Revises: y4z5a6b7c8d9
+Create Date: 2026-10-17
+
+Inkrementeller UEX-Sync: Index auf (uex_id, terminal_id) und Diff-Zähler im Sync-Log.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'z5a6b7c8d9e0'
+down_revision: Union[str, Sequence[str], None] = 'y4z5a6b7c8d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_item_prices_uex_terminal', 'item_prices', ['uex_id', 'terminal_id'], unique=False)
+
+    with op.batch_alter_table('uex_sync_logs') as batch_op:
+        batch_op.add_column(sa.Column('mode', sa.String(length=10), nullable=True))
+        batch_op.add_column(sa.Column('rows_inserted', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('rows_updated', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('rows_deleted', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('rows_unchanged', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('uex_sync_logs') as batch_op:
+        batch_op.drop_column('rows_unchanged')
+        batch_op.drop_column('rows_deleted')
+        batch_op.drop_column('rows_updated')
+        batch_op.drop_column('rows_inserted')
+        batch_op.drop_column('mode')
+
+    op.drop_index('ix_item_prices_uex_terminal', table_name='item_prices')
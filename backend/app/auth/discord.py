@@ -1,8 +1,8 @@
-import httpx
 from typing import Optional
 from dataclasses import dataclass
 
 from app.config import get_settings
+from app.services.http_clients import http_clients
 
 settings = get_settings()
 
@@ -41,7 +41,7 @@ def get_oauth_url(state: str) -> str:
 
 async def exchange_code(code: str) -> Optional[str]:
     """Tauscht den OAuth-Code gegen einen Access Token."""
-    async with httpx.AsyncClient() as client:
+    async with http_clients.async_session("discord") as client:
         response = await client.post(
             DISCORD_TOKEN_URL,
             data={
@@ -54,43 +54,43 @@ async def exchange_code(code: str) -> Optional[str]:
             headers={"Content-Type": "application/x-www-form-urlencoded"},
         )
 
-        if response.status_code != 200:
-            return None
+    if response.status_code != 200:
+        return None
 
-        data = response.json()
-        return data.get("access_token")
+    data = response.json()
+    return data.get("access_token")
 
 
 async def get_discord_user(access_token: str) -> Optional[DiscordUser]:
     """Holt die Benutzer-Daten von Discord."""
-    async with httpx.AsyncClient() as client:
+    async with http_clients.async_session("discord") as client:
         response = await client.get(
             f"{DISCORD_API_BASE}/users/@me",
             headers={"Authorization": f"Bearer {access_token}"},
         )
 
-        if response.status_code != 200:
-            return None
+    if response.status_code != 200:
+        return None
 
-        data = response.json()
-        return DiscordUser(
-            id=data["id"],
-            username=data["username"],
-            global_name=data.get("global_name"),
-            avatar=data.get("avatar"),
-        )
+    data = response.json()
+    return DiscordUser(
+        id=data["id"],
+        username=data["username"],
+        global_name=data.get("global_name"),
+        avatar=data.get("avatar"),
+    )
 
 
 async def get_user_guilds(access_token: str) -> list[dict]:
     """Ruft die Server-Liste des Users ab."""
-    async with httpx.AsyncClient() as client:
+    async with http_clients.async_session("discord") as client:
         response = await client.get(
             f"{DISCORD_API_BASE}/users/@me/guilds",
             headers={"Authorization": f"Bearer {access_token}"},
         )
-        if response.status_code != 200:
-            return []
-        return response.json()
+    if response.status_code != 200:
+        return []
+    return response.json()
 
 
 def is_member_of_guild(guilds: list[dict], guild_id: str) -> bool:
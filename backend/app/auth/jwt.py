@@ -3,15 +3,20 @@ from typing import Optional
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
 
 from app.config import get_settings
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.models.user import User
+from app.auth.user_cache import user_cache
 
 settings = get_settings()
 security = HTTPBearer()
 
+STREAM_TICKET_SCOPE = "stream"
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Erstellt einen JWT-Token."""
@@ -34,38 +39,134 @@ def verify_token(token: str) -> Optional[dict]:
         return None
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """Dependency: Gibt den aktuell eingeloggten Benutzer zurück."""
-    credentials_exception = HTTPException(
+def get_user_id_from_token(token: str) -> Optional[int]:
+    """Verifiziert einen JWT-Token und gibt die User-ID (sub) zurück (mit Cache)."""
+    cached = user_cache.get_token(token)
+    if cached is not None:
+        return cached
+
+    payload = verify_token(token)
+    # Tickets (mit scope) taugen nicht als Access-Token
+    if payload is None or payload.get("scope") is not None:
+        return None
+    try:
+        user_id = int(payload.get("sub"))
+    except (TypeError, ValueError):
+        return None
+
+    user_cache.put_token(token, user_id, expires_at=payload.get("exp"))
+    return user_id
+
+
+def create_stream_ticket(user_id: int, token_exp: int) -> str:
+    """Erstellt ein kurzlebiges Ticket zum Öffnen eines SSE-Streams.
+
+    EventSource kann keine Header setzen, das Ticket landet also in der URL
+    (und damit ggf. in Logs). Es gilt nur stream_ticket_ttl_seconds lang und
+    nur für Streams. token_exp merkt sich, wie lange der Access-Token gültig
+    ist, so lange darf der Stream offen bleiben.
+    """
+    return create_access_token(
+        data={"sub": str(user_id), "scope": STREAM_TICKET_SCOPE, "token_exp": token_exp},
+        expires_delta=timedelta(seconds=settings.stream_ticket_ttl_seconds),
+    )
+
+
+def verify_stream_ticket(ticket: str) -> Optional[tuple[int, int]]:
+    """Prüft ein Stream-Ticket und gibt (user_id, token_exp) zurück."""
+    payload = verify_token(ticket)
+    if payload is None or payload.get("scope") != STREAM_TICKET_SCOPE:
+        return None
+    try:
+        return int(payload.get("sub")), int(payload.get("token_exp"))
+    except (TypeError, ValueError):
+        return None
+
+
+def load_user(db: Session, user_id: int) -> Optional[User]:
+    """Lädt einen User, bevorzugt aus dem Snapshot-Cache (ohne DB-Roundtrip).
+
+    Der Snapshot wird als persistentes Objekt an die Request-Session gehängt,
+    Änderungen am User werden also wie gewohnt per commit gespeichert.
+    """
+    existing = db.identity_map.get(identity_key(User, user_id))
+    if existing is not None:
+        return existing
+
+    snapshot = user_cache.get_user(user_id)
+    if snapshot is not None:
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        db.add(user)
+        return user
+
+    user = db.query(User).filter(User.id == user_id).first()
+    if user is not None:
+        user_cache.put_user(user)
+    return user
+
+
+async def load_user_async(db: AsyncSession, user_id: int) -> Optional[User]:
+    """Wie load_user, aber für async Endpunkte auf der AsyncSession."""
+    snapshot = user_cache.get_user(user_id)
+    if snapshot is not None:
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        db.add(user)
+        return user
+
+    user = await db.get(User, user_id)
+    if user is not None:
+        user_cache.put_user(user)
+    return user
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Ungültiger oder abgelaufener Token",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    payload = verify_token(credentials.credentials)
-    if payload is None:
-        raise credentials_exception
 
-    user_id_str = payload.get("sub")
-    if user_id_str is None:
-        raise credentials_exception
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> User:
+    """Dependency: Gibt den aktuell eingeloggten Benutzer zurück.
 
-    try:
-        user_id = int(user_id_str)
-    except ValueError:
-        raise credentials_exception
+    Bewusst sync, damit ein Cache-Miss (DB-Query) im Threadpool läuft
+    und nicht den Event-Loop blockiert.
+    """
+    user_id = get_user_id_from_token(credentials.credentials)
+    if user_id is None:
+        raise _credentials_exception()
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = load_user(db, user_id)
+    if user is None:
+        raise _credentials_exception()
+
+    return user
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """Dependency für async Endpunkte: nutzt dieselbe AsyncSession wie der
+    Endpunkt, es wird also keine zweite (sync) Verbindung geöffnet."""
+    user_id = get_user_id_from_token(credentials.credentials)
+    if user_id is None:
+        raise _credentials_exception()
+
+    user = await load_user_async(db, user_id)
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     return user
 
 
-async def get_current_user_optional(
+def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
     db: Session = Depends(get_db)
 ) -> Optional[User]:
@@ -73,17 +174,8 @@ async def get_current_user_optional(
     if credentials is None:
         return None
 
-    payload = verify_token(credentials.credentials)
-    if payload is None:
-        return None
-
-    user_id_str = payload.get("sub")
-    if user_id_str is None:
-        return None
-
-    try:
-        user_id = int(user_id_str)
-    except ValueError:
+    user_id = get_user_id_from_token(credentials.credentials)
+    if user_id is None:
         return None
 
-    return db.query(User).filter(User.id == user_id).first()
+    return load_user(db, user_id)
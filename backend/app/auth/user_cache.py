@@ -0,0 +1,138 @@
+"""
+Kurzlebiger Cache für die Auth-Dependency.
+Speichert verifizierte Tokens (-> User-ID) und Spalten-Snapshots der User,
+damit get_current_user nicht bei jedem API-Call JWT dekodiert und die DB fragt.
+
+Invalidierung: Jede ORM-Änderung an einem User (update_user, merge_users,
+delete_user, Rollenwechsel, last_seen_transfers, ...) entfernt dessen Snapshot
+nach dem Commit. Bulk-Updates außerhalb des ORM und andere Prozesse werden
+über die TTL abgedeckt.
+"""
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.user import User
+
+settings = get_settings()
+
+
+class UserCache:
+    """Größenbegrenzter TTL-Cache (LRU) für Tokens und User-Snapshots."""
+
+    def __init__(self, ttl_seconds: float, max_size: int, enabled: bool = True):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.enabled = enabled
+        self._tokens: OrderedDict = OrderedDict()  # token -> (user_id, gültig_bis)
+        self._users: OrderedDict = OrderedDict()   # user_id -> (snapshot, gültig_bis)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, store: OrderedDict, key):
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = store.get(key)
+            if entry is None or entry[1] < time.time():
+                store.pop(key, None)
+                self.misses += 1
+                return None
+            store.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def _put(self, store: OrderedDict, key, value, expires_at: Optional[float] = None):
+        if not self.enabled:
+            return
+        valid_until = time.time() + self.ttl_seconds
+        if expires_at is not None:
+            valid_until = min(valid_until, expires_at)
+        with self._lock:
+            store[key] = (value, valid_until)
+            store.move_to_end(key)
+            while len(store) > self.max_size:
+                store.popitem(last=False)
+
+    def get_token(self, token: str) -> Optional[int]:
+        """Gibt die User-ID eines bereits verifizierten Tokens zurück."""
+        return self._get(self._tokens, token)
+
+    def put_token(self, token: str, user_id: int, expires_at: Optional[float] = None):
+        """Merkt sich ein verifiziertes Token (nie länger als dessen exp)."""
+        self._put(self._tokens, token, user_id, expires_at)
+
+    def get_user(self, user_id: int) -> Optional[dict]:
+        """Gibt den Spalten-Snapshot eines Users zurück."""
+        return self._get(self._users, user_id)
+
+    def put_user(self, user: User):
+        """Speichert einen Spalten-Snapshot des Users."""
+        snapshot = {c.key: getattr(user, c.key) for c in User.__table__.columns}
+        self._put(self._users, user.id, snapshot)
+
+    def invalidate(self, user_id: int):
+        """Entfernt den Snapshot eines Users (nach Änderungen)."""
+        with self._lock:
+            self._users.pop(user_id, None)
+
+    def clear(self):
+        """Leert den Cache komplett (z.B. in Tests)."""
+        with self._lock:
+            self._tokens.clear()
+            self._users.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Metriken für Monitoring."""
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "tokens_cached": len(self._tokens),
+            "users_cached": len(self._users),
+            "ttl_seconds": self.ttl_seconds,
+            "max_size": self.max_size,
+        }
+
+
+user_cache = UserCache(
+    ttl_seconds=settings.auth_cache_ttl_seconds,
+    max_size=settings.auth_cache_max_size,
+    enabled=settings.auth_cache_enabled,
+)
+
+
+# ============== Invalidierung über Session-Events ==============
+
+_INFO_KEY = "user_cache_invalidate"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session, flush_context):
+    """Merkt sich geänderte/gelöschte User bis zum Commit."""
+    changed = [obj.id for obj in chain(session.dirty, session.deleted) if isinstance(obj, User)]
+    if changed:
+        session.info.setdefault(_INFO_KEY, set()).update(changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session):
+    """Invalidiert erst nach dem Commit, damit kein alter Stand neu gecacht wird."""
+    for user_id in session.info.pop(_INFO_KEY, ()):
+        user_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session):
+    session.info.pop(_INFO_KEY, None)
@@ -6,6 +6,15 @@ class Settings(BaseSettings):
     # Datenbank
     database_url: str = "sqlite:///./data/poison.db"
 
+    # SQLite-Performance-Profil (wird bei jeder neuen Verbindung per PRAGMA gesetzt)
+    sqlite_tuning_enabled: bool = True
+    sqlite_journal_mode: str = "WAL"  # WAL: Leser blockieren nicht mehr beim Schreiben
+    sqlite_synchronous: str = "NORMAL"  # Mit WAL sicher und deutlich schneller als FULL
+    sqlite_busy_timeout_ms: int = 5000  # Warten statt "database is locked"
+    sqlite_mmap_size: int = 256 * 1024 * 1024  # 256 MB Memory-Mapped I/O
+    sqlite_cache_size: int = -64000  # Negativ = KiB, also ca. 64 MB Page-Cache
+    sqlite_temp_store: str = "MEMORY"  # Temporäre Tabellen/Indizes im RAM
+
     # Discord OAuth2
     discord_client_id: str = ""
     discord_client_secret: str = ""
@@ -15,6 +24,54 @@ class Settings(BaseSettings):
     secret_key: str = "changeme"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 60 * 24 * 7  # 7 Tage
+    stream_ticket_ttl_seconds: int = 30  # Kurzlebiges Ticket für SSE-Verbindungen (statt JWT in der URL)
+
+    # Auth-Cache für get_current_user (Tokens + User-Snapshots, in Tests abschaltbar)
+    auth_cache_enabled: bool = True
+    auth_cache_ttl_seconds: int = 30
+    auth_cache_max_size: int = 1024
+
+    # Snapshot-Cache für Mission-Detail/Briefing/Zuweisungs-Daten (versioniert über Mission.revision)
+    mission_cache_enabled: bool = True
+    mission_cache_ttl_seconds: int = 300  # Änderungen laufen über die Revision, TTL begrenzt nur die Lebensdauer
+    mission_cache_max_size: int = 256
+
+    # OCR (Tesseract läuft in einem Process-Pool)
+    ocr_max_workers: int = 2
+    ocr_max_pending_jobs: int = 10
+    ocr_max_finished_jobs: int = 200  # Abgeschlossene Jobs im Speicher (älteste fallen raus)
+    ocr_cache_max_entries: int = 500  # Gecachte Ergebnisse (LRU)
+
+    # SC-Wiki-Import (parallele Seitenabrufe mit Retry/Backoff)
+    sc_import_concurrency: int = 4
+    sc_import_max_retries: int = 4
+
+    # Gemeinsame HTTP-Clients für externe APIs (Pool pro Host)
+    http_max_connections_per_host: int = 10
+    http_keepalive_seconds: float = 60.0
+    http_connect_retries: int = 2  # Wiederholungen bei Verbindungsfehlern
+    http2_enabled: bool = True  # nur wirksam, wenn "h2" installiert ist
+
+    # UEX-Sync: neuer Datenbestand muss mindestens diesen Anteil des alten haben
+    # (Schutz vor unvollständigen API-Antworten, per force=true übergehbar)
+    uex_min_staged_ratio: float = 0.5
+
+    # Erkul-Import (parallele Abrufe + Datei-Cache der dekodierten Loadouts)
+    erkul_fetch_concurrency: int = 8
+    erkul_cache_path: str = "./data/cache/erkul"
+    erkul_cache_ttl_seconds: int = 6 * 60 * 60
+    erkul_cache_max_entries: int = 2000
+
+    # FleetYards-Cache (Schiffsdaten, Hardpoints, Suche)
+    fleetyards_cache_path: str = "./data/cache/fleetyards"
+    fleetyards_cache_ttl_seconds: int = 24 * 60 * 60
+    # Abgelaufene Einträge dienen noch als Offline-Fallback, erst danach löschen
+    fleetyards_cache_max_age_seconds: int = 30 * 24 * 60 * 60
+    fleetyards_cache_max_entries: int = 5000
+
+    # Blob Store für Screenshots (inhaltsadressiert)
+    blob_store_backend: str = "filesystem"
+    blob_store_path: str = "./data/blobs"
 
     # Server
     host: str = "0.0.0.0"
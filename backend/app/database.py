@@ -1,4 +1,5 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 from app.config import get_settings
 
@@ -16,6 +17,67 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def to_async_url(url: str) -> str:
+    """Wandelt eine synchrone Datenbank-URL in die passende Async-Treiber-URL um."""
+    if url.startswith("sqlite:"):
+        return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    if url.startswith("postgresql:"):
+        return url.replace("postgresql:", "postgresql+asyncpg:", 1)
+    return url
+
+
+# Async-Engine für Endpunkte, die den Event-Loop nicht blockieren dürfen
+async_engine = create_async_engine(
+    to_async_url(settings.database_url),
+    echo=settings.debug
+)
+
+# expire_on_commit=False: Objekte bleiben nach commit lesbar (kein Lazy-Load im Async-Kontext)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+
+# PRAGMAs des SQLite-Performance-Profils (Name -> Settings-Wert)
+SQLITE_PRAGMAS = {
+    "journal_mode": settings.sqlite_journal_mode,
+    "synchronous": settings.sqlite_synchronous,
+    "busy_timeout": settings.sqlite_busy_timeout_ms,
+    "mmap_size": settings.sqlite_mmap_size,
+    "cache_size": settings.sqlite_cache_size,
+    "temp_store": settings.sqlite_temp_store,
+}
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Connect-Listener: Setzt das SQLite-Performance-Profil auf jeder neuen Verbindung."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+if "sqlite" in settings.database_url and settings.sqlite_tuning_enabled:
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+    event.listen(async_engine.sync_engine, "connect", apply_sqlite_pragmas)
+
+
+def get_sqlite_pragmas() -> dict:
+    """Liest die aktiven PRAGMA-Werte einer Verbindung aus (Selbsttest beim Start)."""
+    if "sqlite" not in settings.database_url:
+        return {}
+    with engine.connect() as conn:
+        return {
+            name: conn.execute(text(f"PRAGMA {name}")).scalar()
+            for name in SQLITE_PRAGMAS
+        }
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -27,3 +89,13 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Dependency für FastAPI - gibt eine Async-Datenbank-Session zurück.
+
+    Relationships werden im Async-Kontext nicht lazy geladen, daher
+    müssen Queries benötigte Beziehungen per selectinload vorladen.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
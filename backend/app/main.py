@@ -1,20 +1,39 @@
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from app.config import get_settings
-from app.database import engine, Base
+from app.database import engine, Base, get_sqlite_pragmas
+from app.ocr.jobs import ocr_jobs
+from app.services.http_clients import http_clients
 from app.routers import auth, users, components, inventory, treasury, attendance, loot, locations, sc_import, data_import, officer_accounts, admin, staffel, mission, ships, loadouts
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: Datenbank-Tabellen erstellen
     Base.metadata.create_all(bind=engine)
+
+    # Selbsttest: aktive SQLite-PRAGMAs protokollieren
+    pragmas = get_sqlite_pragmas()
+    if pragmas:
+        logger.info("SQLite-Profil: %s", ", ".join(f"{k}={v}" for k, v in pragmas.items()))
+        if settings.sqlite_tuning_enabled and str(pragmas.get("journal_mode", "")).lower() != settings.sqlite_journal_mode.lower():
+            logger.warning(
+                "journal_mode ist %s, erwartet %s", pragmas.get("journal_mode"), settings.sqlite_journal_mode
+            )
+
+    # Gemeinsame HTTP-Clients für externe APIs
+    http_clients.start()
     yield
-    # Shutdown: Hier könnten Cleanup-Aktionen stehen
+    # Shutdown: OCR-Worker beenden, HTTP-Verbindungen schließen
+    ocr_jobs.shutdown()
+    await http_clients.aclose()
 
 
 app = FastAPI(
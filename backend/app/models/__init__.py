@@ -1,13 +1,16 @@
 from app.models.user import User, UserRole, PendingMerge, GuestToken, UserRequest
 from app.models.attendance import AttendanceSession, AttendanceRecord
-from app.models.component import Component, SCLocation
+from app.models.component import Component, SCLocation, SCImportCheckpoint, SCImportPageHash
 from app.models.location import Location
 from app.models.loot import LootSession, LootItem, LootDistribution
 from app.models.inventory import Inventory, InventoryTransfer, TransferRequest, TransferRequestStatus
 from app.models.inventory_log import InventoryLog, InventoryAction
 from app.models.treasury import Treasury, TreasuryTransaction
 from app.models.officer_account import OfficerAccount, OfficerTransaction
-from app.models.item_price import ItemPrice, UEXSyncLog
+from app.models.item_price import (
+    ItemPrice, ItemPriceStaging, ItemPriceHistory, ComponentPriceRollup, UEXSyncLog
+)
+from app.models.ocr_cache import OCRResultCache
 from app.models.staffel import (
     CommandGroup, OperationalRole, FunctionRole,
     UserCommandGroup, UserOperationalRole, UserFunctionRole,
@@ -30,6 +33,8 @@ __all__ = [
     "AttendanceRecord",
     "Component",
     "SCLocation",
+    "SCImportCheckpoint",
+    "SCImportPageHash",
     "Location",
     "LootSession",
     "LootItem",
@@ -45,7 +50,11 @@ __all__ = [
     "OfficerAccount",
     "OfficerTransaction",
     "ItemPrice",
+    "ItemPriceStaging",
+    "ItemPriceHistory",
+    "ComponentPriceRollup",
     "UEXSyncLog",
+    "OCRResultCache",
     # Staffelstruktur
     "CommandGroup",
     "OperationalRole",
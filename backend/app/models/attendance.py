@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, LargeBinary, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -15,7 +15,11 @@ class AttendanceSession(Base):
     created_by_id = Column(Integer, ForeignKey("users.id"), nullable=False)
 
     # OCR-Daten für nachträgliche Bearbeitung
-    screenshot_data = Column(LargeBinary, nullable=True)  # Temporär gespeicherter Screenshot
+    # Screenshot liegt im Blob Store (app/services/blob_store.py), hier nur die Schlüssel
+    screenshot_key = Column(String(64), nullable=True, index=True)
+    screenshot_content_type = Column(String(50), nullable=True)
+    screenshot_size = Column(Integer, nullable=True)
+    thumbnail_key = Column(String(64), nullable=True)  # WebP-Thumbnail für Listen
     ocr_data = Column(Text, nullable=True)  # JSON mit matched/unmatched Namen
     is_confirmed = Column(Boolean, default=False)  # Ob Session bestätigt wurde
 
@@ -1,14 +1,25 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Float, Text
+import re
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Float, Text, DDL, event, or_, select, table, column, text
 from sqlalchemy.sql import func
 from app.database import Base
 
 
+def normalize_search(text: str) -> str:
+    """Normalisiert Suchtext für fuzzy matching (entfernt Trennzeichen)."""
+    return re.sub(r'[-_\s.]', '', (text or "").lower())
+
+
+# FTS5-Trigram-Index greift erst ab 3 Zeichen
+FTS_MIN_LENGTH = 3
+
+
 class Component(Base):
     """Komponenten-Katalog (Schilde, Waffen, Kühler, etc.)."""
     __tablename__ = "components"
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(200), nullable=False, index=True)
+    search_name = Column(String(200), nullable=True)  # normalize_search(name), für die Suche (FTS-Index)
     category = Column(String(50), nullable=True, index=True)  # z.B. "Schilde", "Waffen", "Kühler"
     sub_category = Column(String(50), nullable=True)  # Unterkategorie
     is_predefined = Column(Boolean, default=False)  # Vordefiniert = nicht löschbar
@@ -16,6 +27,7 @@ class Component(Base):
     # Star Citizen spezifische Felder
     sc_uuid = Column(String(50), unique=True, nullable=True, index=True)  # UUID von SC Wiki API
     manufacturer = Column(String(100), nullable=True)  # Hersteller
+    search_manufacturer = Column(String(100), nullable=True)  # normalize_search(manufacturer), für die Suche (FTS-Index)
     size = Column(Integer, nullable=True)  # Größe (1-4 etc.)
     grade = Column(String(10), nullable=True)  # A, B, C, D
     item_class = Column(String(50), nullable=True)  # Military, Industrial, Civilian, Stealth, Competition
@@ -50,6 +62,63 @@ class Component(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
 
+@event.listens_for(Component, "before_insert")
+@event.listens_for(Component, "before_update")
+def _set_search_name(mapper, connection, target):
+    """Hält die Suchspalten bei jedem Insert/Update synchron zu Name und Hersteller."""
+    target.search_name = normalize_search(target.name)
+    target.search_manufacturer = normalize_search(target.manufacturer)
+
+
+# Trigram-Volltextindex über die Suchspalten (nur SQLite). Die Spalten sind
+# bereits in Python normalisiert, SQL muss also nichts mehr kleinschreiben.
+# Trigger halten den Index bei Inserts/Updates/Deletes (auch Bulk-Writes) aktuell.
+COMPONENTS_FTS_DDL = [
+    """CREATE VIRTUAL TABLE components_fts USING fts5(
+        search_name, search_manufacturer,
+        content='components', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER components_fts_ai AFTER INSERT ON components BEGIN
+        INSERT INTO components_fts(rowid, search_name, search_manufacturer)
+        VALUES (new.id, new.search_name, new.search_manufacturer);
+    END""",
+    """CREATE TRIGGER components_fts_ad AFTER DELETE ON components BEGIN
+        INSERT INTO components_fts(components_fts, rowid, search_name, search_manufacturer)
+        VALUES ('delete', old.id, old.search_name, old.search_manufacturer);
+    END""",
+    """CREATE TRIGGER components_fts_au AFTER UPDATE OF search_name, search_manufacturer ON components BEGIN
+        INSERT INTO components_fts(components_fts, rowid, search_name, search_manufacturer)
+        VALUES ('delete', old.id, old.search_name, old.search_manufacturer);
+        INSERT INTO components_fts(rowid, search_name, search_manufacturer)
+        VALUES (new.id, new.search_name, new.search_manufacturer);
+    END""",
+]
+
+for _statement in COMPONENTS_FTS_DDL:
+    event.listen(Component.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+
+
+def component_search_filter(normalized_search: str, dialect_name: str):
+    """Filter: search_name oder search_manufacturer enthält den (normalisierten) Suchtext.
+
+    dialect_name kommt von der Session der Abfrage (db.get_bind().dialect.name).
+
+    Auf SQLite läuft die Teilstring-Suche ab FTS_MIN_LENGTH Zeichen über den
+    Trigram-Index. Kürzere Suchbegriffe (und andere Datenbanken) fallen auf
+    LIKE '%x%' zurück, das ist ein Scan über die schmalen Suchspalten.
+    """
+    if dialect_name == "sqlite" and len(normalized_search) >= FTS_MIN_LENGTH:
+        fts_query = '"' + normalized_search.replace('"', '""') + '"'
+        matches = select(column("rowid")).select_from(table("components_fts")).where(
+            text("components_fts MATCH :fts_query").bindparams(fts_query=fts_query)
+        )
+        return Component.id.in_(matches)
+    return or_(
+        Component.search_name.contains(normalized_search, autoescape=True),
+        Component.search_manufacturer.contains(normalized_search, autoescape=True),
+    )
+
+
 class SCLocation(Base):
     """Star Citizen Orte mit Shops (Stationen, Outposts, etc.)."""
     __tablename__ = "sc_locations"
@@ -64,3 +133,31 @@ class SCLocation(Base):
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+
+class SCImportCheckpoint(Base):
+    """Fortschritt eines SC-Imports - ein abgebrochener Lauf wird hier fortgesetzt."""
+    __tablename__ = "sc_import_checkpoints"
+
+    id = Column(Integer, primary_key=True, index=True)
+    sc_version = Column(String(20), nullable=True)
+    last_completed_page = Column(Integer, default=0, nullable=False)  # Alle Seiten bis hier importiert
+    total_pages = Column(Integer, nullable=True)
+    status = Column(String(20), default="running", nullable=False)  # running, completed, failed
+
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class SCImportPageHash(Base):
+    """Inhalts-Hash (und ETag) je importierter API-Seite - unveränderte Seiten werden übersprungen."""
+    __tablename__ = "sc_import_page_hashes"
+
+    id = Column(Integer, primary_key=True, index=True)
+    page_key = Column(String(200), unique=True, nullable=False, index=True)  # z.B. "items:12", "starsystem:Stanton"
+    content_hash = Column(String(64), nullable=False)  # SHA-256 über SC-Version + Seiteninhalt
+    etag = Column(String(200), nullable=True)
+    sc_version = Column(String(20), nullable=True)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
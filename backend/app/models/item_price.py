@@ -1,7 +1,7 @@
 """
 Item Price Model - speichert Preise und Shop-Standorte von UEX API.
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -41,9 +41,69 @@ class ItemPrice(Base):
     # Composite index für schnelle Suche nach component + shop
     __table_args__ = (
         Index('ix_item_prices_component_terminal', 'component_id', 'terminal_name'),
+        Index('ix_item_prices_uex_terminal', 'uex_id', 'terminal_id'),
     )
 
 
+class ItemPriceStaging(Base):
+    """Staging-Tabelle für den UEX-Sync.
+
+    Der Sync lädt zuerst hierhin und tauscht dann in einer Transaktion den
+    Inhalt von item_prices aus - Leser sehen nie eine leere Tabelle.
+    """
+    __tablename__ = "item_prices_staging"
+
+    id = Column(Integer, primary_key=True)
+    component_id = Column(Integer, nullable=True)
+    uex_id = Column(Integer, nullable=True)
+    item_uuid = Column(String(50), nullable=True)
+    item_name = Column(String(200), nullable=False)
+    terminal_id = Column(Integer, nullable=True)
+    terminal_name = Column(String(200), nullable=False)
+    price_buy = Column(Float, nullable=True)
+    price_sell = Column(Float, nullable=True)
+    category_id = Column(Integer, nullable=True)
+    date_added = Column(DateTime(timezone=True), nullable=True)
+    date_modified = Column(DateTime(timezone=True), nullable=True)
+
+
+class ItemPriceHistory(Base):
+    """Preisverlauf: ein Eintrag pro Komponente, Terminal und Tag (Upsert pro Tages-Bucket).
+
+    Kompakt gehalten - Preise als ganze aUEC, keine Namen. Mehrere Syncs am
+    selben Tag aktualisieren den Eintrag dieses Tages, frühere Tage bleiben
+    unverändert.
+    """
+    __tablename__ = "item_price_history"
+
+    id = Column(Integer, primary_key=True)
+    component_id = Column(Integer, ForeignKey("components.id"), nullable=False)
+    terminal_id = Column(Integer, nullable=False)
+    day = Column(Date, nullable=False)
+    price_buy = Column(Integer, nullable=True)  # aUEC, None = nicht kaufbar
+    price_sell = Column(Integer, nullable=True)  # aUEC, None = nicht verkaufbar
+
+    __table_args__ = (
+        Index('ix_item_price_history_component_terminal_day', 'component_id', 'terminal_id', 'day', unique=True),
+        Index('ix_item_price_history_day', 'day'),
+    )
+
+
+class ComponentPriceRollup(Base):
+    """Vorberechnete Preis-Kennzahlen pro Komponente (nach jedem UEX-Sync aktualisiert)."""
+    __tablename__ = "component_price_rollups"
+
+    component_id = Column(Integer, ForeignKey("components.id"), primary_key=True)
+    min_buy = Column(Integer, nullable=True)
+    min_buy_terminal = Column(String(200), nullable=True)
+    max_sell = Column(Integer, nullable=True)
+    max_sell_terminal = Column(String(200), nullable=True)
+    median_buy = Column(Integer, nullable=True)
+    median_sell = Column(Integer, nullable=True)
+    terminal_count = Column(Integer, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
 class UEXSyncLog(Base):
     """Log für UEX Synchronisierungen."""
     __tablename__ = "uex_sync_logs"
@@ -55,4 +115,15 @@ class UEXSyncLog(Base):
     items_matched = Column(Integer, default=0)
     items_unmatched = Column(Integer, default=0)
     errors = Column(String(2000), nullable=True)
-    status = Column(String(20), default="running")  # running, completed, failed
+    status = Column(String(20), default="running")  # running, completed, failed, refused
+    mode = Column(String(10), nullable=True)  # diff, full
+
+    # Ergebnis des Diffs (nur mode=diff)
+    rows_inserted = Column(Integer, nullable=True)
+    rows_updated = Column(Integer, nullable=True)
+    rows_deleted = Column(Integer, nullable=True)
+    rows_unchanged = Column(Integer, nullable=True)
+
+    # Laufzeit des Syncs (Fetch + Staging + Swap)
+    duration_ms = Column(Integer, nullable=True)
+    rows_per_second = Column(Float, nullable=True)
@@ -61,6 +61,10 @@ class Mission(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Wird bei jeder Änderung an Mission/Phasen/Einheiten/Positionen/Zuweisungen/
+    # Anmeldungen erhöht (siehe services/mission_cache.py)
+    revision = Column(Integer, default=0, server_default="0", nullable=False)
+
     # Relationships
     start_location = relationship("Location", foreign_keys=[start_location_id])
     created_by = relationship("User", foreign_keys=[created_by_id])
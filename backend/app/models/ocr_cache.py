@@ -0,0 +1,19 @@
+"""
+OCR Result Cache - erkannte Namen pro Screenshot (inhaltsadressiert).
+"""
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class OCRResultCache(Base):
+    """Zwischengespeicherte OCR-Ergebnisse, Schlüssel = SHA-256 des Bildes + Pipeline-Version."""
+    __tablename__ = "ocr_result_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    cache_key = Column(String(100), unique=True, nullable=False, index=True)  # "<sha256>:<pipeline-version>"
+    names = Column(Text, nullable=False)  # JSON-Liste der erkannten Namen
+    hit_count = Column(Integer, default=0, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_used_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)  # Für LRU-Verdrängung
@@ -0,0 +1,106 @@
+"""
+Inhaltsadressierter Cache für OCR-Ergebnisse.
+Wird derselbe Screenshot erneut hochgeladen, kommen die Namen aus der DB
+statt aus einem neuen Tesseract-Durchlauf.
+
+Cache-Treffer werden nur im Prozess vorgemerkt und erst beim nächsten
+Schreiben (vor der LRU-Verdrängung) gesammelt in die DB übernommen. Ein
+Treffer kostet so ein SELECT und keinen Commit.
+"""
+import hashlib
+import json
+import threading
+from typing import Dict, List, Optional
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.ocr_cache import OCRResultCache
+from app.ocr.scanner import OCR_PIPELINE_VERSION
+
+settings = get_settings()
+
+# cache_key -> Anzahl noch nicht geschriebener Treffer
+_pending_hits: Dict[str, int] = {}
+_pending_lock = threading.Lock()
+
+
+def ocr_cache_key(image_bytes: bytes) -> str:
+    """Schlüssel = SHA-256 der Bild-Bytes + Version der OCR-Pipeline."""
+    return f"{hashlib.sha256(image_bytes).hexdigest()}:{OCR_PIPELINE_VERSION}"
+
+
+def get_cached_names(db: Session, cache_key: str) -> Optional[List[str]]:
+    """Gibt gecachte Namen zurück; der Treffer wird nur vorgemerkt (kein Commit)."""
+    names = db.query(OCRResultCache.names).filter(OCRResultCache.cache_key == cache_key).scalar()
+    if names is None:
+        return None
+
+    with _pending_lock:
+        _pending_hits[cache_key] = _pending_hits.get(cache_key, 0) + 1
+    return json.loads(names)
+
+
+def _flush_hits(db: Session) -> None:
+    """Schreibt vorgemerkte Treffer (hit_count, last_used_at) in einem executemany."""
+    with _pending_lock:
+        hits = dict(_pending_hits)
+        _pending_hits.clear()
+    if not hits:
+        return
+
+    table = OCRResultCache.__table__
+    stmt = update(table).where(table.c.cache_key == bindparam("key")).values(
+        hit_count=table.c.hit_count + bindparam("hits"),
+        last_used_at=func.now(),
+    )
+    db.execute(stmt, [{"key": key, "hits": count} for key, count in hits.items()])
+
+
+def _insert_ignore(db: Session):
+    """INSERT ... ON CONFLICT DO NOTHING im Dialekt der Session."""
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    return dialect.insert(OCRResultCache.__table__)
+
+
+def store_names(db: Session, cache_key: str, names: List[str]) -> None:
+    """Speichert ein OCR-Ergebnis und verdrängt die am längsten unbenutzten Einträge.
+
+    Gleichzeitige Scans desselben Bildes sind unkritisch: der zweite Insert
+    wird per ON CONFLICT verworfen statt an der Unique-Constraint zu scheitern.
+    """
+    _flush_hits(db)
+
+    db.execute(
+        _insert_ignore(db).values(cache_key=cache_key, names=json.dumps(names), hit_count=0)
+        .on_conflict_do_nothing(index_elements=["cache_key"])
+    )
+
+    # LRU: alles jenseits der Obergrenze löschen
+    stale_ids = db.query(OCRResultCache.id).order_by(
+        OCRResultCache.last_used_at.desc(), OCRResultCache.id.desc()
+    ).offset(settings.ocr_cache_max_entries).all()
+    if stale_ids:
+        db.query(OCRResultCache).filter(
+            OCRResultCache.id.in_([row.id for row in stale_ids])
+        ).delete(synchronize_session=False)
+
+    db.commit()
+
+
+def store_result(cache_key: str, names: List[str]) -> None:
+    """Speichert das Ergebnis eines abgeschlossenen OCR-Jobs (eigene Session).
+
+    Leere Ergebnisse werden nicht gecacht, die können von einem OCR-Fehler stammen.
+    """
+    if not names:
+        return
+    db = SessionLocal()
+    try:
+        store_names(db, cache_key, names)
+    finally:
+        db.close()
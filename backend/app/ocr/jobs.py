@@ -0,0 +1,155 @@
+"""
+OCR-Jobs im Process-Pool.
+Der Upload gibt sofort eine Job-ID zurück, Tesseract läuft in einem separaten
+Prozess und blockiert den Event-Loop nicht mehr.
+
+Jobs leben nur im Speicher des Prozesses, der den Upload angenommen hat.
+Bei mehreren Uvicorn-Workern oder nach einem Neustart liefert
+GET /scan/{job_id} daher 404; der Client lädt den Screenshot dann neu hoch
+(dank OCR-Cache meist ohne neuen Tesseract-Durchlauf).
+"""
+import multiprocessing
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from app.config import get_settings
+from app.ocr.cache import store_result
+from app.ocr.scanner import extract_names_from_bytes
+
+settings = get_settings()
+
+
+class OCRJobManager:
+    """Verwaltet OCR-Jobs (Einreichen, Status, Ergebnis, Aufräumen).
+
+    Die Bild-Bytes hält nur der laufende Future; der Job selbst merkt sich
+    lediglich den Cache-Schlüssel. Abgeschlossene Jobs werden nach der TTL
+    entfernt und zusätzlich auf max_finished_jobs begrenzt (älteste zuerst).
+
+    on_result(cache_key, names) wird aufgerufen, sobald ein Scan fertig ist
+    (in einem eigenen Thread, unabhängig davon, ob jemand das Ergebnis abholt).
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        job_ttl_seconds: int = 600,
+        max_finished_jobs: int = 200,
+        on_result: Optional[Callable[[str, List[str]], None]] = None,
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.job_ttl_seconds = job_ttl_seconds
+        self.max_finished_jobs = max_finished_jobs
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._jobs: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.on_result = on_result
+        self._result_writer: Optional[ThreadPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn statt fork: Worker erben keine DB-Verbindungen/Threads des Servers
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    def _cleanup(self):
+        """Entfernt abgelaufene Jobs und begrenzt die Zahl abgeschlossener Jobs (Lock halten)."""
+        now = time.time()
+        finished = [job_id for job_id, job in self._jobs.items() if job["future"].done()]
+        expired = {
+            job_id for job_id in finished
+            if now - self._jobs[job_id]["created_at"] > self.job_ttl_seconds
+        }
+        # _jobs ist nach Einreichung sortiert, die ältesten fallen zuerst raus
+        remaining = [job_id for job_id in finished if job_id not in expired]
+        overflow = remaining[:max(0, len(remaining) - self.max_finished_jobs)]
+        for job_id in expired.union(overflow):
+            del self._jobs[job_id]
+
+    def _pending_count(self) -> int:
+        return sum(1 for job in self._jobs.values() if not job["future"].done())
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return self._pending_count()
+
+    def _add(self, future: Future, user_id: int, cache_key: str) -> str:
+        job_id = uuid.uuid4().hex
+        self._jobs[job_id] = {
+            "future": future,
+            "cache_key": cache_key,
+            "user_id": user_id,
+            "created_at": time.time(),
+        }
+        return job_id
+
+    def _on_done(self, cache_key: str, future: Future):
+        """Done-Callback (Management-Thread des Pools): Ergebnis an on_result weiterreichen."""
+        if self.on_result is None or future.cancelled() or future.exception() is not None:
+            return
+        with self._lock:
+            if self._result_writer is None:
+                self._result_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr-result")
+            writer = self._result_writer
+        writer.submit(self.on_result, cache_key, future.result())
+
+    def submit(self, image_bytes: bytes, user_id: int, cache_key: str) -> Optional[str]:
+        """Reicht einen Scan ein. Gibt None zurück, wenn die Warteschlange voll ist."""
+        with self._lock:
+            self._cleanup()
+            if self._pending_count() >= self.max_pending:
+                return None
+            future = self._get_pool().submit(extract_names_from_bytes, image_bytes)
+            job_id = self._add(future, user_id, cache_key)
+        future.add_done_callback(lambda done: self._on_done(cache_key, done))
+        return job_id
+
+    def submit_cached(self, user_id: int, cache_key: str, names: List[str]) -> str:
+        """Legt einen bereits abgeschlossenen Job an (Treffer im OCR-Cache)."""
+        future: Future = Future()
+        future.set_result(names)
+        with self._lock:
+            self._cleanup()
+            return self._add(future, user_id, cache_key)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """Gibt den Job zurück (oder None, wenn unbekannt/abgelaufen)."""
+        with self._lock:
+            self._cleanup()
+            return self._jobs.get(job_id)
+
+    @staticmethod
+    def status(job: dict) -> str:
+        """pending | done | failed"""
+        future = job["future"]
+        if not future.done():
+            return "pending"
+        if future.cancelled() or future.exception() is not None:
+            return "failed"
+        return "done"
+
+    def shutdown(self):
+        """Beendet den Process-Pool (beim Herunterfahren des Servers)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        if self._result_writer is not None:
+            self._result_writer.shutdown(wait=True)
+            self._result_writer = None
+
+
+ocr_jobs = OCRJobManager(
+    max_workers=settings.ocr_max_workers,
+    max_pending=settings.ocr_max_pending_jobs,
+    max_finished_jobs=settings.ocr_max_finished_jobs,
+    on_result=store_result,
+)
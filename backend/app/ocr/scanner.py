@@ -4,6 +4,8 @@ OCR-Modul für die Erkennung von Namen aus TeamSpeak/Discord Screenshots.
 
 from typing import List, BinaryIO, Tuple
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+import logging
 import re
 
 try:
@@ -19,6 +21,8 @@ try:
 except ImportError:
     OCR_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 
 def preprocess_image(image: 'Image.Image') -> 'Image.Image':
     """
@@ -127,10 +131,70 @@ def clean_name(name: str) -> str:
     return name.strip()
 
 
+# Version der OCR-Pipeline (Vorverarbeitung + PSM-Modi). Erhöhen, wenn sich
+# preprocess_image, OCR_PSM_MODES oder die Namens-Bereinigung ändern, damit
+# der OCR-Cache keine veralteten Ergebnisse liefert.
+OCR_PIPELINE_VERSION = "1"
+
+# PSM 6: Uniform block of text (Standard)
+# PSM 4: Single column of text of variable sizes
+# PSM 11: Sparse text - find as much text as possible
+OCR_PSM_MODES = (6, 4, 11)
+
+
+def names_from_text(text: str) -> List[str]:
+    """Extrahiert bereinigte Namen aus dem Tesseract-Rohtext."""
+    names = []
+    for line in text.strip().split('\n'):
+        line = line.strip()
+        if len(line) < 2:
+            continue
+
+        # TeamSpeak-Format parsen (Name | DisplayName | Tag)
+        for name in parse_teamspeak_line(line):
+            cleaned = clean_name(name)
+            if len(cleaned) >= 2 and not is_noise(cleaned):
+                names.append(cleaned)
+    return names
+
+
+def run_psm_pass(processed_image: 'Image.Image', psm: int) -> List[str]:
+    """Ein OCR-Durchlauf mit einem PSM-Modus."""
+    try:
+        text = pytesseract.image_to_string(
+            processed_image,
+            lang='deu+eng',
+            config=f'--psm {psm} --oem 3'
+        )
+        return names_from_text(text)
+    except Exception as e:
+        logger.warning("OCR Error with PSM %s: %s", psm, e)
+        return []
+
+
+def unique_names(all_names: List[str]) -> List[str]:
+    """Entfernt Duplikate, Reihenfolge bleibt erhalten."""
+    seen = set()
+    result = []
+    for name in all_names:
+        name_lower = name.lower()
+        # Ähnliche Namen zusammenfassen (z.B. "ryze" und "ry_ze")
+        simplified = re.sub(r'[_\-\s]', '', name_lower)
+        if simplified not in seen and name_lower not in seen:
+            seen.add(name_lower)
+            seen.add(simplified)
+            result.append(name)
+    return result
+
+
 def extract_names_from_image(image_data: BinaryIO) -> List[str]:
     """
     Extrahiert Namen aus einem Screenshot (z.B. TeamSpeak Kanalliste).
 
+    Die PSM-Durchläufe laufen parallel: pytesseract startet pro Aufruf einen
+    eigenen Tesseract-Prozess, Threads reichen also für echte Parallelität.
+    Das Ergebnis ist identisch zur sequentiellen Reihenfolge 6, 4, 11.
+
     Args:
         image_data: Bild als BytesIO oder File-like object
 
@@ -141,65 +205,29 @@ def extract_names_from_image(image_data: BinaryIO) -> List[str]:
         return []
 
     try:
-        # Bild öffnen
+        # Bild öffnen und vorverarbeiten
         image = Image.open(image_data)
-
-        # Bild vorverarbeiten
         processed_image = preprocess_image(image)
 
-        # OCR mit verschiedenen PSM-Modi versuchen
-        all_names = []
-
-        # PSM 6: Uniform block of text (Standard)
-        # PSM 4: Single column of text of variable sizes
-        # PSM 11: Sparse text - find as much text as possible
-        for psm in [6, 4, 11]:
-            try:
-                text = pytesseract.image_to_string(
-                    processed_image,
-                    lang='deu+eng',
-                    config=f'--psm {psm} --oem 3'
-                )
-
-                lines = text.strip().split('\n')
-
-                for line in lines:
-                    line = line.strip()
-                    if len(line) < 2:
-                        continue
-
-                    # TeamSpeak-Format parsen (Name | DisplayName | Tag)
-                    parsed_names = parse_teamspeak_line(line)
-
-                    for name in parsed_names:
-                        cleaned = clean_name(name)
-                        if len(cleaned) >= 2 and not is_noise(cleaned):
-                            all_names.append(cleaned)
-
-            except Exception as e:
-                print(f"OCR Error with PSM {psm}: {e}")
-                continue
-
-        # Duplikate entfernen, Reihenfolge beibehalten
-        seen = set()
-        unique_names = []
-        for name in all_names:
-            name_lower = name.lower()
-            # Ähnliche Namen zusammenfassen (z.B. "ryze" und "ry_ze")
-            simplified = re.sub(r'[_\-\s]', '', name_lower)
-            if simplified not in seen and name_lower not in seen:
-                seen.add(name_lower)
-                seen.add(simplified)
-                unique_names.append(name)
-
-        return unique_names
+        # Jeder Thread bekommt eine eigene Kopie (PIL-Images sind nicht threadsicher),
+        # kopiert wird vorab im aufrufenden Thread
+        copies = [processed_image.copy() for _ in OCR_PSM_MODES]
+        with ThreadPoolExecutor(max_workers=len(OCR_PSM_MODES)) as pool:
+            passes = list(pool.map(run_psm_pass, copies, OCR_PSM_MODES))
+
+        return unique_names([name for names in passes for name in names])
 
     except Exception as e:
         # Bei Fehlern leere Liste zurückgeben
-        print(f"OCR Error: {e}")
+        logger.warning("OCR Error: %s", e)
         return []
 
 
+def extract_names_from_bytes(image_bytes: bytes) -> List[str]:
+    """Wie extract_names_from_image, aber mit Bytes (picklebar für den Process-Pool)."""
+    return extract_names_from_image(BytesIO(image_bytes))
+
+
 def is_ocr_available() -> bool:
     """Prüft ob OCR verfügbar ist (Tesseract installiert)."""
     if not OCR_AVAILABLE:
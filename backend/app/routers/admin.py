@@ -6,7 +6,7 @@ Nur für Admins zugänglich.
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, text
 import csv
 import io
 from datetime import datetime
@@ -14,6 +14,10 @@ from pathlib import Path
 
 from app.database import get_db
 from app.auth.jwt import get_current_user
+from app.auth.user_cache import user_cache
+from app.services.mission_cache import mission_cache
+from app.services.http_clients import http_clients
+from app.services.fleetyards_cache import fleetyards_cache
 from app.auth.dependencies import check_role
 from app.models.user import User, UserRole
 from app.models.inventory import Inventory
@@ -29,7 +33,7 @@ router = APIRouter()
 # ============== Statistiken ==============
 
 @router.get("/stats")
-async def get_database_stats(
+def get_database_stats(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -47,15 +51,55 @@ async def get_database_stats(
     }
 
 
+@router.get("/auth-cache")
+def get_auth_cache_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """Gibt Trefferquote und Füllstand des Auth-Caches zurück."""
+    check_role(current_user, UserRole.ADMIN)
+    return user_cache.stats()
+
+
+@router.get("/mission-cache")
+def get_mission_cache_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """Gibt Trefferquote und Füllstand des Mission-Snapshot-Caches zurück."""
+    check_role(current_user, UserRole.ADMIN)
+    return mission_cache.stats()
+
+
+@router.get("/http-clients")
+def get_http_client_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """Gibt Requests und Verbindungs-Wiederverwendung der externen HTTP-Clients zurück."""
+    check_role(current_user, UserRole.ADMIN)
+    return http_clients.stats()
+
+
+@router.get("/fleetyards-cache")
+def get_fleetyards_cache_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """Gibt Hit/Miss-Zähler des FleetYards-Caches zurück."""
+    check_role(current_user, UserRole.ADMIN)
+    return fleetyards_cache.stats()
+
+
 # ============== Datenbank-Download ==============
 
 @router.get("/backup/database")
-async def download_database(
+def download_database(
+    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Lädt die komplette SQLite-Datenbank herunter."""
     check_role(current_user, UserRole.ADMIN)
 
+    # Im WAL-Modus liegen frische Änderungen noch in poison.db-wal -> vorher zurückschreiben
+    db.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+
     # Pfad zur Datenbank
     db_path = Path("data/poison.db")
 
@@ -93,7 +137,7 @@ def create_csv_response(rows: list, headers: list, filename: str) -> StreamingRe
 
 
 @router.get("/export/users")
-async def export_users(
+def export_users(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -121,7 +165,7 @@ async def export_users(
 
 
 @router.get("/export/inventory")
-async def export_inventory(
+def export_inventory(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -147,7 +191,7 @@ async def export_inventory(
 
 
 @router.get("/export/treasury")
-async def export_treasury(
+def export_treasury(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -175,7 +219,7 @@ async def export_treasury(
 
 
 @router.get("/export/attendance")
-async def export_attendance(
+def export_attendance(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -203,7 +247,7 @@ async def export_attendance(
 
 
 @router.get("/export/loot")
-async def export_loot(
+def export_loot(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -1,8 +1,6 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, HTTPException, Request, status, UploadFile, File
 from sqlalchemy.orm import Session
-from io import BytesIO
 import re
 import json
 import base64
@@ -17,7 +15,11 @@ from app.schemas.attendance import (
 )
 from app.auth.jwt import get_current_user
 from app.auth.dependencies import check_role
-from app.ocr.scanner import extract_names_from_image
+from app.ocr.jobs import ocr_jobs
+from app.ocr.cache import ocr_cache_key, get_cached_names
+from app.services.screenshot_store import (
+    screenshot_upload, release_screenshot, purge_blobs, blob_response
+)
 
 router = APIRouter()
 
@@ -84,7 +86,8 @@ def session_to_response(session: AttendanceSession) -> dict:
         "created_by": session.created_by,
         "records": session.records,
         "is_confirmed": session.is_confirmed or False,
-        "has_screenshot": session.screenshot_data is not None,
+        "has_screenshot": session.screenshot_key is not None,
+        "has_thumbnail": session.thumbnail_key is not None,
         "has_loot_session": session.loot_session is not None,
         "loot_session_id": session.loot_session.id if session.loot_session else None,
         "created_at": session.created_at,
@@ -92,7 +95,7 @@ def session_to_response(session: AttendanceSession) -> dict:
 
 
 @router.get("", response_model=List[AttendanceSessionResponse])
-async def get_sessions(
+def get_sessions(
     limit: int = 20,
     session_type: Optional[str] = None,
     db: Session = Depends(get_db),
@@ -112,7 +115,7 @@ async def get_sessions(
 # WICHTIG: Diese Routen MÜSSEN vor /{session_id} kommen, sonst werden sie als session_id gematcht
 
 @router.get("/user-requests", response_model=List[UserRequestResponse])
-async def get_user_requests(
+def get_user_requests(
     status_filter: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -130,7 +133,7 @@ async def get_user_requests(
 
 
 @router.post("/user-requests", response_model=UserRequestResponse)
-async def create_user_request(
+def create_user_request(
     request_data: UserRequestCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -174,7 +177,7 @@ async def create_user_request(
 
 
 @router.post("/user-requests/{request_id}/approve")
-async def approve_user_request(
+def approve_user_request(
     request_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -227,7 +230,7 @@ async def approve_user_request(
 
 
 @router.post("/user-requests/{request_id}/reject")
-async def reject_user_request(
+def reject_user_request(
     request_id: int,
     reason: Optional[str] = None,
     db: Session = Depends(get_db),
@@ -259,7 +262,7 @@ async def reject_user_request(
 # ===== Session-spezifische Routen =====
 
 @router.get("/{session_id}", response_model=AttendanceSessionResponse)
-async def get_session(
+def get_session(
     session_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -277,7 +280,7 @@ async def get_session(
 
 
 @router.post("", response_model=AttendanceSessionResponse)
-async def create_session(
+def create_session(
     session_data: AttendanceSessionCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -302,29 +305,29 @@ async def create_session(
         session_type=session_data.session_type,
         notes=session_data.notes,
         created_by_id=current_user.id,
-        screenshot_data=screenshot_bytes,
         ocr_data=ocr_json,
         is_confirmed=False  # Session startet als unbestätigt
     )
-    db.add(session)
-    db.flush()
-
-    # Anwesenheits-Einträge hinzufügen
-    for record_data in session_data.records:
-        record = AttendanceRecord(
-            session_id=session.id,
-            user_id=record_data.user_id,
-            detected_name=record_data.detected_name
-        )
-        db.add(record)
+    with screenshot_upload(db, session, screenshot_bytes):
+        db.add(session)
+        db.flush()
+
+        # Anwesenheits-Einträge hinzufügen
+        for record_data in session_data.records:
+            record = AttendanceRecord(
+                session_id=session.id,
+                user_id=record_data.user_id,
+                detected_name=record_data.detected_name
+            )
+            db.add(record)
 
-    db.commit()
+        db.commit()
     db.refresh(session)
     return session_to_response(session)
 
 
 @router.post("/{session_id}/records")
-async def add_record(
+def add_record(
     session_id: int,
     record_data: AttendanceRecordCreate,
     db: Session = Depends(get_db),
@@ -354,7 +357,7 @@ async def add_record(
 
 
 @router.delete("/{session_id}/records/{record_id}")
-async def remove_record(
+def remove_record(
     session_id: int,
     record_id: int,
     db: Session = Depends(get_db),
@@ -378,14 +381,15 @@ async def remove_record(
     return {"message": "Eintrag entfernt"}
 
 
-@router.post("/scan")
-async def scan_screenshot(
+@router.post("/scan", status_code=status.HTTP_202_ACCEPTED)
+def scan_screenshot(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Scannt einen Screenshot und erkennt Namen via OCR.
+    Startet einen OCR-Scan für einen Screenshot und gibt sofort eine Job-ID zurück.
+    Das Ergebnis wird über GET /scan/{job_id} abgefragt.
     Das Bild wird nur im Speicher verarbeitet und danach verworfen.
     """
     check_role(current_user, UserRole.OFFICER)
@@ -397,12 +401,58 @@ async def scan_screenshot(
             detail="Nur Bilddateien sind erlaubt"
         )
 
-    # Bild in Speicher lesen
-    image_bytes = await file.read()
-    image_buffer = BytesIO(image_bytes)
+    image_bytes = file.file.read()
+    cache_key = ocr_cache_key(image_bytes)
+
+    # Gleicher Screenshot schon gescannt? Dann Ergebnis aus dem Cache
+    cached_names = get_cached_names(db, cache_key)
+    if cached_names is not None:
+        job_id = ocr_jobs.submit_cached(current_user.id, cache_key, cached_names)
+        return {"job_id": job_id, "status": "done"}
+
+    # Sonst an den OCR-Worker geben
+    job_id = ocr_jobs.submit(image_bytes, current_user.id, cache_key)
+    if job_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Zu viele laufende Scans, bitte gleich nochmal versuchen"
+        )
+
+    return {"job_id": job_id, "status": "pending"}
+
+
+@router.get("/scan/{job_id}")
+def get_scan_result(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Gibt Status bzw. Ergebnis eines OCR-Jobs zurück.
+    Solange der Scan läuft: {"status": "pending"}.
+    Jobs leben im Prozess (siehe app.ocr.jobs): auf einem anderen Worker oder
+    nach einem Neustart gibt es 404, der Client lädt dann erneut hoch.
+    """
+    check_role(current_user, UserRole.OFFICER)
+
+    job = ocr_jobs.get(job_id)
+    if job is None or (job["user_id"] != current_user.id and not current_user.has_permission(UserRole.ADMIN)):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Scan nicht gefunden"
+        )
+
+    job_status = ocr_jobs.status(job)
+    if job_status == "pending":
+        return {"job_id": job_id, "status": job_status}
+    if job_status == "failed":
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="OCR fehlgeschlagen"
+        )
 
-    # OCR durchführen
-    detected_names = extract_names_from_image(image_buffer)
+    # Das Ergebnis hat der Job beim Abschluss bereits in den OCR-Cache geschrieben
+    detected_names = job["future"].result()
 
     # Bekannte Benutzer zuordnen mit Fuzzy-Matching
     all_users = db.query(User).all()
@@ -426,9 +476,11 @@ async def scan_screenshot(
             unmatched_names.append(name)
 
     # Screenshot als Base64 für Frontend zurückgeben (wird erst bei Session-Erstellung gespeichert)
-    screenshot_base64 = base64.b64encode(image_bytes).decode('utf-8')
+    screenshot_base64 = base64.b64encode(job["image_bytes"]).decode('utf-8')
 
     return {
+        "job_id": job_id,
+        "status": job_status,
         "matched": matched_users,
         "unmatched": unmatched_names,
         "total_detected": len(detected_names),
@@ -445,7 +497,7 @@ async def scan_screenshot(
 
 
 @router.delete("/{session_id}")
-async def delete_session(
+def delete_session(
     session_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -466,15 +518,18 @@ async def delete_session(
     if session.loot_session:
         db.delete(session.loot_session)
 
+    orphaned_blobs = release_screenshot(db, session)
+
     # Session löschen (Records werden durch CASCADE gelöscht)
     db.delete(session)
     db.commit()
+    purge_blobs(db, orphaned_blobs)
 
     return {"message": "Session gelöscht"}
 
 
 @router.patch("/{session_id}", response_model=AttendanceSessionResponse)
-async def update_session(
+def update_session(
     session_id: int,
     update_data: AttendanceSessionUpdate,
     db: Session = Depends(get_db),
@@ -505,7 +560,7 @@ async def update_session(
 
 
 @router.post("/{session_id}/reopen", response_model=AttendanceSessionResponse)
-async def reopen_session(
+def reopen_session(
     session_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -535,7 +590,7 @@ async def reopen_session(
 
 
 @router.delete("/{session_id}/screenshot")
-async def delete_session_screenshot(
+def delete_session_screenshot(
     session_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -552,43 +607,66 @@ async def delete_session_screenshot(
             detail="Session nicht gefunden"
         )
 
-    session.screenshot_data = None
+    orphaned_blobs = release_screenshot(db, session)
     db.commit()
+    purge_blobs(db, orphaned_blobs)
     return {"message": "Screenshot gelöscht"}
 
 
+def get_session_or_404(db: Session, session_id: int) -> AttendanceSession:
+    session = db.query(AttendanceSession).filter(
+        AttendanceSession.id == session_id
+    ).first()
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Session nicht gefunden"
+        )
+    return session
+
+
 @router.get("/{session_id}/screenshot")
-async def get_session_screenshot(
+def get_session_screenshot(
     session_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Gibt den Screenshot einer Session zurück (falls vorhanden)."""
+    """Streamt den Screenshot einer Session aus dem Blob Store (unterstützt Range-Requests)."""
     check_role(current_user, UserRole.OFFICER)
 
-    session = db.query(AttendanceSession).filter(
-        AttendanceSession.id == session_id
-    ).first()
-    if not session:
+    session = get_session_or_404(db, session_id)
+    if not session.screenshot_key:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Session nicht gefunden"
+            detail="Kein Screenshot vorhanden"
         )
 
-    if not session.screenshot_data:
+    return blob_response(request, session.screenshot_key, session.screenshot_content_type or "image/png")
+
+
+@router.get("/{session_id}/thumbnail")
+def get_session_thumbnail(
+    session_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Gibt das WebP-Thumbnail des Screenshots zurück (für Listenansichten)."""
+    check_role(current_user, UserRole.OFFICER)
+
+    session = get_session_or_404(db, session_id)
+    if not session.thumbnail_key:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Kein Screenshot vorhanden"
+            detail="Kein Thumbnail vorhanden"
         )
 
-    return Response(
-        content=session.screenshot_data,
-        media_type="image/png"
-    )
+    return blob_response(request, session.thumbnail_key, "image/webp")
 
 
 @router.get("/{session_id}/ocr-data", response_model=OCRDataResponse)
-async def get_session_ocr_data(
+def get_session_ocr_data(
     session_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
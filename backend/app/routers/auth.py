@@ -2,6 +2,7 @@ import secrets
 from datetime import datetime, timedelta, timezone
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 from passlib.context import CryptContext
@@ -25,7 +26,7 @@ oauth_states: dict[str, bool] = {}
 
 
 @router.get("/login")
-async def login():
+def login():
     """Startet den Discord OAuth-Flow."""
     state = secrets.token_urlsafe(32)
     oauth_states[state] = True
@@ -33,40 +34,8 @@ async def login():
     return {"url": oauth_url}
 
 
-@router.get("/callback")
-async def callback(code: str, state: str, db: Session = Depends(get_db)):
-    """Discord OAuth Callback - tauscht Code gegen Token."""
-    # State validieren
-    if state not in oauth_states:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Ungültiger OAuth State"
-        )
-    del oauth_states[state]
-
-    # Code gegen Discord Access Token tauschen
-    discord_token = await exchange_code(code)
-    if not discord_token:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Fehler beim Token-Austausch mit Discord"
-        )
-
-    # Discord User-Daten abrufen
-    discord_user = await get_discord_user(discord_token)
-    if not discord_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Fehler beim Abrufen der Discord-Benutzerdaten"
-        )
-
-    # Guild-Prüfung wenn konfiguriert
-    if settings.required_guild_id:
-        guilds = await get_user_guilds(discord_token)
-        if not is_member_of_guild(guilds, settings.required_guild_id):
-            error_url = f"{settings.frontend_url}/auth/error?reason=not_member"
-            return RedirectResponse(url=error_url)
-
+def _upsert_discord_user(db: Session, discord_user) -> User:
+    """Sucht den Discord-User in der DB oder legt ihn an (inkl. Merge-Vorschlag)."""
     # Benutzer in DB suchen oder anlegen
     user = db.query(User).filter(User.discord_id == discord_user.id).first()
     is_new_user = user is None
@@ -155,6 +124,46 @@ async def callback(code: str, state: str, db: Session = Depends(get_db)):
 
         db.commit()
 
+    return user
+
+
+@router.get("/callback")
+async def callback(code: str, state: str, db: Session = Depends(get_db)):
+    """Discord OAuth Callback - tauscht Code gegen Token."""
+    # State validieren
+    if state not in oauth_states:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Ungültiger OAuth State"
+        )
+    del oauth_states[state]
+
+    # Code gegen Discord Access Token tauschen
+    discord_token = await exchange_code(code)
+    if not discord_token:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Fehler beim Token-Austausch mit Discord"
+        )
+
+    # Discord User-Daten abrufen
+    discord_user = await get_discord_user(discord_token)
+    if not discord_user:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Fehler beim Abrufen der Discord-Benutzerdaten"
+        )
+
+    # Guild-Prüfung wenn konfiguriert
+    if settings.required_guild_id:
+        guilds = await get_user_guilds(discord_token)
+        if not is_member_of_guild(guilds, settings.required_guild_id):
+            error_url = f"{settings.frontend_url}/auth/error?reason=not_member"
+            return RedirectResponse(url=error_url)
+
+    # DB-Teil im Threadpool, damit der Event-Loop frei bleibt
+    user = await run_in_threadpool(_upsert_discord_user, db, discord_user)
+
     # JWT Token erstellen (sub muss String sein)
     access_token = create_access_token(data={"sub": str(user.id)})
 
@@ -164,13 +173,13 @@ async def callback(code: str, state: str, db: Session = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_me(current_user: User = Depends(get_current_user)):
+def get_me(current_user: User = Depends(get_current_user)):
     """Gibt den aktuell eingeloggten Benutzer zurück."""
     return current_user
 
 
 @router.post("/logout")
-async def logout(current_user: User = Depends(get_current_user)):
+def logout(current_user: User = Depends(get_current_user)):
     """Logout - clientseitig wird der Token gelöscht."""
     return {"message": "Erfolgreich ausgeloggt"}
 
@@ -178,7 +187,7 @@ async def logout(current_user: User = Depends(get_current_user)):
 # ==================== PASSWORD AUTHENTICATION ENDPOINTS ====================
 
 @router.post("/register", response_model=UserResponse)
-async def register_with_password(data: PasswordRegister, db: Session = Depends(get_db)):
+def register_with_password(data: PasswordRegister, db: Session = Depends(get_db)):
     """
     Registriert einen neuen User mit Username/Passwort.
     User wird mit is_pending=True erstellt und muss von Admin freigeschaltet werden.
@@ -210,7 +219,7 @@ async def register_with_password(data: PasswordRegister, db: Session = Depends(g
 
 
 @router.post("/login/password")
-async def login_with_password(data: PasswordLogin, db: Session = Depends(get_db)):
+def login_with_password(data: PasswordLogin, db: Session = Depends(get_db)):
     """
     Login mit Username/Passwort.
     Gibt JWT-Token zurück wenn erfolgreich.
@@ -255,7 +264,7 @@ async def login_with_password(data: PasswordLogin, db: Session = Depends(get_db)
 
 
 @router.post("/approve-user/{user_id}", response_model=UserResponse)
-async def approve_pending_user(
+def approve_pending_user(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -282,7 +291,7 @@ async def approve_pending_user(
 
 
 @router.post("/reject-user/{user_id}")
-async def reject_pending_user(
+def reject_pending_user(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -306,7 +315,7 @@ async def reject_pending_user(
 
 
 @router.post("/reset-password")
-async def admin_reset_password(
+def admin_reset_password(
     data: PasswordResetByAdmin,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -328,7 +337,7 @@ async def admin_reset_password(
 
 
 @router.get("/pending-users", response_model=List[UserResponse])
-async def get_pending_users(
+def get_pending_users(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -343,7 +352,7 @@ async def get_pending_users(
 # ==================== GÄSTE-TOKEN ENDPOINTS ====================
 
 @router.post("/guest-tokens", response_model=GuestTokenResponse)
-async def create_guest_token(
+def create_guest_token(
     data: GuestTokenCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -384,7 +393,7 @@ async def create_guest_token(
 
 
 @router.get("/guest-tokens", response_model=List[GuestTokenResponse])
-async def list_guest_tokens(
+def list_guest_tokens(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -411,7 +420,7 @@ async def list_guest_tokens(
 
 
 @router.delete("/guest-tokens/{token_id}")
-async def delete_guest_token(
+def delete_guest_token(
     token_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -437,7 +446,7 @@ async def delete_guest_token(
 
 
 @router.post("/guest-tokens/{token_id}/toggle")
-async def toggle_guest_token(
+def toggle_guest_token(
     token_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -458,7 +467,7 @@ async def toggle_guest_token(
 
 
 @router.get("/guest/{token}")
-async def guest_login(token: str, db: Session = Depends(get_db)):
+def guest_login(token: str, db: Session = Depends(get_db)):
     """
     Gäste-Login mit Token.
     Erstellt einen temporären "Gast"-User und gibt JWT zurück.
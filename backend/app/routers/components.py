@@ -1,13 +1,11 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-import httpx
-import re
+from sqlalchemy import or_, case, func
 
 from app.database import get_db
 from app.models.user import User, UserRole
-from app.models.component import Component
+from app.models.component import Component, normalize_search, component_search_filter
 from app.models.item_price import ItemPrice
 from app.schemas.component import (
     ComponentCreate, ComponentResponse, ComponentDetailResponse,
@@ -16,19 +14,15 @@ from app.schemas.component import (
 )
 from app.auth.jwt import get_current_user
 from app.auth.dependencies import check_role
+from app.services.http_clients import http_clients
 
 router = APIRouter()
 
 SC_API_BASE = "https://api.star-citizen.wiki/api/v2"
 
 
-def normalize_search(text: str) -> str:
-    """Normalisiert Suchtext für fuzzy matching (entfernt Trennzeichen)."""
-    return re.sub(r'[-_\s.]', '', text.lower())
-
-
 @router.get("", response_model=List[ComponentResponse])
-async def get_components(
+def get_components(
     category: Optional[str] = None,
     sub_category: Optional[str] = None,
     db: Session = Depends(get_db),
@@ -46,7 +40,7 @@ async def get_components(
 
 
 @router.get("/categories")
-async def get_categories(
+def get_categories(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -58,7 +52,7 @@ async def get_categories(
 
 
 @router.get("/manufacturers")
-async def get_manufacturers(
+def get_manufacturers(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -70,7 +64,7 @@ async def get_manufacturers(
 
 
 @router.get("/sub-categories")
-async def get_sub_categories(
+def get_sub_categories(
     category: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -85,7 +79,7 @@ async def get_sub_categories(
 
 
 @router.post("", response_model=ComponentResponse)
-async def create_component(
+def create_component(
     component: ComponentCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -109,7 +103,7 @@ async def create_component(
 
 
 @router.delete("/{component_id}")
-async def delete_component(
+def delete_component(
     component_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -136,7 +130,7 @@ async def delete_component(
 
 
 @router.get("/search", response_model=List[ComponentResponse])
-async def search_components(
+def search_components(
     q: str = Query(..., min_length=2, description="Suchbegriff (min. 2 Zeichen)"),
     category: Optional[str] = None,
     sub_category: Optional[str] = None,
@@ -147,7 +141,13 @@ async def search_components(
     """
     Sucht Komponenten mit Fuzzy-Matching.
     'TS2' findet auch 'TS-2', 'ts_2', 'TS 2' etc.
+    Filter und Ranking laufen komplett in SQL über die normalisierten Suchspalten
+    (Trigram-Index, siehe component_search_filter).
     """
+    normalized_search = normalize_search(q)
+    if not normalized_search:
+        return []
+
     # Basis-Query
     query = db.query(Component).filter(Component.name != "<= PLACEHOLDER =>")
 
@@ -156,44 +156,20 @@ async def search_components(
     if sub_category:
         query = query.filter(Component.sub_category == sub_category)
 
-    # Alle laden und clientseitig filtern für Fuzzy-Search
-    all_components = query.all()
-
-    # Fuzzy-Matching
-    normalized_search = normalize_search(q)
-    search_lower = q.lower()
+    # Fuzzy-Suche (ohne Trennzeichen) in Name oder Hersteller
+    query = query.filter(component_search_filter(normalized_search, db.get_bind().dialect.name))
 
-    results = []
-    for comp in all_components:
-        # Normale Suche
-        if search_lower in comp.name.lower():
-            results.append(comp)
-            continue
-
-        # Fuzzy-Suche (ohne Trennzeichen)
-        if normalized_search in normalize_search(comp.name):
-            results.append(comp)
-            continue
-
-        # Hersteller-Suche
-        if comp.manufacturer and search_lower in comp.manufacturer.lower():
-            results.append(comp)
-
-    # Sortieren: Exakte Matches zuerst, dann alphabetisch
-    def sort_key(c):
-        name_lower = c.name.lower()
-        if name_lower.startswith(search_lower):
-            return (0, c.name)
-        if search_lower in name_lower:
-            return (1, c.name)
-        return (2, c.name)
-
-    results.sort(key=sort_key)
-    return results[:limit]
+    # Sortieren: Treffer am Namensanfang zuerst, dann Name, dann Hersteller
+    rank = case(
+        (Component.search_name.startswith(normalized_search, autoescape=True), 0),
+        (Component.search_name.contains(normalized_search, autoescape=True), 1),
+        else_=2
+    )
+    return query.order_by(rank, Component.name).limit(limit).all()
 
 
 @router.get("/{component_id}/details", response_model=ComponentDetailResponse)
-async def get_component_details(
+def get_component_details(
     component_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -280,64 +256,64 @@ async def get_component_details(
 
     if not has_any_stats and component.sc_uuid:
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                api_response = await client.get(f"{SC_API_BASE}/items/{component.sc_uuid}")
-
-                if api_response.status_code == 200:
-                    data = api_response.json().get("data", {})
-
-                    # Beschreibung holen
-                    desc = data.get("description")
-                    if desc:
-                        if isinstance(desc, dict):
-                            response.description = desc.get("en_EN") or desc.get("de_DE")
-                        elif isinstance(desc, str):
-                            response.description = desc
-
-                    # Stats aus API holen
-                    if sc_type in ("Shield", "ShieldGenerator") and data.get("shield"):
-                        shield_data = data["shield"]
-                        regen_delay = shield_data.get("regen_delay", {})
-                        response.shield = ShieldStats(
-                            max_shield_health=shield_data.get("max_shield_health"),
-                            max_shield_regen=shield_data.get("max_shield_regen"),
-                            decay_ratio=shield_data.get("decay_ratio"),
-                            downed_delay=regen_delay.get("downed"),
-                            damage_delay=regen_delay.get("damage")
-                        )
-
-                    if data.get("power"):
-                        power_data = data["power"]
-                        response.power = PowerStats(
-                            power_base=power_data.get("power_base"),
-                            power_draw=power_data.get("power_draw"),
-                            em_min=power_data.get("em_min"),
-                            em_max=power_data.get("em_max")
-                        )
-
-                    if sc_type == "Cooler" and data.get("cooler"):
-                        cooler_data = data["cooler"]
-                        response.cooler = CoolerStats(
-                            cooling_rate=cooler_data.get("cooling_rate"),
-                            suppression_ir_factor=cooler_data.get("suppression_ir_factor"),
-                            suppression_heat_factor=cooler_data.get("suppression_heat_factor")
-                        )
-
-                    if sc_type == "QuantumDrive" and data.get("quantum"):
-                        quantum_data = data["quantum"]
-                        response.quantum_drive = QuantumDriveStats(
-                            quantum_speed=quantum_data.get("quantum_speed"),
-                            quantum_spool_time=quantum_data.get("quantum_spool_time"),
-                            quantum_cooldown_time=quantum_data.get("quantum_cooldown_time"),
-                            quantum_range=quantum_data.get("quantum_range"),
-                            quantum_fuel_requirement=quantum_data.get("quantum_fuel_requirement")
-                        )
-
-                    # Raw Stats erweitern
-                    raw_keys = ["shield", "power", "heat", "distortion", "durability", "cooler", "quantum"]
-                    for k in raw_keys:
-                        if data.get(k):
-                            response.raw_stats[k] = data[k]
+            client = http_clients.get_sync("sc_wiki")
+            api_response = client.get(f"{SC_API_BASE}/items/{component.sc_uuid}", timeout=10.0)
+
+            if api_response.status_code == 200:
+                data = api_response.json().get("data", {})
+
+                # Beschreibung holen
+                desc = data.get("description")
+                if desc:
+                    if isinstance(desc, dict):
+                        response.description = desc.get("en_EN") or desc.get("de_DE")
+                    elif isinstance(desc, str):
+                        response.description = desc
+
+                # Stats aus API holen
+                if sc_type in ("Shield", "ShieldGenerator") and data.get("shield"):
+                    shield_data = data["shield"]
+                    regen_delay = shield_data.get("regen_delay", {})
+                    response.shield = ShieldStats(
+                        max_shield_health=shield_data.get("max_shield_health"),
+                        max_shield_regen=shield_data.get("max_shield_regen"),
+                        decay_ratio=shield_data.get("decay_ratio"),
+                        downed_delay=regen_delay.get("downed"),
+                        damage_delay=regen_delay.get("damage")
+                    )
+
+                if data.get("power"):
+                    power_data = data["power"]
+                    response.power = PowerStats(
+                        power_base=power_data.get("power_base"),
+                        power_draw=power_data.get("power_draw"),
+                        em_min=power_data.get("em_min"),
+                        em_max=power_data.get("em_max")
+                    )
+
+                if sc_type == "Cooler" and data.get("cooler"):
+                    cooler_data = data["cooler"]
+                    response.cooler = CoolerStats(
+                        cooling_rate=cooler_data.get("cooling_rate"),
+                        suppression_ir_factor=cooler_data.get("suppression_ir_factor"),
+                        suppression_heat_factor=cooler_data.get("suppression_heat_factor")
+                    )
+
+                if sc_type == "QuantumDrive" and data.get("quantum"):
+                    quantum_data = data["quantum"]
+                    response.quantum_drive = QuantumDriveStats(
+                        quantum_speed=quantum_data.get("quantum_speed"),
+                        quantum_spool_time=quantum_data.get("quantum_spool_time"),
+                        quantum_cooldown_time=quantum_data.get("quantum_cooldown_time"),
+                        quantum_range=quantum_data.get("quantum_range"),
+                        quantum_fuel_requirement=quantum_data.get("quantum_fuel_requirement")
+                    )
+
+                # Raw Stats erweitern
+                raw_keys = ["shield", "power", "heat", "distortion", "durability", "cooler", "quantum"]
+                for k in raw_keys:
+                    if data.get(k):
+                        response.raw_stats[k] = data[k]
 
         except Exception:
             # Bei API-Fehler einfach mit lokalen Daten weitermachen
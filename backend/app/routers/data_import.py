@@ -49,7 +49,7 @@ def create_csv_reader(text: str) -> csv.DictReader:
 
 
 @router.post("/inventory", response_model=ImportResult)
-async def import_inventory(
+def import_inventory(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -71,7 +71,7 @@ async def import_inventory(
     """
     check_role(current_user, UserRole.ADMIN)
 
-    content = await file.read()
+    content = file.file.read()
     try:
         text = content.decode('utf-8-sig')  # UTF-8 mit BOM Support
     except UnicodeDecodeError:
@@ -176,7 +176,7 @@ async def import_inventory(
 
 
 @router.post("/members", response_model=ImportResult)
-async def import_members(
+def import_members(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -206,7 +206,7 @@ async def import_members(
     """
     check_role(current_user, UserRole.ADMIN)
 
-    content = await file.read()
+    content = file.file.read()
     try:
         text = content.decode('utf-8-sig')
     except UnicodeDecodeError:
@@ -324,7 +324,7 @@ async def import_members(
 
 
 @router.post("/treasury", response_model=ImportResult)
-async def import_treasury(
+def import_treasury(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -347,7 +347,7 @@ async def import_treasury(
     """
     check_role(current_user, UserRole.ADMIN)
 
-    content = await file.read()
+    content = file.file.read()
     try:
         text = content.decode('utf-8-sig')
     except UnicodeDecodeError:
@@ -1,15 +1,21 @@
-import re
+import asyncio
+import json
+import time
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload, aliased
+from sqlalchemy import or_, and_, case, func, select, update, bindparam
 from datetime import datetime, timezone
 
-from app.database import get_db
+from app.database import get_db, get_async_db, SessionLocal
 from app.models.user import User, UserRole
 from app.models.inventory import Inventory, InventoryTransfer, TransferRequest, TransferRequestStatus
 from app.models.inventory_log import InventoryLog, InventoryAction
-from app.models.component import Component
+from app.models.component import Component, normalize_search, component_search_filter
 from app.models.location import Location
 from app.schemas.inventory import (
     InventoryResponse, InventoryUpdate, TransferCreate, TransferResponse,
@@ -18,15 +24,17 @@ from app.schemas.inventory import (
     ComponentSearchResult, InventoryDashboardResponse, PioneerInventoryStats, LocationStats, CategoryStats,
     TransferRequestSummaryItem, TransferRequestSummaryResponse
 )
-from app.auth.jwt import get_current_user
+from app.auth.jwt import (
+    security, get_current_user, get_current_user_async,
+    verify_token, create_stream_ticket, verify_stream_ticket,
+)
 from app.auth.dependencies import check_role
+from app.services.transfer_events import transfer_event_bus
 
 router = APIRouter()
 
-
-def normalize_search(text: str) -> str:
-    """Normalisiert Suchtext für fuzzy matching (entfernt Trennzeichen)."""
-    return re.sub(r'[-_\s.]', '', text.lower())
+# Keepalive-Intervall für SSE-Streams (hält Proxies/Browser-Verbindungen offen)
+SSE_KEEPALIVE_SECONDS = 25
 
 
 def log_inventory_change(
@@ -54,15 +62,55 @@ def log_inventory_change(
     db.add(log)
 
 
+def _merge_into_location(db: Session, user_id: int, is_source, to_location_id: Optional[int]) -> None:
+    """Verschiebt Lager-Einträge eines Users set-basiert an einen Standort.
+
+    is_source(table) liefert die SQL-Bedingung für die Quell-Einträge (darf
+    keine Einträge am Ziel erfassen). Gibt es am Ziel schon einen Eintrag
+    derselben Komponente, wird die Menge dort addiert und die Quelle auf 0
+    gesetzt, sonst wird die Quelle umgehängt. Drei Statements, kein Commit.
+    """
+    inv = Inventory.__table__
+    src = inv.alias("src")
+    tgt = inv.alias("tgt")
+
+    def at_target(table):
+        return and_(table.c.user_id == user_id, table.c.location_id.is_not_distinct_from(to_location_id))
+
+    def source_rows(table):
+        return and_(table.c.user_id == user_id, table.c.quantity > 0, is_source(table))
+
+    # 1. Mengen auf den (ältesten) Ziel-Eintrag pro Komponente addieren
+    target_ids = select(func.min(tgt.c.id)).where(at_target(tgt)).group_by(tgt.c.component_id)
+    source_sum = select(func.coalesce(func.sum(src.c.quantity), 0)).where(
+        source_rows(src), src.c.component_id == inv.c.component_id
+    ).scalar_subquery()
+    db.execute(
+        update(inv).where(inv.c.id.in_(target_ids)).values(quantity=inv.c.quantity + source_sum)
+    )
+
+    # 2. Zusammengeführte Quellen leeren
+    target_components = select(tgt.c.component_id).where(at_target(tgt))
+    db.execute(
+        update(inv).where(source_rows(inv), inv.c.component_id.in_(target_components)).values(quantity=0)
+    )
+
+    # 3. Den Rest umhängen
+    db.execute(update(inv).where(source_rows(inv)).values(location_id=to_location_id))
+
+
 @router.get("", response_model=List[InventoryResponse])
 async def get_all_inventory(
     user_id: Optional[int] = None,
     location_id: Optional[int] = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
     """Gibt das Lager zurück. Optional gefiltert nach Benutzer und/oder Standort."""
-    query = db.query(Inventory).filter(Inventory.quantity > 0)
+    query = select(Inventory).options(
+        selectinload(Inventory.component),
+        selectinload(Inventory.location)
+    ).filter(Inventory.quantity > 0)
     if user_id:
         query = query.filter(Inventory.user_id == user_id)
     if location_id is not None:
@@ -71,17 +119,21 @@ async def get_all_inventory(
             query = query.filter(Inventory.location_id.is_(None))
         else:
             query = query.filter(Inventory.location_id == location_id)
-    return query.all()
+    result = await db.execute(query)
+    return result.scalars().all()
 
 
 @router.get("/my", response_model=List[InventoryResponse])
 async def get_my_inventory(
     location_id: Optional[int] = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
     """Gibt das eigene Lager zurück. Optional gefiltert nach Standort."""
-    query = db.query(Inventory).filter(
+    query = select(Inventory).options(
+        selectinload(Inventory.component),
+        selectinload(Inventory.location)
+    ).filter(
         Inventory.user_id == current_user.id,
         Inventory.quantity > 0
     )
@@ -90,18 +142,23 @@ async def get_my_inventory(
             query = query.filter(Inventory.location_id.is_(None))
         else:
             query = query.filter(Inventory.location_id == location_id)
-    return query.all()
+    result = await db.execute(query)
+    return result.scalars().all()
 
 
 @router.get("/history", response_model=List[InventoryLogResponse])
 async def get_inventory_history(
     user_id: Optional[int] = None,
     limit: int = 50,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
     """Gibt die Lager-Historie zurück. Offiziere sehen nur eigene, Admins sehen alle."""
-    query = db.query(InventoryLog)
+    query = select(InventoryLog).options(
+        selectinload(InventoryLog.user),
+        selectinload(InventoryLog.component),
+        selectinload(InventoryLog.related_user)
+    )
 
     if user_id:
         # Spezifischer Benutzer angefragt
@@ -112,11 +169,12 @@ async def get_inventory_history(
         # Nicht-Admin sieht nur eigene Historie
         query = query.filter(InventoryLog.user_id == current_user.id)
 
-    return query.order_by(InventoryLog.created_at.desc()).limit(limit).all()
+    result = await db.execute(query.order_by(InventoryLog.created_at.desc()).limit(limit))
+    return result.scalars().all()
 
 
 @router.post("/{component_id}/add")
-async def add_to_inventory(
+def add_to_inventory(
     component_id: int,
     quantity: int = 1,
     location_id: Optional[int] = None,
@@ -187,7 +245,7 @@ async def add_to_inventory(
 
 
 @router.post("/{component_id}/remove")
-async def remove_from_inventory(
+def remove_from_inventory(
     component_id: int,
     quantity: int = 1,
     location_id: Optional[int] = None,
@@ -237,7 +295,7 @@ async def remove_from_inventory(
 
 
 @router.post("/{inventory_id}/set-location")
-async def set_item_location(
+def set_item_location(
     inventory_id: int,
     location_id: Optional[int] = None,
     db: Session = Depends(get_db),
@@ -272,7 +330,7 @@ async def set_item_location(
 
 
 @router.post("/bulk-move-location")
-async def bulk_move_location(
+def bulk_move_location(
     transfer: BulkLocationTransfer,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -289,45 +347,26 @@ async def bulk_move_location(
                 detail="Ziel-Standort nicht gefunden"
             )
 
-    # Alle Items am Quell-Standort finden
-    query = db.query(Inventory).filter(
+    # Alle Items am Quell-Standort zählen
+    moved_count = db.query(func.count(Inventory.id)).filter(
         Inventory.user_id == current_user.id,
-        Inventory.quantity > 0
-    )
+        Inventory.quantity > 0,
+        Inventory.location_id.is_not_distinct_from(transfer.from_location_id)
+    ).scalar()
 
-    if transfer.from_location_id is None:
-        query = query.filter(Inventory.location_id.is_(None))
-    else:
-        query = query.filter(Inventory.location_id == transfer.from_location_id)
-
-    items = query.all()
-
-    if not items:
+    if not moved_count:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Keine Items am Quell-Standort gefunden"
         )
 
-    # Items mit gleichem Ziel zusammenführen oder verschieben
-    moved_count = 0
-    for item in items:
-        # Prüfen ob am Ziel bereits ein Eintrag existiert
-        existing = db.query(Inventory).filter(
-            Inventory.user_id == current_user.id,
-            Inventory.component_id == item.component_id,
-            Inventory.location_id == transfer.to_location_id
-        ).first()
-
-        if existing and existing.id != item.id:
-            # Zusammenführen
-            existing.quantity += item.quantity
-            item.quantity = 0
-        else:
-            # Einfach verschieben
-            item.location_id = transfer.to_location_id
-
-        moved_count += 1
-
+    # Items mit gleichem Ziel zusammenführen oder verschieben (set-basiert, eine Transaktion)
+    if transfer.from_location_id != transfer.to_location_id:
+        _merge_into_location(
+            db, current_user.id,
+            lambda table: table.c.location_id.is_not_distinct_from(transfer.from_location_id),
+            transfer.to_location_id,
+        )
     db.commit()
 
     from_name = "Ohne Standort"
@@ -346,7 +385,7 @@ async def bulk_move_location(
 
 
 @router.post("/{item_id}/move-location")
-async def move_item_location(
+def move_item_location(
     item_id: int,
     to_location_id: Optional[int] = None,
     quantity: Optional[int] = None,
@@ -427,7 +466,7 @@ async def move_item_location(
 
 
 @router.post("/patch-reset")
-async def patch_reset(
+def patch_reset(
     request: PatchResetRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -449,8 +488,8 @@ async def patch_reset(
                 detail="Neue Location nicht gefunden"
             )
 
-    # Alle eigenen Items laden
-    all_items = db.query(Inventory).filter(
+    # Alle eigenen Items laden (nur die benötigten Spalten)
+    all_items = db.query(Inventory.id, Inventory.component_id, Inventory.quantity).filter(
         Inventory.user_id == current_user.id,
         Inventory.quantity > 0
     ).all()
@@ -468,70 +507,63 @@ async def patch_reset(
     adjusted_count = 0
     total_kept = 0
 
-    for item in all_items:
-        if item.id in kept_map:
-            new_qty = max(0, kept_map[item.id])
-            quantity_before = item.quantity
-
-            if new_qty == 0:
-                # Komplett entfernt trotz in kept_items
-                log_inventory_change(
-                    db=db, user_id=current_user.id, component_id=item.component_id,
-                    action=InventoryAction.REMOVE, quantity=-quantity_before,
-                    quantity_before=quantity_before, quantity_after=0,
-                    notes="Patch-Reset: Item verloren"
-                )
-                item.quantity = 0
-                removed_count += 1
-                continue
-
-            # Menge anpassen wenn nötig
-            if new_qty < quantity_before:
-                diff = quantity_before - new_qty
-                log_inventory_change(
-                    db=db, user_id=current_user.id, component_id=item.component_id,
-                    action=InventoryAction.REMOVE, quantity=-diff,
-                    quantity_before=quantity_before, quantity_after=new_qty,
-                    notes=f"Patch-Reset: Menge reduziert ({quantity_before} → {new_qty})"
-                )
-                item.quantity = new_qty
-                adjusted_count += 1
-
-            total_kept += item.quantity
-
-            # Umzug durchführen wenn gewünscht
-            if do_move and new_location:
-                existing = db.query(Inventory).filter(
-                    Inventory.user_id == current_user.id,
-                    Inventory.component_id == item.component_id,
-                    Inventory.location_id == request.new_location_id
-                ).first()
-
-                if existing and existing.id != item.id:
-                    existing.quantity += item.quantity
-                    item.quantity = 0
-                else:
-                    item.location_id = request.new_location_id
-
-                log_inventory_change(
-                    db=db, user_id=current_user.id, component_id=item.component_id,
-                    action=InventoryAction.ADD, quantity=0,
-                    quantity_before=item.quantity, quantity_after=item.quantity,
-                    notes=f"Patch-Reset: Verschoben nach {new_location.name}"
-                )
-
-            kept_count += 1
-        else:
-            # Item nicht in kept_items → verloren
-            quantity_before = item.quantity
-            log_inventory_change(
-                db=db, user_id=current_user.id, component_id=item.component_id,
-                action=InventoryAction.REMOVE, quantity=-item.quantity,
-                quantity_before=quantity_before, quantity_after=0,
-                notes="Patch-Reset: Item verloren"
-            )
-            item.quantity = 0
+    # Änderungen in Python bestimmen, danach gesammelt schreiben
+    new_quantities = []  # Zeilen mit geänderter Menge (0 = verloren)
+    logs = []
+
+    def log_row(component_id, action, quantity, quantity_before, quantity_after, notes):
+        logs.append({
+            "user_id": current_user.id, "component_id": component_id, "action": action,
+            "quantity": quantity, "quantity_before": quantity_before,
+            "quantity_after": quantity_after, "related_user_id": None, "notes": notes,
+        })
+
+    for item_id, component_id, quantity_before in all_items:
+        new_qty = max(0, kept_map[item_id]) if item_id in kept_map else 0
+
+        if new_qty == 0:
+            # Nicht in kept_items (oder Menge 0) → verloren
+            log_row(component_id, InventoryAction.REMOVE, -quantity_before,
+                    quantity_before, 0, "Patch-Reset: Item verloren")
+            new_quantities.append({"_id": item_id, "new_quantity": 0})
             removed_count += 1
+            continue
+
+        # Menge anpassen wenn nötig
+        quantity = quantity_before
+        if new_qty < quantity_before:
+            log_row(component_id, InventoryAction.REMOVE, -(quantity_before - new_qty),
+                    quantity_before, new_qty,
+                    f"Patch-Reset: Menge reduziert ({quantity_before} → {new_qty})")
+            new_quantities.append({"_id": item_id, "new_quantity": new_qty})
+            quantity = new_qty
+            adjusted_count += 1
+
+        total_kept += quantity
+
+        if do_move:
+            log_row(component_id, InventoryAction.ADD, 0, quantity, quantity,
+                    f"Patch-Reset: Verschoben nach {new_location.name}")
+
+        kept_count += 1
+
+    inv = Inventory.__table__
+    if new_quantities:
+        db.execute(
+            update(inv).where(inv.c.id == bindparam("_id")).values(quantity=bindparam("new_quantity")),
+            new_quantities,
+        )
+
+    # Umzug: alle verbliebenen Items an die neue Location (Zusammenführen per SQL)
+    if do_move:
+        _merge_into_location(
+            db, current_user.id,
+            lambda table: table.c.location_id.is_distinct_from(request.new_location_id),
+            request.new_location_id,
+        )
+
+    if logs:
+        db.execute(InventoryLog.__table__.insert(), logs)
 
     db.commit()
 
@@ -547,7 +579,7 @@ async def patch_reset(
 
 
 @router.post("/bulk-transfer-to-officer")
-async def bulk_transfer_to_officer(
+def bulk_transfer_to_officer(
     transfer: BulkTransferToOfficer,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -685,7 +717,7 @@ async def bulk_transfer_to_officer(
 
 
 @router.post("/transfer", response_model=TransferResponse)
-async def transfer_components(
+def transfer_components(
     transfer: TransferCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -808,20 +840,29 @@ async def transfer_components(
 
 @router.get("/transfers", response_model=List[TransferResponse])
 async def get_transfers(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
     """Gibt alle Transfers zurück, an denen der aktuelle Benutzer beteiligt ist."""
-    return db.query(InventoryTransfer).filter(
-        (InventoryTransfer.from_user_id == current_user.id) |
-        (InventoryTransfer.to_user_id == current_user.id)
-    ).order_by(InventoryTransfer.created_at.desc()).all()
+    result = await db.execute(
+        select(InventoryTransfer).options(
+            selectinload(InventoryTransfer.from_user),
+            selectinload(InventoryTransfer.to_user),
+            selectinload(InventoryTransfer.component),
+            selectinload(InventoryTransfer.from_location),
+            selectinload(InventoryTransfer.to_location)
+        ).filter(
+            (InventoryTransfer.from_user_id == current_user.id) |
+            (InventoryTransfer.to_user_id == current_user.id)
+        ).order_by(InventoryTransfer.created_at.desc())
+    )
+    return result.scalars().all()
 
 
 # ============== Admin-Endpoints ==============
 
 @router.post("/admin/{user_id}/{component_id}/add")
-async def admin_add_to_inventory(
+def admin_add_to_inventory(
     user_id: int,
     component_id: int,
     quantity: int = 1,
@@ -903,7 +944,7 @@ async def admin_add_to_inventory(
 
 
 @router.post("/admin/{user_id}/{component_id}/remove")
-async def admin_remove_from_inventory(
+def admin_remove_from_inventory(
     user_id: int,
     component_id: int,
     quantity: int = 1,
@@ -966,7 +1007,7 @@ async def admin_remove_from_inventory(
 # ============== Transfer Request Endpoints ==============
 
 @router.post("/transfer-request", response_model=TransferRequestResponse)
-async def create_transfer_request(
+def create_transfer_request(
     request: TransferRequestCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -1041,6 +1082,7 @@ async def create_transfer_request(
     )
     db.add(transfer_request)
     db.commit()
+    _publish_transfer_change(transfer_request)
     db.refresh(transfer_request)
     return transfer_request
 
@@ -1071,7 +1113,7 @@ def filter_pioneer_comment_inline(request: TransferRequest, is_pioneer_or_admin:
 
 
 @router.get("/transfer-requests", response_model=List[TransferRequestResponse])
-async def get_transfer_requests(
+def get_transfer_requests(
     status_filter: Optional[TransferRequestStatus] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -1096,112 +1138,76 @@ async def get_transfer_requests(
     return [filter_pioneer_comment_inline(r, is_pioneer_or_admin) for r in requests]
 
 
-@router.get("/transfer-requests/pending/count")
-async def get_pending_requests_count(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-):
-    """Gibt die Anzahl offener Anfragen zurück (für Benachrichtigungs-Badge)."""
-    # Als Besitzer/Pioneer: Anfragen die ich freigeben muss (PENDING)
-    # Pioneers sehen auch Anfragen für andere Pioneer-Lager
-    if current_user.is_pioneer:
-        # Pioneer: eigene + andere Pioneer-Anfragen (PENDING)
-        owner_pending = db.query(TransferRequest).join(
-            User, TransferRequest.owner_id == User.id
-        ).filter(
-            TransferRequest.status == TransferRequestStatus.PENDING,
-            or_(
-                TransferRequest.owner_id == current_user.id,
-                User.is_pioneer == True
-            )
-        ).count()
-        # Pioneer: Anfragen die ich ausliefern muss (APPROVED)
-        owner_approved = db.query(TransferRequest).join(
-            User, TransferRequest.owner_id == User.id
-        ).filter(
-            TransferRequest.status == TransferRequestStatus.APPROVED,
+def _publish_transfer_change(transfer_request: TransferRequest) -> None:
+    """Meldet eine geänderte Anfrage an Anfragenden und Besitzer (plus Pioneers/Admins)."""
+    transfer_event_bus.publish([transfer_request.requester_id, transfer_request.owner_id])
+
+
+def compute_pending_counts(db: Session, current_user: User) -> dict:
+    """Berechnet die Badge-Zähler offener Transfer-Anfragen für einen User.
+
+    Alle Zähler kommen aus einer einzigen Query mit bedingter Aggregation
+    (SUM(CASE ...)), also ein Roundtrip pro Badge-Aktualisierung.
+    """
+    Owner = aliased(User)
+    is_owner = TransferRequest.owner_id == current_user.id
+    is_requester = TransferRequest.requester_id == current_user.id
+    is_pending = TransferRequest.status == TransferRequestStatus.PENDING
+    is_approved = TransferRequest.status == TransferRequestStatus.APPROVED
+    is_awaiting = TransferRequest.status == TransferRequestStatus.AWAITING_RECEIPT
+
+    # Als Besitzer/Pioneer: Pioneers sehen auch Anfragen für andere Pioneer-Lager
+    owner_scope = or_(is_owner, Owner.is_pioneer == True) if current_user.is_pioneer else is_owner
+
+    def count_if(condition):
+        return func.sum(case((condition, 1), else_=0))
+
+    columns = [
+        # Als Besitzer/Pioneer: Anfragen die ich freigeben muss (PENDING)
+        count_if(and_(owner_scope, is_pending)),
+        # Als Besitzer/Pioneer: Anfragen die ich ausliefern muss (APPROVED)
+        count_if(and_(owner_scope, is_approved)),
+        # Als Anfragender: Meine Anfragen die noch auf Freigabe warten (PENDING)
+        count_if(and_(is_requester, is_pending)),
+        # Als Anfragender: Meine Anfragen die freigegeben wurden - Discord-Koordination (APPROVED)
+        count_if(and_(is_requester, is_approved)),
+        # Als Empfänger: Anfragen wo ich Erhalt bestätigen muss (AWAITING_RECEIPT)
+        count_if(and_(is_requester, is_awaiting)),
+        # Als Owner: Anfragen die ich ausgeliefert habe, warte auf Empfängerbestätigung
+        count_if(and_(is_owner, is_awaiting)),
+        # Admin sieht auch AWAITING_RECEIPT von anderen (falls User inaktiv)
+        count_if(and_(TransferRequest.requester_id != current_user.id, is_awaiting)),
+    ]
+
+    # Ungelesen: eigene offene Anfragen, die nach last_seen_transfers erstellt/geändert wurden
+    if current_user.last_seen_transfers is not None:
+        columns.append(count_if(and_(
+            or_(is_owner, is_requester),
             or_(
-                TransferRequest.owner_id == current_user.id,
-                User.is_pioneer == True
+                TransferRequest.updated_at > current_user.last_seen_transfers,
+                TransferRequest.created_at > current_user.last_seen_transfers
             )
-        ).count()
-    else:
-        # Normale User: nur eigene
-        owner_pending = db.query(TransferRequest).filter(
-            TransferRequest.owner_id == current_user.id,
-            TransferRequest.status == TransferRequestStatus.PENDING
-        ).count()
-        owner_approved = db.query(TransferRequest).filter(
-            TransferRequest.owner_id == current_user.id,
-            TransferRequest.status == TransferRequestStatus.APPROVED
-        ).count()
-
-    # Als Anfragender: Meine Anfragen die noch auf Freigabe warten (PENDING)
-    requester_pending = db.query(TransferRequest).filter(
-        TransferRequest.requester_id == current_user.id,
-        TransferRequest.status == TransferRequestStatus.PENDING
-    ).count()
-
-    # Als Anfragender: Meine Anfragen die freigegeben wurden - Discord-Koordination (APPROVED)
-    requester_approved = db.query(TransferRequest).filter(
-        TransferRequest.requester_id == current_user.id,
-        TransferRequest.status == TransferRequestStatus.APPROVED
-    ).count()
-
-    # Als Empfänger: Anfragen wo ich Erhalt bestätigen muss (AWAITING_RECEIPT)
-    awaiting_receipt = db.query(TransferRequest).filter(
-        TransferRequest.requester_id == current_user.id,
-        TransferRequest.status == TransferRequestStatus.AWAITING_RECEIPT
-    ).count()
-
-    # Als Owner: Anfragen die ich ausgeliefert habe, warte auf Empfängerbestätigung
-    owner_awaiting = db.query(TransferRequest).filter(
-        TransferRequest.owner_id == current_user.id,
-        TransferRequest.status == TransferRequestStatus.AWAITING_RECEIPT
-    ).count()
-
-    # Admin sieht auch AWAITING_RECEIPT von anderen (falls User inaktiv)
-    admin_awaiting = 0
-    if current_user.has_permission(UserRole.ADMIN):
-        admin_awaiting = db.query(TransferRequest).filter(
-            TransferRequest.requester_id != current_user.id,
-            TransferRequest.status == TransferRequestStatus.AWAITING_RECEIPT
-        ).count()
-
-    # Prüfe ob es ungelesene Anfragen gibt (neuer als last_seen_transfers)
-    has_unread = False
+        )))
+
+    row = db.query(*columns).select_from(TransferRequest).join(
+        Owner, TransferRequest.owner_id == Owner.id
+    ).filter(
+        TransferRequest.status.in_([
+            TransferRequestStatus.PENDING,
+            TransferRequestStatus.APPROVED,
+            TransferRequestStatus.AWAITING_RECEIPT,
+        ])
+    ).one()
+    counts = [value or 0 for value in row]
+
+    owner_pending, owner_approved, requester_pending, requester_approved, awaiting_receipt, owner_awaiting = counts[:6]
+    admin_awaiting = counts[6] if current_user.has_permission(UserRole.ADMIN) else 0
+
     if current_user.last_seen_transfers is None:
         # Noch nie gesehen → ungelesen wenn es überhaupt offene gibt
         has_unread = (owner_pending + owner_approved + requester_pending + requester_approved + awaiting_receipt) > 0
     else:
-        # Gibt es Anfragen die neuer sind als last_seen?
-        unread_count = db.query(TransferRequest).filter(
-            or_(
-                TransferRequest.owner_id == current_user.id,
-                TransferRequest.requester_id == current_user.id,
-            ),
-            TransferRequest.status.in_([
-                TransferRequestStatus.PENDING,
-                TransferRequestStatus.APPROVED,
-                TransferRequestStatus.AWAITING_RECEIPT,
-            ]),
-            TransferRequest.updated_at > current_user.last_seen_transfers
-        ).count()
-        # Auch neue Anfragen ohne update_at prüfen (created_at)
-        if unread_count == 0:
-            unread_count = db.query(TransferRequest).filter(
-                or_(
-                    TransferRequest.owner_id == current_user.id,
-                    TransferRequest.requester_id == current_user.id,
-                ),
-                TransferRequest.status.in_([
-                    TransferRequestStatus.PENDING,
-                    TransferRequestStatus.APPROVED,
-                    TransferRequestStatus.AWAITING_RECEIPT,
-                ]),
-                TransferRequest.created_at > current_user.last_seen_transfers
-            ).count()
-        has_unread = unread_count > 0
+        has_unread = counts[7] > 0
 
     return {
         "as_owner_pending": owner_pending,
@@ -1216,19 +1222,109 @@ async def get_pending_requests_count(
     }
 
 
+@router.get("/transfer-requests/pending/count")
+def get_pending_requests_count(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Gibt die Anzahl offener Anfragen zurück (für Benachrichtigungs-Badge)."""
+    return compute_pending_counts(db, current_user)
+
+
+def _load_pending_counts(user_id: int) -> Optional[tuple[dict, bool]]:
+    """Lädt User und Zähler mit eigener Session (läuft im Threadpool).
+
+    Gibt (Zähler, Gesamtsicht) zurück; Gesamtsicht haben Pioneers und Admins,
+    deren Zähler auch von fremden Anfragen abhängen.
+    """
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.id == user_id).first()
+        if user is None:
+            return None
+        sees_all = user.is_pioneer or user.has_permission(UserRole.ADMIN)
+        return compute_pending_counts(db, user), sees_all
+    finally:
+        db.close()
+
+
+@router.post("/transfer-requests/stream-ticket")
+def create_transfer_stream_ticket(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    current_user: User = Depends(get_current_user)
+):
+    """Stellt ein kurzlebiges Ticket für den SSE-Stream aus.
+
+    EventSource kann keine Header setzen; statt des JWT steht so nur ein
+    Ticket in der URL, das nach wenigen Sekunden nutzlos ist.
+    """
+    payload = verify_token(credentials.credentials)
+    return {"ticket": create_stream_ticket(current_user.id, int(payload["exp"]))}
+
+
+@router.get("/transfer-requests/stream")
+async def stream_pending_requests_count(request: Request, ticket: str):
+    """Server-Sent Events: sendet die Badge-Zähler bei jeder Änderung an Transfer-Anfragen.
+
+    Authentifiziert über ein Ticket von POST /transfer-requests/stream-ticket.
+    Läuft der Access-Token ab, wird der Stream mit einem "expired"-Event beendet.
+    """
+    verified = verify_stream_ticket(ticket)
+    if verified is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Ungültiges oder abgelaufenes Stream-Ticket"
+        )
+    user_id, token_exp = verified
+
+    async def event_stream():
+        queue = transfer_event_bus.subscribe(user_id)
+        try:
+            while True:
+                loaded = await run_in_threadpool(_load_pending_counts, user_id)
+                if loaded is None:
+                    break
+                counts, sees_all = loaded
+                transfer_event_bus.set_scope(queue, sees_all)
+                yield f"data: {json.dumps(counts)}\n\n"
+
+                # Auf nächste Änderung warten, zwischendurch Keepalive senden
+                while True:
+                    if time.time() >= token_exp:
+                        yield "event: expired\ndata: {}\n\n"
+                        return
+                    try:
+                        timeout = min(SSE_KEEPALIVE_SECONDS, token_exp - time.time())
+                        await asyncio.wait_for(queue.get(), timeout=timeout)
+                        break
+                    except asyncio.TimeoutError:
+                        if await request.is_disconnected():
+                            return
+                        yield ": keepalive\n\n"
+        finally:
+            transfer_event_bus.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.post("/transfer-requests/mark-seen")
-async def mark_transfers_seen(
+def mark_transfers_seen(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Markiert alle Transfer-Requests als gesehen (aktualisiert last_seen_transfers)."""
     current_user.last_seen_transfers = datetime.now(timezone.utc)
     db.commit()
+    transfer_event_bus.publish([current_user.id])
     return {"ok": True}
 
 
 @router.get("/transfer-requests/summary")
-async def get_transfer_requests_summary(
+def get_transfer_requests_summary(
     size: Optional[int] = None,
     grade: Optional[str] = None,
     sub_category: Optional[str] = None,
@@ -1288,7 +1384,7 @@ async def get_transfer_requests_summary(
 
 
 @router.post("/transfer-requests/{request_id}/approve")
-async def approve_transfer_request(
+def approve_transfer_request(
     request_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -1343,6 +1439,7 @@ async def approve_transfer_request(
     transfer_request.approved_by_id = current_user.id
 
     db.commit()
+    _publish_transfer_change(transfer_request)
     return {
         "message": "Anfrage freigegeben - bitte Übergabetermin über Discord vereinbaren",
         "order_number": transfer_request.order_number
@@ -1350,7 +1447,7 @@ async def approve_transfer_request(
 
 
 @router.post("/transfer-requests/{request_id}/deliver")
-async def mark_as_delivered(
+def mark_as_delivered(
     request_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -1405,11 +1502,12 @@ async def mark_as_delivered(
     transfer_request.delivered_by_id = current_user.id
 
     db.commit()
+    _publish_transfer_change(transfer_request)
     return {"message": "Als ausgeliefert markiert - wartet auf Empfänger-Bestätigung"}
 
 
 @router.post("/transfer-requests/{request_id}/confirm-receipt")
-async def confirm_receipt(
+def confirm_receipt(
     request_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -1523,11 +1621,12 @@ async def confirm_receipt(
     transfer_request.confirmed_by_id = current_user.id
 
     db.commit()
+    _publish_transfer_change(transfer_request)
     return {"message": "Erhalt bestätigt - Transfer abgeschlossen"}
 
 
 @router.post("/transfer-requests/{request_id}/reject")
-async def reject_transfer_request(
+def reject_transfer_request(
     request_id: int,
     rejection: TransferRequestReject,
     db: Session = Depends(get_db),
@@ -1574,6 +1673,7 @@ async def reject_transfer_request(
     transfer_request.rejection_reason = rejection.reason.strip()
 
     db.commit()
+    _publish_transfer_change(transfer_request)
     return {"message": "Transfer-Anfrage abgelehnt"}
 
 
@@ -1609,7 +1709,7 @@ def filter_pioneer_comment(request: TransferRequest, current_user: User) -> dict
 
 
 @router.get("/transfer-requests/search", response_model=List[TransferRequestResponse])
-async def search_transfer_requests(
+def search_transfer_requests(
     q: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -1650,7 +1750,7 @@ async def search_transfer_requests(
 
 
 @router.post("/transfer-requests/{request_id}/comment")
-async def update_transfer_request_comment(
+def update_transfer_request_comment(
     request_id: int,
     comment: TransferRequestCommentUpdate,
     db: Session = Depends(get_db),
@@ -1690,11 +1790,12 @@ async def update_transfer_request_comment(
         )
 
     db.commit()
+    _publish_transfer_change(transfer_request)
     return {"message": f"{', '.join(updated_fields)} aktualisiert"}
 
 
 @router.get("/transfer-requests/{request_id}", response_model=TransferRequestResponse)
-async def get_transfer_request(
+def get_transfer_request(
     request_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -1730,8 +1831,8 @@ async def get_transfer_request(
 @router.get("/search-component", response_model=list)
 async def search_component_in_pioneer_inventory(
     q: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
     """Sucht nach einer Komponente in allen Pioneer-Lagern.
     Zeigt welcher Pioneer sie hat, wo und wie viele.
@@ -1739,31 +1840,28 @@ async def search_component_in_pioneer_inventory(
     if not q or len(q.strip()) < 2:
         return []
 
-    search_term = q.strip().lower()
-    normalized_search = normalize_search(search_term)
-
-    # Alle Pioneer-Inventare mit quantity > 0 laden
-    all_inventory = db.query(Inventory).join(
-        User, Inventory.user_id == User.id
-    ).join(
-        Component, Inventory.component_id == Component.id
-    ).filter(
-        User.is_pioneer == True,
-        Inventory.quantity > 0
-    ).all()
-
-    # Fuzzy Filter im Python-Code
-    results = []
-    for inv in all_inventory:
-        name_normalized = normalize_search(inv.component.name)
-        manufacturer_normalized = normalize_search(inv.component.manufacturer or "")
+    normalized_search = normalize_search(q.strip())
+    if not normalized_search:
+        return []
 
-        # Match wenn normalisierte Suche im normalisierten Namen oder Hersteller enthalten ist
-        if normalized_search in name_normalized or normalized_search in manufacturer_normalized:
-            results.append(inv)
-        # Zusätzlich: Original-Suche als Fallback (z.B. für exakte Treffer)
-        elif search_term in inv.component.name.lower() or search_term in (inv.component.manufacturer or "").lower():
-            results.append(inv)
+    # Pioneer-Inventare mit quantity > 0, Fuzzy-Filter in SQL
+    # (normalisierte Suche in Name/Hersteller über den Trigram-Index)
+    result = await db.execute(
+        select(Inventory).join(
+            User, Inventory.user_id == User.id
+        ).join(
+            Component, Inventory.component_id == Component.id
+        ).options(
+            selectinload(Inventory.user),
+            selectinload(Inventory.component),
+            selectinload(Inventory.location)
+        ).filter(
+            User.is_pioneer == True,
+            Inventory.quantity > 0,
+            component_search_filter(normalized_search, db.get_bind().dialect.name)
+        )
+    )
+    results = result.scalars().all()
 
     # Gruppieren nach Komponente und formatieren
     response = []
@@ -1804,61 +1902,89 @@ async def search_component_in_pioneer_inventory(
 
 @router.get("/dashboard", response_model=InventoryDashboardResponse)
 async def get_inventory_dashboard(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
-    """Dashboard-Übersicht aller Pioneer-Lager mit Statistiken."""
+    """Dashboard-Übersicht aller Pioneer-Lager mit Statistiken.
 
-    # Alle Pioneers mit Inventar laden
-    pioneers = db.query(User).filter(User.is_pioneer == True).all()
+    Alle Zahlen werden per GROUP BY in der Datenbank aggregiert (3 Queries,
+    unabhängig von Anzahl Pioneers und Lager-Einträgen).
+    """
 
-    pioneer_stats = []
-    total_items = 0
-    total_quantity = 0
+    # 1) Pioneers
+    result = await db.execute(select(User).filter(User.is_pioneer == True))
+    pioneers = {p.id: p for p in result.scalars().all()}
+
+    # 2) Aggregation pro Pioneer und Standort
+    result = await db.execute(
+        select(
+            Inventory.user_id,
+            Inventory.location_id,
+            Location.name,
+            Location.description,
+            func.count(Inventory.id),
+            func.sum(Inventory.quantity)
+        ).join(
+            User, Inventory.user_id == User.id
+        ).outerjoin(
+            Location, Inventory.location_id == Location.id
+        ).filter(
+            User.is_pioneer == True,
+            Inventory.quantity > 0
+        ).group_by(
+            Inventory.user_id, Inventory.location_id, Location.name, Location.description
+        )
+    )
+    by_location = {}
+    for user_id, loc_id, loc_name, loc_description, item_count, qty_sum in result.all():
+        by_location.setdefault(user_id, []).append({
+            "location": {
+                "id": loc_id,
+                "name": loc_name,
+                "description": loc_description
+            } if loc_id is not None and loc_name is not None else None,
+            "item_count": item_count,
+            "total_quantity": qty_sum or 0
+        })
 
-    for pioneer in pioneers:
-        # Inventar des Pioneers laden
-        inventory = db.query(Inventory).filter(
-            Inventory.user_id == pioneer.id,
+    # 3) Aggregation pro Pioneer und Kategorie (leere Kategorie = "Unbekannt")
+    category = func.coalesce(func.nullif(Component.category, ""), "Unbekannt")
+    result = await db.execute(
+        select(
+            Inventory.user_id,
+            category,
+            func.count(Inventory.id),
+            func.sum(Inventory.quantity)
+        ).join(
+            User, Inventory.user_id == User.id
+        ).join(
+            Component, Inventory.component_id == Component.id
+        ).filter(
+            User.is_pioneer == True,
             Inventory.quantity > 0
-        ).all()
+        ).group_by(
+            Inventory.user_id, category
+        )
+    )
+    by_category = {}
+    for user_id, cat, item_count, qty_sum in result.all():
+        by_category.setdefault(user_id, []).append({
+            "category": cat,
+            "item_count": item_count,
+            "total_quantity": qty_sum or 0
+        })
 
-        if not inventory:
-            continue
+    pioneer_stats = []
+    total_items = 0
+    total_quantity = 0
 
-        # Statistiken berechnen
-        items_count = len(inventory)
-        qty_sum = sum(i.quantity for i in inventory)
+    for pioneer_id, locations in by_location.items():
+        pioneer = pioneers[pioneer_id]
+        items_count = sum(loc["item_count"] for loc in locations)
+        qty_sum = sum(loc["total_quantity"] for loc in locations)
         total_items += items_count
         total_quantity += qty_sum
 
-        # Nach Standort gruppieren
-        by_location = {}
-        for inv in inventory:
-            loc_key = inv.location_id or 0
-            loc_name = inv.location.name if inv.location else "Ohne Standort"
-            if loc_key not in by_location:
-                by_location[loc_key] = {
-                    "location": {
-                        "id": inv.location.id,
-                        "name": inv.location.name,
-                        "description": inv.location.description
-                    } if inv.location else None,
-                    "item_count": 0,
-                    "total_quantity": 0
-                }
-            by_location[loc_key]["item_count"] += 1
-            by_location[loc_key]["total_quantity"] += inv.quantity
-
-        # Nach Kategorie gruppieren
-        by_category = {}
-        for inv in inventory:
-            cat = inv.component.category or "Unbekannt"
-            if cat not in by_category:
-                by_category[cat] = {"category": cat, "item_count": 0, "total_quantity": 0}
-            by_category[cat]["item_count"] += 1
-            by_category[cat]["total_quantity"] += inv.quantity
-
         pioneer_stats.append({
             "pioneer": {
                 "id": pioneer.id,
@@ -1874,8 +2000,8 @@ async def get_inventory_dashboard(
             },
             "total_items": items_count,
             "total_quantity": qty_sum,
-            "by_location": sorted(by_location.values(), key=lambda x: x["total_quantity"], reverse=True),
-            "by_category": sorted(by_category.values(), key=lambda x: x["total_quantity"], reverse=True)
+            "by_location": sorted(locations, key=lambda x: x["total_quantity"], reverse=True),
+            "by_category": sorted(by_category.get(pioneer_id, []), key=lambda x: x["total_quantity"], reverse=True)
         })
 
     # Nach Gesamtmenge sortieren
@@ -2,6 +2,7 @@
 
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session, joinedload
 
 from app.database import get_db
@@ -11,6 +12,7 @@ from app.models.user import User, UserRole
 from app.models.loadout import Ship, ShipHardpoint, MetaLoadout, MetaLoadoutItem, UserLoadout
 from app.models.inventory import Inventory
 from app.models.component import Component
+from app.services.http_clients import http_clients
 from app.schemas.loadout import (
     ShipResponse, ShipWithHardpointsResponse, ShipCreate,
     MetaLoadoutResponse, MetaLoadoutListResponse,
@@ -28,7 +30,7 @@ router = APIRouter()
 # ============== Schiffe ==============
 
 @router.get("/ships", response_model=list[ShipResponse])
-async def list_ships(
+def list_ships(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -38,7 +40,7 @@ async def list_ships(
 
 
 @router.get("/ships/search")
-async def search_ships(
+def search_ships(
     q: str = "",
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -61,7 +63,7 @@ async def search_ships(
 
 
 @router.get("/ships/{ship_id}", response_model=ShipWithHardpointsResponse)
-async def get_ship(
+def get_ship(
     ship_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -74,7 +76,7 @@ async def get_ship(
 
 
 @router.post("/ships", response_model=ShipWithHardpointsResponse)
-async def create_ship(
+def create_ship(
     data: ShipCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -90,7 +92,7 @@ async def create_ship(
 
 
 @router.post("/ships/{ship_id}/import-hardpoints", response_model=ShipWithHardpointsResponse)
-async def import_hardpoints(
+def import_hardpoints(
     ship_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -116,7 +118,7 @@ async def import_hardpoints(
 
 
 @router.post("/ships/import-by-slug", response_model=ShipWithHardpointsResponse)
-async def import_ship_by_slug(
+def import_ship_by_slug(
     slug: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -138,7 +140,7 @@ async def import_ship_by_slug(
 # ============== Meine gefitteten Schiffe (UserLoadouts) ==============
 
 @router.get("/my-ships", response_model=list[UserLoadoutResponse])
-async def list_my_ships(
+def list_my_ships(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -158,7 +160,7 @@ async def list_my_ships(
 
 
 @router.post("/my-ships", response_model=UserLoadoutResponse)
-async def create_my_ship(
+def create_my_ship(
     data: UserLoadoutCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -192,7 +194,7 @@ async def create_my_ship(
 
 
 @router.patch("/my-ships/{user_loadout_id}", response_model=UserLoadoutResponse)
-async def update_my_ship(
+def update_my_ship(
     user_loadout_id: int,
     data: UserLoadoutUpdate,
     db: Session = Depends(get_db),
@@ -223,7 +225,7 @@ async def update_my_ship(
 
 
 @router.delete("/my-ships/{user_loadout_id}")
-async def delete_my_ship(
+def delete_my_ship(
     user_loadout_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -246,7 +248,7 @@ async def delete_my_ship(
 # ============== Officer/Admin: Alle UserLoadouts ==============
 
 @router.get("/user-ships", response_model=list[UserLoadoutWithUser])
-async def list_all_user_ships(
+def list_all_user_ships(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -264,7 +266,7 @@ async def list_all_user_ships(
 
 
 @router.get("/user-ships/{user_id}", response_model=list[UserLoadoutWithUser])
-async def list_user_ships(
+def list_user_ships(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -287,7 +289,7 @@ async def list_user_ships(
 # ============== Meta-Loadouts ==============
 
 @router.get("/", response_model=list[MetaLoadoutListResponse])
-async def list_loadouts(
+def list_loadouts(
     ship_id: Optional[int] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -305,7 +307,7 @@ async def list_loadouts(
 
 
 @router.get("/{loadout_id}", response_model=MetaLoadoutResponse)
-async def get_loadout(
+def get_loadout(
     loadout_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -343,7 +345,7 @@ async def get_loadout(
 
 
 @router.post("/", response_model=MetaLoadoutResponse)
-async def create_loadout(
+def create_loadout(
     data: MetaLoadoutCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -372,7 +374,7 @@ async def create_loadout(
 
 
 @router.patch("/{loadout_id}", response_model=MetaLoadoutResponse)
-async def update_loadout(
+def update_loadout(
     loadout_id: int,
     data: MetaLoadoutUpdate,
     db: Session = Depends(get_db),
@@ -399,7 +401,7 @@ async def update_loadout(
 
 
 @router.delete("/{loadout_id}")
-async def delete_loadout(
+def delete_loadout(
     loadout_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -417,7 +419,7 @@ async def delete_loadout(
 
 
 @router.post("/{loadout_id}/items", response_model=MetaLoadoutResponse)
-async def set_loadout_items(
+def set_loadout_items(
     loadout_id: int,
     data: MetaLoadoutItemsSet,
     db: Session = Depends(get_db),
@@ -461,14 +463,13 @@ async def set_loadout_items(
 # ============== Erkul Import ==============
 
 @router.post("/{loadout_id}/import-erkul", response_model=ErkulImportResponse)
-async def import_from_erkul(
+def import_from_erkul(
     loadout_id: int,
     data: ErkulImportRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Loadout-Items von Erkul.games importieren (Officer+)."""
-    import httpx
     import base64
     import json
     import re
@@ -486,16 +487,11 @@ async def import_from_erkul(
 
     # Erkul API abrufen
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                f"https://server.erkul.games/loadouts/{code}",
-                headers={
-                    "Origin": "https://www.erkul.games",
-                    "Referer": "https://www.erkul.games/",
-                },
-            )
-            resp.raise_for_status()
-            erkul_data = resp.json()
+        resp = http_clients.get_sync("erkul").get(
+            f"https://server.erkul.games/loadouts/{code}", timeout=10.0
+        )
+        resp.raise_for_status()
+        erkul_data = resp.json()
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"Erkul API Fehler: {str(e)}")
 
@@ -630,12 +626,18 @@ async def import_from_erkul(
 
 # ============== Erkul Hilfsfunktionen ==============
 
-import httpx as _httpx
+import asyncio as _asyncio
 import base64 as _base64
 import json as _json
 import re as _re
 from datetime import date as _date
 
+from app.config import get_settings as _get_settings
+from app.services.erkul_cache import get_cached_loadout, store_loadout
+from app.services.fleetyards_import import (
+    fetch_ship_async, search_ships_fleetyards_async, store_ship_from_fleetyards
+)
+
 _ERKUL_TYPE_MAP = {
     "power-plant": "power_plant", "cooler": "cooler", "shield": "shield",
     "qdrive": "quantum_drive", "weapon": "weapon_gun", "mount": "weapon_gun",
@@ -651,20 +653,50 @@ def _parse_erkul_code(url_or_code: str) -> str:
 
 
 async def _fetch_erkul(code: str) -> dict:
-    """Erkul-Loadout abrufen und dekodieren."""
-    async with _httpx.AsyncClient(timeout=15.0) as client:
-        resp = await client.get(
-            f"https://server.erkul.games/loadouts/{code}",
-            headers={"Origin": "https://www.erkul.games", "Referer": "https://www.erkul.games/"},
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    """Erkul-Loadout abrufen und dekodieren (mit Datei-Cache)."""
+    cached = get_cached_loadout(code)
+    if cached is not None:
+        return cached
+
+    async with http_clients.async_session("erkul") as client:
+        resp = await client.get(f"https://server.erkul.games/loadouts/{code}")
+    resp.raise_for_status()
+    data = resp.json()
     loadout_json = _json.loads(_base64.b64decode(data["loadout"]))
-    return {
+    result = {
         "erkul_name": data.get("name", ""),
         "ship_local": loadout_json.get("ship", {}).get("localName", ""),
         "items": loadout_json.get("loadout", []),
     }
+    store_loadout(code, result)
+    return result
+
+
+async def _fetch_erkul_many(codes: list[str]) -> dict:
+    """Mehrere Erkul-Loadouts parallel abrufen (begrenzt).
+    Gibt code -> Loadout-Dict oder Exception zurück."""
+    semaphore = _asyncio.Semaphore(_get_settings().erkul_fetch_concurrency)
+
+    async def fetch(code: str):
+        async with semaphore:
+            try:
+                return code, await _fetch_erkul(code)
+            except Exception as e:
+                return code, e
+
+    unique_codes = list(dict.fromkeys(c for c in codes if c))
+    return dict(await _asyncio.gather(*[fetch(code) for code in unique_codes]))
+
+
+def _component_class_map(db: Session) -> dict:
+    """class_name (lowercase) -> Component-ID, einmal für den ganzen Import geladen."""
+    class_map = {}
+    rows = db.query(Component.id, Component.class_name).filter(
+        Component.class_name.isnot(None)
+    ).order_by(Component.id).all()
+    for component_id, class_name in rows:
+        class_map.setdefault(class_name.lower(), component_id)
+    return class_map
 
 
 def _extract_erkul_components(erkul_items: list) -> list[tuple[str, str]]:
@@ -690,27 +722,52 @@ def _extract_erkul_components(erkul_items: list) -> list[tuple[str, str]]:
     return result
 
 
-def _resolve_ship_from_erkul(db: Session, ship_local: str) -> Ship | None:
-    """Schiff anhand von Erkul localName in DB finden oder von FleetYards importieren."""
-    # Aus localName ableiten (z.B. "aegs_gladius" -> "gladius")
+def _erkul_search_term(ship_local: str) -> str:
+    """Suchbegriff aus Erkul localName ableiten (z.B. "aegs_gladius" -> "gladius")."""
     parts = ship_local.split("_", 1)
-    search_term = parts[1].replace("_", " ") if len(parts) > 1 else ship_local
+    return parts[1].replace("_", " ") if len(parts) > 1 else ship_local
+
+
+def _find_erkul_ship(db: Session, ship_local: str) -> Ship | None:
+    return db.query(Ship).filter(Ship.name.ilike(f"%{_erkul_search_term(ship_local)}%")).first()
 
-    # In DB suchen
-    ship = db.query(Ship).filter(Ship.name.ilike(f"%{search_term}%")).first()
+
+def _erkul_ships_missing(db: Session, ship_locals: list[str]) -> list[str]:
+    """Schiffe, die nicht in der DB sind und bei FleetYards gesucht werden müssen."""
+    return [ship_local for ship_local in dict.fromkeys(ship_locals) if not _find_erkul_ship(db, ship_local)]
+
+
+async def _fetch_fleetyards_ships(ship_locals: list[str]) -> dict:
+    """FleetYards-Suche + Schiffsdaten parallel über den async Client.
+    Gibt ship_local -> (slug, model_data, hardpoint_data) oder None zurück."""
+    async def fetch(ship_local: str):
+        try:
+            results = await search_ships_fleetyards_async(_erkul_search_term(ship_local))
+            if not results:
+                return ship_local, None
+            slug = results[0]["slug"]
+            return ship_local, (slug, *await fetch_ship_async(slug))
+        except Exception:
+            return ship_local, None
+
+    return dict(await _asyncio.gather(*[fetch(ship_local) for ship_local in ship_locals]))
+
+
+def _resolve_ship_from_erkul(db: Session, ship_local: str, fleetyards: dict) -> Ship | None:
+    """Schiff anhand von Erkul localName in DB finden oder aus den FleetYards-Daten anlegen."""
+    ship = _find_erkul_ship(db, ship_local)
     if ship:
         return ship
 
-    # FleetYards Fallback
-    from app.services.fleetyards_import import search_ships_fleetyards, import_ship_from_fleetyards
-    results = search_ships_fleetyards(search_term)
-    if results:
-        slug = results[0]["slug"]
+    # FleetYards Fallback (vorab im Event-Loop abgerufen)
+    found = fleetyards.get(ship_local)
+    if found:
+        slug, model_data, hardpoint_data = found
         existing = db.query(Ship).filter(Ship.slug == slug).first()
         if existing:
             return existing
         try:
-            ship = import_ship_from_fleetyards(db, slug)
+            ship = store_ship_from_fleetyards(db, slug, model_data, hardpoint_data)
             db.commit()
             return ship
         except Exception:
@@ -718,11 +775,22 @@ def _resolve_ship_from_erkul(db: Session, ship_local: str) -> Ship | None:
     return None
 
 
-def _import_erkul_items_to_loadout(db: Session, loadout: MetaLoadout, erkul_items: list) -> tuple[int, int]:
+def _import_erkul_items_to_loadout(
+    db: Session, loadout: MetaLoadout, erkul_items: list, class_map: dict | None = None
+) -> tuple[int, int]:
     """Erkul-Items in ein Loadout importieren. Gibt (imported, unmatched) zurück."""
     extracted = _extract_erkul_components(erkul_items)
     db.query(MetaLoadoutItem).filter(MetaLoadoutItem.loadout_id == loadout.id).delete()
 
+    if class_map is None:
+        class_map = _component_class_map(db)
+    hardpoint_ids = {
+        (hp.hardpoint_type, hp.slot_index): hp.id
+        for hp in db.query(ShipHardpoint.id, ShipHardpoint.hardpoint_type, ShipHardpoint.slot_index).filter(
+            ShipHardpoint.ship_id == loadout.ship_id
+        ).order_by(ShipHardpoint.id.desc())
+    }
+
     slot_counters: dict[str, int] = {}
     imported = 0
     unmatched = 0
@@ -731,22 +799,16 @@ def _import_erkul_items_to_loadout(db: Session, loadout: MetaLoadout, erkul_item
         slot_idx = slot_counters.get(hp_type, 0)
         slot_counters[hp_type] = slot_idx + 1
 
-        component = db.query(Component).filter(Component.class_name.ilike(erkul_local_name)).first()
-        if not component:
+        component_id = class_map.get(erkul_local_name.lower())
+        if not component_id:
             unmatched += 1
             continue
 
-        hardpoint = db.query(ShipHardpoint).filter(
-            ShipHardpoint.ship_id == loadout.ship_id,
-            ShipHardpoint.hardpoint_type == hp_type,
-            ShipHardpoint.slot_index == slot_idx,
-        ).first()
-
         db.add(MetaLoadoutItem(
             loadout_id=loadout.id,
             hardpoint_type=hp_type, slot_index=slot_idx,
-            component_id=component.id,
-            hardpoint_id=hardpoint.id if hardpoint else None,
+            component_id=component_id,
+            hardpoint_id=hardpoint_ids.get((hp_type, slot_idx)),
         ))
         imported += 1
 
@@ -755,14 +817,18 @@ def _import_erkul_items_to_loadout(db: Session, loadout: MetaLoadout, erkul_item
 
 # ============== Erkul Bulk Import ==============
 
-@router.post("/bulk-preview", response_model=ErkulBulkPreviewResponse)
-async def bulk_preview_erkul(
-    data: ErkulBulkPreviewRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    """Vorschau für Bulk-Import von Erkul-Links (Officer+)."""
-    check_role(current_user, UserRole.OFFICER)
+async def _fetch_missing_ships(db: Session, ship_locals: list[str]) -> dict:
+    """Unbekannte Schiffe vorab bei FleetYards abrufen (DB-Prüfung im Threadpool)."""
+    missing = await run_in_threadpool(_erkul_ships_missing, db, ship_locals)
+    return await _fetch_fleetyards_ships(missing) if missing else {}
+
+
+def _bulk_preview_items(
+    db: Session, data: ErkulBulkPreviewRequest, fetched: dict, fleetyards: dict
+) -> ErkulBulkPreviewResponse:
+    """DB-Teil der Bulk-Vorschau (läuft im Threadpool)."""
+    class_map = _component_class_map(db)
+    ships: dict = {}
 
     results = []
     for url in data.urls:
@@ -775,31 +841,26 @@ async def bulk_preview_erkul(
             ))
             continue
 
-        try:
-            erkul = await _fetch_erkul(code)
-        except Exception as e:
+        erkul = fetched.get(code)
+        if isinstance(erkul, Exception):
             results.append(ErkulBulkPreviewItem(
                 erkul_url=url, erkul_code=code, erkul_name="", ship_name="",
                 ship_id=None, components_count=0, unmatched_count=0,
-                existing_matches=[], error=f"Erkul-Fehler: {str(e)[:100]}",
+                existing_matches=[], error=f"Erkul-Fehler: {str(erkul)[:100]}",
             ))
             continue
 
-        # Schiff auflösen
-        ship = _resolve_ship_from_erkul(db, erkul["ship_local"])
+        # Schiff auflösen (pro Schiffstyp nur einmal)
+        if erkul["ship_local"] not in ships:
+            ships[erkul["ship_local"]] = _resolve_ship_from_erkul(db, erkul["ship_local"], fleetyards)
+        ship = ships[erkul["ship_local"]]
         ship_name = ship.name if ship else erkul["ship_local"]
         ship_id = ship.id if ship else None
 
         # Komponenten zählen
         extracted = _extract_erkul_components(erkul["items"])
-        matched = 0
-        unmatched = 0
-        for _, local_name in extracted:
-            comp = db.query(Component).filter(Component.class_name.ilike(local_name)).first()
-            if comp:
-                matched += 1
-            else:
-                unmatched += 1
+        unmatched = sum(1 for _, local_name in extracted if local_name.lower() not in class_map)
+        matched = len(extracted) - unmatched
 
         # Existierende Loadouts für dieses Schiff finden
         existing = []
@@ -826,28 +887,41 @@ async def bulk_preview_erkul(
     return ErkulBulkPreviewResponse(items=results)
 
 
-@router.post("/bulk-import", response_model=ErkulBulkImportResponse)
-async def bulk_import_erkul(
-    data: ErkulBulkImportRequest,
+@router.post("/bulk-preview", response_model=ErkulBulkPreviewResponse)
+async def bulk_preview_erkul(
+    data: ErkulBulkPreviewRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Bulk-Import von Erkul-Loadouts (Officer+). Kann neue erstellen oder bestehende ersetzen."""
+    """Vorschau für Bulk-Import von Erkul-Links (Officer+)."""
     check_role(current_user, UserRole.OFFICER)
 
+    # Alle Links parallel abrufen, danach im Threadpool gegen die DB auswerten
+    fetched = await _fetch_erkul_many([_parse_erkul_code(url) for url in data.urls])
+    fleetyards = await _fetch_missing_ships(db, [
+        erkul["ship_local"] for erkul in fetched.values() if not isinstance(erkul, Exception)
+    ])
+    return await run_in_threadpool(_bulk_preview_items, db, data, fetched, fleetyards)
+
+
+def _bulk_import_items(
+    db: Session, data: ErkulBulkImportRequest, fetched: dict, fleetyards: dict, current_user: User
+) -> ErkulBulkImportResponse:
+    """DB-Teil des Bulk-Imports (läuft im Threadpool)."""
     results = []
     created = 0
     replaced = 0
     failed = 0
 
+    class_map = _component_class_map(db)
+
     for item in data.items:
         code = _parse_erkul_code(item.erkul_url)
-        try:
-            erkul = await _fetch_erkul(code)
-        except Exception as e:
+        erkul = fetched.get(code)
+        if erkul is None or isinstance(erkul, Exception):
             results.append(ErkulBulkImportResultItem(
                 name=item.name, ship_name="", imported_count=0,
-                unmatched_count=0, replaced=False, error=str(e)[:100],
+                unmatched_count=0, replaced=False, error=str(erkul or "Ungültiger Erkul-Link")[:100],
             ))
             failed += 1
             continue
@@ -873,7 +947,7 @@ async def bulk_import_erkul(
             is_replaced = True
         else:
             # Neues Loadout - Schiff auflösen
-            ship = _resolve_ship_from_erkul(db, erkul["ship_local"])
+            ship = _resolve_ship_from_erkul(db, erkul["ship_local"], fleetyards)
             if not ship:
                 results.append(ErkulBulkImportResultItem(
                     name=item.name, ship_name=erkul["ship_local"], imported_count=0,
@@ -897,7 +971,7 @@ async def bulk_import_erkul(
             is_replaced = False
 
         # Items importieren
-        imp_count, unm_count = _import_erkul_items_to_loadout(db, loadout, erkul["items"])
+        imp_count, unm_count = _import_erkul_items_to_loadout(db, loadout, erkul["items"], class_map)
         db.commit()
 
         if is_replaced:
@@ -919,10 +993,31 @@ async def bulk_import_erkul(
     )
 
 
+@router.post("/bulk-import", response_model=ErkulBulkImportResponse)
+async def bulk_import_erkul(
+    data: ErkulBulkImportRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Bulk-Import von Erkul-Loadouts (Officer+). Kann neue erstellen oder bestehende ersetzen."""
+    check_role(current_user, UserRole.OFFICER)
+
+    # Alle Links parallel abrufen (meist Cache-Treffer aus der Vorschau),
+    # die DB-Auswertung läuft danach im Threadpool
+    fetched = await _fetch_erkul_many([_parse_erkul_code(item.erkul_url) for item in data.items])
+    new_ship_locals = []
+    for item in data.items:
+        erkul = fetched.get(_parse_erkul_code(item.erkul_url))
+        if not item.replace_id and isinstance(erkul, dict):
+            new_ship_locals.append(erkul["ship_local"])
+    fleetyards = await _fetch_missing_ships(db, new_ship_locals)
+    return await run_in_threadpool(_bulk_import_items, db, data, fetched, fleetyards, current_user)
+
+
 # ============== User-Aktionen ==============
 
 @router.get("/{loadout_id}/check", response_model=LoadoutCheckResponse)
-async def check_loadout(
+def check_loadout(
     loadout_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -997,7 +1092,7 @@ async def check_loadout(
 
 
 @router.post("/{loadout_id}/request-missing")
-async def request_missing_items(
+def request_missing_items(
     loadout_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
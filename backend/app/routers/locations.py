@@ -14,7 +14,7 @@ router = APIRouter()
 
 
 @router.get("", response_model=List[LocationResponse])
-async def get_locations(
+def get_locations(
     system_name: Optional[str] = Query(None, description="Filter nach Sternensystem"),
     planet_name: Optional[str] = Query(None, description="Filter nach Planet/Mond"),
     location_type: Optional[str] = Query(None, description="Filter nach Standort-Typ"),
@@ -35,7 +35,7 @@ async def get_locations(
 
 
 @router.get("/systems")
-async def get_systems(
+def get_systems(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -47,7 +47,7 @@ async def get_systems(
 
 
 @router.get("/planets")
-async def get_planets(
+def get_planets(
     system_name: Optional[str] = Query(None, description="Filter nach Sternensystem"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -64,7 +64,7 @@ async def get_planets(
 
 
 @router.get("/types")
-async def get_location_types(
+def get_location_types(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -76,7 +76,7 @@ async def get_location_types(
 
 
 @router.get("/{location_id}", response_model=LocationResponse)
-async def get_location(
+def get_location(
     location_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -92,7 +92,7 @@ async def get_location(
 
 
 @router.post("", response_model=LocationResponse)
-async def create_location(
+def create_location(
     location: LocationCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -116,7 +116,7 @@ async def create_location(
 
 
 @router.patch("/{location_id}", response_model=LocationResponse)
-async def update_location(
+def update_location(
     location_id: int,
     location: LocationCreate,
     db: Session = Depends(get_db),
@@ -151,7 +151,7 @@ async def update_location(
 
 
 @router.delete("/{location_id}")
-async def delete_location(
+def delete_location(
     location_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -184,7 +184,7 @@ async def delete_location(
 
 
 @router.get("/{location_id}/inventory")
-async def get_location_inventory(
+def get_location_inventory(
     location_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -18,7 +18,7 @@ router = APIRouter()
 
 
 @router.get("", response_model=List[LootSessionResponse])
-async def get_loot_sessions(
+def get_loot_sessions(
     limit: int = 20,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -30,7 +30,7 @@ async def get_loot_sessions(
 
 
 @router.get("/{session_id}", response_model=LootSessionResponse)
-async def get_loot_session(
+def get_loot_session(
     session_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -46,7 +46,7 @@ async def get_loot_session(
 
 
 @router.post("", response_model=LootSessionResponse)
-async def create_loot_session(
+def create_loot_session(
     session_data: LootSessionCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -116,7 +116,7 @@ async def create_loot_session(
 
 
 @router.patch("/{session_id}", response_model=LootSessionResponse)
-async def update_loot_session(
+def update_loot_session(
     session_id: int,
     update_data: LootSessionUpdate,
     db: Session = Depends(get_db),
@@ -159,7 +159,7 @@ async def update_loot_session(
 
 
 @router.delete("/{session_id}")
-async def delete_loot_session(
+def delete_loot_session(
     session_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -182,7 +182,7 @@ async def delete_loot_session(
 
 
 @router.post("/{session_id}/items", response_model=LootSessionResponse)
-async def add_loot_item(
+def add_loot_item(
     session_id: int,
     item_data: LootItemCreate,
     db: Session = Depends(get_db),
@@ -217,7 +217,7 @@ async def add_loot_item(
 
 
 @router.post("/{session_id}/items/{item_id}/distribute")
-async def distribute_loot_item(
+def distribute_loot_item(
     session_id: int,
     item_id: int,
     distribution: LootDistributionCreate,
@@ -282,7 +282,7 @@ async def distribute_loot_item(
 
 
 @router.post("/{session_id}/items/{item_id}/distribute-batch")
-async def distribute_loot_batch(
+def distribute_loot_batch(
     session_id: int,
     item_id: int,
     distribution: BatchDistributionCreate,
@@ -358,7 +358,7 @@ async def distribute_loot_batch(
 
 
 @router.delete("/{session_id}/items/{item_id}")
-async def remove_loot_item(
+def remove_loot_item(
     session_id: int,
     item_id: int,
     force: bool = False,
@@ -13,7 +13,9 @@ API-Endpoints für:
 
 from typing import List, Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import Response
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session, joinedload
 
 from app.database import get_db
@@ -26,7 +28,7 @@ from app.models.mission import (
     UserShip, MissionStatus, STANDARD_RADIO_FREQUENCIES
 )
 from app.schemas.mission import (
-    MissionCreate, MissionUpdate, MissionResponse, MissionDetailResponse,
+    MissionCreate, MissionUpdate, MissionCloneRequest, MissionResponse, MissionDetailResponse,
     MissionPhaseCreate, MissionPhaseUpdate, MissionPhaseResponse,
     MissionUnitCreate, MissionUnitUpdate, MissionUnitResponse,
     MissionPositionCreate, MissionPositionUpdate, MissionPositionResponse,
@@ -35,10 +37,14 @@ from app.schemas.mission import (
     MissionTemplateResponse, BriefingResponse, BriefingUnit,
     RadioFrequencyPreset, RadioFrequencyPresetsResponse,
     AssignmentDataResponse, GroupedOperationalRole, OperationalRoleSimple,
-    EligibleUser, UnitWithPositions, PositionWithAssignments
+    EligibleUser, UnitWithPositions, PositionWithAssignments,
+    AutoAssignProposalResponse, AutoAssignApplyRequest
 )
 from app.auth.jwt import get_current_user
 from app.auth.dependencies import check_role
+from app.services.mission_cache import mission_cache, snapshot_response, current_revision
+from app.services.mission_builder import instantiate_tree, clone_mission
+from app.services.auto_assign import build_proposal, apply_assignments
 
 router = APIRouter()
 
@@ -62,15 +68,66 @@ def check_mission_manager(user: User, mission: Mission):
         )
 
 
-def mission_to_response(mission: Mission, db: Session) -> dict:
-    """Konvertiert Mission zu Response mit berechneten Feldern."""
-    # Zähle Positionen
-    total_positions = 0
-    assignment_count = 0
-    for unit in mission.units:
-        for pos in unit.positions:
-            total_positions += pos.max_count
-            assignment_count += len(pos.assignments)
+def cached_snapshot(request: Request, mission_id: int, kind: str, revision: int, build, schema) -> Response:
+    """Liefert die serialisierte Antwort aus dem Snapshot-Cache (oder baut sie einmal)."""
+    snapshot = mission_cache.get(mission_id, kind, revision)
+    if snapshot is None:
+        body = schema.model_validate(build(), from_attributes=True).model_dump_json().encode()
+        snapshot = mission_cache.put(mission_id, kind, revision, body)
+    return snapshot_response(request, snapshot)
+
+
+def get_mission_state_or_404(db: Session, mission_id: int) -> tuple:
+    """(revision, status) der Mission, 404 wenn sie nicht existiert."""
+    state = current_revision(db, mission_id)
+    if not state:
+        raise HTTPException(status_code=404, detail="Mission nicht gefunden")
+    return state
+
+
+def mission_count_columns() -> tuple:
+    """Korrelierte Subqueries für Positions-, Zuweisungs- und Anmeldungszahlen einer Mission."""
+    total_positions = (
+        select(func.coalesce(func.sum(MissionPosition.max_count), 0))
+        .join(MissionUnit, MissionPosition.unit_id == MissionUnit.id)
+        .where(MissionUnit.mission_id == Mission.id)
+        .correlate(Mission)
+        .scalar_subquery()
+    )
+    assignment_count = (
+        select(func.count(MissionAssignment.id))
+        .join(MissionPosition, MissionAssignment.position_id == MissionPosition.id)
+        .join(MissionUnit, MissionPosition.unit_id == MissionUnit.id)
+        .where(MissionUnit.mission_id == Mission.id)
+        .correlate(Mission)
+        .scalar_subquery()
+    )
+    registration_count = (
+        select(func.count(MissionRegistration.id))
+        .where(MissionRegistration.mission_id == Mission.id)
+        .correlate(Mission)
+        .scalar_subquery()
+    )
+    return total_positions, assignment_count, registration_count
+
+
+def mission_to_response(mission: Mission, db: Session, counts: Optional[tuple] = None) -> dict:
+    """Konvertiert Mission zu Response mit berechneten Feldern.
+
+    counts: (total_positions, assignment_count, registration_count) aus
+    mission_count_columns() - ohne werden Units/Positionen/Anmeldungen geladen.
+    """
+    if counts is not None:
+        total_positions, assignment_count, registration_count = counts
+    else:
+        # Zähle Positionen
+        total_positions = 0
+        assignment_count = 0
+        for unit in mission.units:
+            for pos in unit.positions:
+                total_positions += pos.max_count
+                assignment_count += len(pos.assignments)
+        registration_count = len(mission.registrations)
 
     return {
         "id": mission.id,
@@ -92,7 +149,8 @@ def mission_to_response(mission: Mission, db: Session) -> dict:
         "created_by": mission.created_by,
         "created_at": mission.created_at,
         "updated_at": mission.updated_at,
-        "registration_count": len(mission.registrations),
+        "revision": mission.revision or 0,
+        "registration_count": registration_count,
         "assignment_count": assignment_count,
         "total_positions": total_positions,
     }
@@ -101,7 +159,7 @@ def mission_to_response(mission: Mission, db: Session) -> dict:
 # ============== Missions CRUD ==============
 
 @router.get("", response_model=List[MissionResponse])
-async def get_missions(
+def get_missions(
     status_filter: Optional[MissionStatus] = None,
     upcoming: bool = False,
     limit: int = 20,
@@ -109,11 +167,10 @@ async def get_missions(
     current_user: User = Depends(get_current_user)
 ):
     """Gibt Missionen zurück. Filtert nach Status und zeigt nur veröffentlichte für normale User."""
-    query = db.query(Mission).options(
+    # Zähler per Subquery in SQL statt Units/Positionen/Zuweisungen zu laden
+    query = db.query(Mission, *mission_count_columns()).options(
         joinedload(Mission.created_by),
         joinedload(Mission.start_location),
-        joinedload(Mission.units).joinedload(MissionUnit.positions).joinedload(MissionPosition.assignments),
-        joinedload(Mission.registrations)
     )
 
     # Normale User sehen nur veröffentlichte Missionen (außer eigene)
@@ -132,12 +189,12 @@ async def get_missions(
     else:
         query = query.order_by(Mission.scheduled_date.desc())
 
-    missions = query.limit(limit).all()
-    return [mission_to_response(m, db) for m in missions]
+    rows = query.limit(limit).all()
+    return [mission_to_response(mission, db, counts) for mission, *counts in rows]
 
 
 @router.get("/templates", response_model=List[MissionTemplateResponse])
-async def get_templates(
+def get_templates(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -146,7 +203,7 @@ async def get_templates(
 
 
 @router.get("/radio-frequencies", response_model=RadioFrequencyPresetsResponse)
-async def get_radio_frequencies(
+def get_radio_frequencies(
     current_user: User = Depends(get_current_user)
 ):
     """Gibt Standard-Funkfrequenzen zurück."""
@@ -168,12 +225,27 @@ async def get_radio_frequencies(
 
 
 @router.get("/{mission_id}", response_model=MissionDetailResponse)
-async def get_mission(
+def get_mission(
     mission_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Gibt eine einzelne Mission mit allen Details zurück."""
+    """Gibt eine einzelne Mission mit allen Details zurück (aus dem Snapshot-Cache)."""
+    revision, mission_status = get_mission_state_or_404(db, mission_id)
+
+    # Prüfe Sichtbarkeit für Drafts
+    if mission_status == MissionStatus.DRAFT and not is_mission_manager(current_user):
+        raise HTTPException(status_code=404, detail="Mission nicht gefunden")
+
+    return cached_snapshot(
+        request, mission_id, "detail", revision,
+        lambda: build_mission_detail(db, mission_id), MissionDetailResponse,
+    )
+
+
+def build_mission_detail(db: Session, mission_id: int) -> dict:
+    """Baut die Detail-Antwort einer Mission (ohne Sichtbarkeitsprüfung)."""
     mission = db.query(Mission).options(
         joinedload(Mission.created_by),
         joinedload(Mission.start_location),
@@ -185,10 +257,6 @@ async def get_mission(
     if not mission:
         raise HTTPException(status_code=404, detail="Mission nicht gefunden")
 
-    # Prüfe Sichtbarkeit für Drafts
-    if mission.status == MissionStatus.DRAFT and not is_mission_manager(current_user, mission):
-        raise HTTPException(status_code=404, detail="Mission nicht gefunden")
-
     # Baue Response
     response = mission_to_response(mission, db)
 
@@ -273,10 +341,38 @@ async def get_mission(
     # Füge Phasen hinzu
     response["phases"] = sorted(mission.phases, key=lambda p: p.sort_order)
 
+    # Schiffs-Anzahl aller angemeldeten User in einer Query (GROUP BY)
+    reg_user_ids = {reg.user_id for reg in mission.registrations}
+    ship_counts = {}
+    if reg_user_ids:
+        ship_counts = dict(
+            db.query(UserShip.user_id, func.count(UserShip.id))
+            .filter(UserShip.user_id.in_(reg_user_ids))
+            .group_by(UserShip.user_id)
+            .all()
+        )
+
+    # UserLoadouts aller Anmeldungen in einer Query auflösen
+    loadout_ids = {lid for reg in mission.registrations for lid in (reg.user_loadout_ids or [])}
+    user_loadouts = {}
+    if loadout_ids:
+        from app.models.loadout import UserLoadout as UL, MetaLoadout as ML
+        uls = db.query(UL).options(
+            joinedload(UL.loadout).joinedload(ML.ship),
+            joinedload(UL.ship),
+        ).filter(UL.id.in_(loadout_ids)).all()
+        user_loadouts = {ul.id: {
+            "id": ul.id,
+            "ship_name": ul.ship.name if ul.ship else None,
+            "ship_nickname": ul.ship_nickname,
+            "loadout_name": ul.loadout.name if ul.loadout else None,
+            "is_ready": ul.is_ready,
+        } for ul in uls}
+
     # Füge Registrations hinzu mit has_ships Info
     registrations = []
     for reg in mission.registrations:
-        ship_count = db.query(UserShip).filter(UserShip.user_id == reg.user_id).count()
+        ship_count = ship_counts.get(reg.user_id, 0)
         # User-Daten explizit serialisieren
         user_data = None
         if reg.user:
@@ -295,21 +391,12 @@ async def get_mission(
                 "aliases": reg.user.aliases,
                 "created_at": reg.user.created_at,
             }
-        # UserLoadouts auflösen
+        # UserLoadouts aus der gemeinsamen Query zuordnen
         user_loadouts_resolved = None
         if reg.user_loadout_ids:
-            from app.models.loadout import UserLoadout as UL, MetaLoadout as ML, Ship as S
-            uls = db.query(UL).options(
-                joinedload(UL.loadout).joinedload(ML.ship),
-                joinedload(UL.ship),
-            ).filter(UL.id.in_(reg.user_loadout_ids)).all()
-            user_loadouts_resolved = [{
-                "id": ul.id,
-                "ship_name": ul.ship.name if ul.ship else None,
-                "ship_nickname": ul.ship_nickname,
-                "loadout_name": ul.loadout.name if ul.loadout else None,
-                "is_ready": ul.is_ready,
-            } for ul in uls]
+            user_loadouts_resolved = [
+                user_loadouts[lid] for lid in reg.user_loadout_ids if lid in user_loadouts
+            ]
 
         registrations.append({
             "id": reg.id,
@@ -332,7 +419,7 @@ async def get_mission(
 
 
 @router.post("", response_model=MissionDetailResponse)
-async def create_mission(
+def create_mission(
     mission_data: MissionCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -369,54 +456,44 @@ async def create_mission(
     if mission_data.template_id:
         template = db.query(MissionTemplate).filter(MissionTemplate.id == mission_data.template_id).first()
         if template and template.template_data:
+            # Units, Positionen und Phasen per Multi-Row-Insert anlegen
             data = template.template_data
-
-            # Units erstellen
-            for unit_data in data.get("units", []):
-                unit = MissionUnit(
-                    mission_id=mission.id,
-                    name=unit_data.get("name"),
-                    unit_type=unit_data.get("unit_type"),
-                    ship_name=unit_data.get("ship_name"),
-                    radio_frequencies=unit_data.get("radio_frequencies"),
-                    sort_order=unit_data.get("sort_order", 0),
-                )
-                db.add(unit)
-                db.flush()
-
-                # Positions erstellen
-                for pos_data in unit_data.get("positions", []):
-                    pos = MissionPosition(
-                        unit_id=unit.id,
-                        name=pos_data.get("name"),
-                        position_type=pos_data.get("position_type"),
-                        is_required=pos_data.get("is_required", True),
-                        min_count=pos_data.get("min_count", 1),
-                        max_count=pos_data.get("max_count", 1),
-                        sort_order=pos_data.get("sort_order", 0),
-                    )
-                    db.add(pos)
-
-            # Phasen erstellen
-            for phase_data in data.get("phases", []):
-                phase = MissionPhase(
-                    mission_id=mission.id,
-                    phase_number=phase_data.get("phase_number"),
-                    title=phase_data.get("title"),
-                    description=phase_data.get("description"),
-                    sort_order=phase_data.get("phase_number", 0),
-                )
-                db.add(phase)
+            instantiate_tree(db, mission.id, data.get("units", []), data.get("phases", []))
 
     db.commit()
     db.refresh(mission)
 
     # Lade vollständige Mission
-    return await get_mission(mission.id, db, current_user)
+    return build_mission_detail(db, mission.id)
+
+
+@router.post("/{mission_id}/clone", response_model=MissionDetailResponse)
+def clone_mission_endpoint(
+    mission_id: int,
+    clone_data: MissionCloneRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Kopiert eine Mission (Einheiten, Positionen, Phasen) als neuen Entwurf."""
+    source = db.query(Mission).filter(Mission.id == mission_id).first()
+    if not source:
+        raise HTTPException(status_code=404, detail="Mission nicht gefunden")
+
+    check_mission_manager(current_user, source)
+
+    mission, _ = clone_mission(
+        db, source,
+        created_by_id=current_user.id,
+        title=clone_data.title or f"{source.title} (Kopie)"[:200],
+        scheduled_date=clone_data.scheduled_date or source.scheduled_date,
+    )
+    db.commit()
+
+    return build_mission_detail(db, mission.id)
 
 
 @router.patch("/{mission_id}", response_model=MissionDetailResponse)
-async def update_mission(
+def update_mission(
     mission_id: int,
     mission_data: MissionUpdate,
     db: Session = Depends(get_db),
@@ -461,11 +538,11 @@ async def update_mission(
         mission.status = mission_data.status
 
     db.commit()
-    return await get_mission(mission_id, db, current_user)
+    return build_mission_detail(db, mission_id)
 
 
 @router.delete("/{mission_id}")
-async def delete_mission(
+def delete_mission(
     mission_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -485,7 +562,7 @@ async def delete_mission(
 # ============== Status Actions ==============
 
 @router.post("/{mission_id}/publish")
-async def publish_mission(
+def publish_mission(
     mission_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -503,7 +580,7 @@ async def publish_mission(
 
 
 @router.post("/{mission_id}/lock")
-async def lock_mission(
+def lock_mission(
     mission_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -521,7 +598,7 @@ async def lock_mission(
 
 
 @router.post("/{mission_id}/complete")
-async def complete_mission(
+def complete_mission(
     mission_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -541,7 +618,7 @@ async def complete_mission(
 # ============== Phases CRUD ==============
 
 @router.post("/{mission_id}/phases", response_model=MissionPhaseResponse)
-async def create_phase(
+def create_phase(
     mission_id: int,
     phase_data: MissionPhaseCreate,
     db: Session = Depends(get_db),
@@ -569,7 +646,7 @@ async def create_phase(
 
 
 @router.patch("/{mission_id}/phases/{phase_id}", response_model=MissionPhaseResponse)
-async def update_phase(
+def update_phase(
     mission_id: int,
     phase_id: int,
     phase_data: MissionPhaseUpdate,
@@ -607,7 +684,7 @@ async def update_phase(
 
 
 @router.delete("/{mission_id}/phases/{phase_id}")
-async def delete_phase(
+def delete_phase(
     mission_id: int,
     phase_id: int,
     db: Session = Depends(get_db),
@@ -635,7 +712,7 @@ async def delete_phase(
 # ============== Units CRUD ==============
 
 @router.post("/{mission_id}/units", response_model=MissionUnitResponse)
-async def create_unit(
+def create_unit(
     mission_id: int,
     unit_data: MissionUnitCreate,
     db: Session = Depends(get_db),
@@ -700,7 +777,7 @@ async def create_unit(
 
 
 @router.patch("/{mission_id}/units/{unit_id}", response_model=MissionUnitResponse)
-async def update_unit(
+def update_unit(
     mission_id: int,
     unit_id: int,
     unit_data: MissionUnitUpdate,
@@ -744,7 +821,7 @@ async def update_unit(
 
 
 @router.delete("/{mission_id}/units/{unit_id}")
-async def delete_unit(
+def delete_unit(
     mission_id: int,
     unit_id: int,
     db: Session = Depends(get_db),
@@ -772,7 +849,7 @@ async def delete_unit(
 # ============== Positions CRUD ==============
 
 @router.post("/{mission_id}/units/{unit_id}/positions", response_model=MissionPositionResponse)
-async def create_position(
+def create_position(
     mission_id: int,
     unit_id: int,
     pos_data: MissionPositionCreate,
@@ -811,7 +888,7 @@ async def create_position(
 
 
 @router.patch("/{mission_id}/positions/{pos_id}", response_model=MissionPositionResponse)
-async def update_position(
+def update_position(
     mission_id: int,
     pos_id: int,
     pos_data: MissionPositionUpdate,
@@ -857,7 +934,7 @@ async def update_position(
 
 
 @router.delete("/{mission_id}/positions/{pos_id}")
-async def delete_position(
+def delete_position(
     mission_id: int,
     pos_id: int,
     db: Session = Depends(get_db),
@@ -885,7 +962,7 @@ async def delete_position(
 # ============== Registrations ==============
 
 @router.post("/{mission_id}/register", response_model=MissionRegistrationResponse)
-async def register_for_mission(
+def register_for_mission(
     mission_id: int,
     reg_data: MissionRegistrationCreate,
     db: Session = Depends(get_db),
@@ -954,7 +1031,7 @@ async def register_for_mission(
 
 
 @router.delete("/{mission_id}/register")
-async def unregister_from_mission(
+def unregister_from_mission(
     mission_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -973,7 +1050,7 @@ async def unregister_from_mission(
 
 
 @router.get("/{mission_id}/my-registration", response_model=Optional[MissionRegistrationResponse])
-async def get_my_registration(
+def get_my_registration(
     mission_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -997,7 +1074,7 @@ async def get_my_registration(
 # ============== Assignments ==============
 
 @router.get("/{mission_id}/registrations", response_model=List[MissionRegistrationResponse])
-async def get_registrations(
+def get_registrations(
     mission_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -1025,7 +1102,7 @@ async def get_registrations(
 
 
 @router.post("/{mission_id}/assignments", response_model=MissionAssignmentResponse)
-async def create_assignment(
+def create_assignment(
     mission_id: int,
     assign_data: MissionAssignmentCreate,
     db: Session = Depends(get_db),
@@ -1073,7 +1150,7 @@ async def create_assignment(
 
 
 @router.patch("/{mission_id}/assignments/{assign_id}", response_model=MissionAssignmentResponse)
-async def update_assignment(
+def update_assignment(
     mission_id: int,
     assign_id: int,
     assign_data: MissionAssignmentUpdate,
@@ -1117,7 +1194,7 @@ async def update_assignment(
 
 
 @router.delete("/{mission_id}/assignments/{assign_id}")
-async def delete_assignment(
+def delete_assignment(
     mission_id: int,
     assign_id: int,
     db: Session = Depends(get_db),
@@ -1142,15 +1219,72 @@ async def delete_assignment(
     return {"message": "Zuweisung gelöscht"}
 
 
+# ============== Auto-Zuweisung ==============
+
+@router.post("/{mission_id}/auto-assign", response_model=AutoAssignProposalResponse)
+def propose_auto_assign(
+    mission_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Berechnet eine optimale Zuweisung aller freien Plätze (schreibt nichts)."""
+    mission = db.query(Mission).filter(Mission.id == mission_id).first()
+    if not mission:
+        raise HTTPException(status_code=404, detail="Mission nicht gefunden")
+
+    check_mission_manager(current_user, mission)
+    return build_proposal(db, mission_id, mission.revision)
+
+
+@router.post("/{mission_id}/auto-assign/apply")
+def apply_auto_assign(
+    mission_id: int,
+    data: AutoAssignApplyRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Übernimmt einen Zuweisungsvorschlag in einem Bulk-Write."""
+    mission = db.query(Mission).filter(Mission.id == mission_id).first()
+    if not mission:
+        raise HTTPException(status_code=404, detail="Mission nicht gefunden")
+
+    check_mission_manager(current_user, mission)
+
+    if data.revision != mission.revision:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Die Mission wurde seit dem Vorschlag geändert - bitte neu berechnen"
+        )
+
+    try:
+        created = apply_assignments(db, mission_id, data.assignments, current_user.id)
+    except ValueError as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    db.commit()
+
+    return {"message": f"{created} Zuweisungen übernommen", "created": created}
+
+
 # ============== Briefing ==============
 
 @router.get("/{mission_id}/briefing", response_model=BriefingResponse)
-async def get_briefing(
+def get_briefing(
     mission_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Generiert das formatierte Briefing-Dokument."""
+    """Generiert das formatierte Briefing-Dokument (aus dem Snapshot-Cache)."""
+    revision, _ = get_mission_state_or_404(db, mission_id)
+    return cached_snapshot(
+        request, mission_id, "briefing", revision,
+        lambda: build_briefing(db, mission_id), BriefingResponse,
+    )
+
+
+def build_briefing(db: Session, mission_id: int) -> BriefingResponse:
+    """Baut das Briefing-Dokument einer Mission."""
     mission = db.query(Mission).options(
         joinedload(Mission.start_location),
         joinedload(Mission.units).joinedload(MissionUnit.positions).joinedload(MissionPosition.required_role),
@@ -1240,12 +1374,23 @@ async def get_briefing(
 # ============== Assignment Data ==============
 
 @router.get("/{mission_id}/assignment-data", response_model=AssignmentDataResponse)
-async def get_assignment_data(
+def get_assignment_data(
     mission_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Gibt alle Daten für das Zuweisungs-UI zurück."""
+    """Gibt alle Daten für das Zuweisungs-UI zurück (aus dem Snapshot-Cache)."""
+    revision, _ = get_mission_state_or_404(db, mission_id)
+    can_manage = is_mission_manager(current_user)
+    return cached_snapshot(
+        request, mission_id, f"assignment-data:{int(can_manage)}", revision,
+        lambda: build_assignment_data(db, mission_id, can_manage), AssignmentDataResponse,
+    )
+
+
+def build_assignment_data(db: Session, mission_id: int, can_manage: bool) -> dict:
+    """Baut die Daten für das Zuweisungs-UI einer Mission."""
     mission = db.query(Mission).options(
         joinedload(Mission.units).joinedload(MissionUnit.positions).joinedload(MissionPosition.assignments).joinedload(MissionAssignment.user)
     ).filter(Mission.id == mission_id).first()
@@ -1253,8 +1398,6 @@ async def get_assignment_data(
     if not mission:
         raise HTTPException(status_code=404, detail="Mission nicht gefunden")
 
-    can_manage = is_mission_manager(current_user, mission)
-
     # Build units with positions
     units = []
     for unit in sorted(mission.units, key=lambda u: u.sort_order):
@@ -21,7 +21,7 @@ router = APIRouter()
 
 
 @router.get("", response_model=OfficerAccountsSummary)
-async def get_all_accounts(
+def get_all_accounts(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -38,7 +38,7 @@ async def get_all_accounts(
 
 
 @router.get("/{account_id}", response_model=OfficerAccountWithTransactions)
-async def get_account(
+def get_account(
     account_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -57,7 +57,7 @@ async def get_account(
 
 
 @router.post("", response_model=OfficerAccountResponse)
-async def create_account(
+def create_account(
     data: OfficerAccountCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -93,7 +93,7 @@ async def create_account(
 
 
 @router.delete("/{account_id}")
-async def delete_account(
+def delete_account(
     account_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -121,7 +121,7 @@ async def delete_account(
 
 
 @router.post("/{account_id}/transactions", response_model=OfficerTransactionResponse)
-async def create_transaction(
+def create_transaction(
     account_id: int,
     data: OfficerTransactionCreate,
     db: Session = Depends(get_db),
@@ -163,7 +163,7 @@ async def create_transaction(
 
 
 @router.post("/transfer", response_model=dict)
-async def transfer_between_accounts(
+def transfer_between_accounts(
     data: OfficerTransferCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -233,7 +233,7 @@ async def transfer_between_accounts(
 
 
 @router.patch("/{account_id}/set-balance", response_model=OfficerAccountResponse)
-async def set_account_balance(
+def set_account_balance(
     account_id: int,
     balance: float,
     db: Session = Depends(get_db),
@@ -1,53 +1,67 @@
 """
 Admin-Router für Star Citizen Daten-Import.
 """
+from datetime import date, timedelta
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.models.component import Component, SCLocation
-from app.models.item_price import ItemPrice, UEXSyncLog
+from app.models.item_price import ItemPrice, UEXSyncLog, ComponentPriceRollup
 from app.schemas.component import (
     ComponentResponse,
     SCLocationResponse,
-    SCImportStats,
+    SCImportProgress,
     ItemPriceResponse,
-    UEXSyncStats
+    UEXSyncStats,
+    ComponentPriceSummary,
+    PriceHistoryPoint
 )
 from app.auth.jwt import get_current_user
 from app.auth.dependencies import check_role
-from app.services.sc_import import run_sc_import
-from app.services.uex_import import run_uex_import
+from app.services.sc_import import sc_import_jobs
+from app.services.uex_import import IncompleteSyncError, run_uex_import
+from app.services.price_history import get_price_history
 
 router = APIRouter()
 
 
-@router.post("/sync", response_model=SCImportStats)
+@router.post("/sync", response_model=SCImportProgress, status_code=status.HTTP_202_ACCEPTED)
 def sync_sc_data(
-    db: Session = Depends(get_db),
+    resume: bool = True,
+    force: bool = False,
     current_user: User = Depends(get_current_user)
 ):
     """
-    Synchronisiert Star Citizen Daten von der Wiki-API.
+    Startet den Import der Star Citizen Daten von der Wiki-API als Hintergrund-Job.
+    Ein abgebrochener Import derselben SC-Version wird am Checkpoint fortgesetzt
+    (resume=false erzwingt einen Neustart). Unveränderte Seiten werden übersprungen,
+    force=true schreibt alles neu. Fortschritt über GET /sync/progress.
     Nur Admins können diesen Endpunkt aufrufen.
     """
     check_role(current_user, UserRole.ADMIN)
 
-    try:
-        stats = run_sc_import(db)
-        return stats
-    except Exception as e:
-        db.rollback()
+    if not sc_import_jobs.start(resume=resume, force=force):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Import fehlgeschlagen: {str(e)}"
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Ein SC-Import läuft bereits"
         )
+    return sc_import_jobs.progress()
+
+
+@router.get("/sync/progress", response_model=SCImportProgress)
+def get_sync_progress(
+    current_user: User = Depends(get_current_user)
+):
+    """Gibt den Fortschritt des laufenden bzw. letzten SC-Imports zurück."""
+    check_role(current_user, UserRole.ADMIN)
+    return sc_import_jobs.progress()
 
 
 @router.get("/stats")
-async def get_import_stats(
+def get_import_stats(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -81,7 +95,7 @@ async def get_import_stats(
 
 
 @router.get("/locations", response_model=List[SCLocationResponse])
-async def get_sc_locations(
+def get_sc_locations(
     system: str = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -96,7 +110,7 @@ async def get_sc_locations(
 
 
 @router.get("/locations/systems")
-async def get_sc_systems(
+def get_sc_systems(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -111,18 +125,27 @@ async def get_sc_systems(
 
 @router.post("/uex/sync", response_model=UEXSyncStats)
 def sync_uex_prices(
+    mode: str = Query("diff", pattern="^(diff|full)$"),
+    force: bool = Query(False),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Synchronisiert Preisdaten von der UEX API (uexcorp.space).
+    mode=diff schreibt nur Änderungen, mode=full tauscht die Tabelle komplett aus.
+    force=true übernimmt die Daten auch, wenn deutlich weniger Preise als bisher ankommen.
     Nur Admins können diesen Endpunkt aufrufen.
     """
     check_role(current_user, UserRole.ADMIN)
 
     try:
-        log = run_uex_import(db)
+        log = run_uex_import(db, mode, force)
         return log
+    except IncompleteSyncError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"UEX Import verweigert: {str(e)} (mit force=true erzwingen)"
+        )
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -132,7 +155,7 @@ def sync_uex_prices(
 
 
 @router.get("/uex/stats", response_model=UEXSyncStats)
-async def get_uex_stats(
+def get_uex_stats(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -152,7 +175,7 @@ async def get_uex_stats(
 
 
 @router.get("/uex/prices", response_model=List[ItemPriceResponse])
-async def get_all_prices(
+def get_all_prices(
     terminal: str = None,
     limit: int = 100,
     db: Session = Depends(get_db),
@@ -168,7 +191,7 @@ async def get_all_prices(
 
 
 @router.get("/items/{component_id}/prices", response_model=List[ItemPriceResponse])
-async def get_component_prices(
+def get_component_prices(
     component_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -189,8 +212,39 @@ async def get_component_prices(
     return prices
 
 
+@router.get("/items/{component_id}/price-summary", response_model=ComponentPriceSummary)
+def get_component_price_summary(
+    component_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Gibt die vorberechneten Preis-Kennzahlen einer Komponente zurück
+    (günstigster Kauf, bester Verkauf, Median, jeweiliges Terminal)."""
+    rollup = db.query(ComponentPriceRollup).filter(
+        ComponentPriceRollup.component_id == component_id
+    ).first()
+    if not rollup:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Keine Preisdaten für diese Komponente"
+        )
+    return rollup
+
+
+@router.get("/items/{component_id}/price-history", response_model=List[PriceHistoryPoint])
+def get_component_price_history(
+    component_id: int,
+    days: int = Query(90, ge=1, le=365),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Gibt den Preisverlauf einer Komponente zurück (ein Punkt pro Tag)."""
+    since = date.today() - timedelta(days=days)
+    return get_price_history(db, component_id, since)
+
+
 @router.get("/uex/terminals")
-async def get_terminals(
+def get_terminals(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -202,7 +256,7 @@ async def get_terminals(
 
 
 @router.get("/uex/debug")
-async def debug_uex_data(
+def debug_uex_data(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
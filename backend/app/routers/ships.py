@@ -21,7 +21,7 @@ router = APIRouter()
 # ============== Own Ships ==============
 
 @router.get("/me/ships", response_model=List[UserShipResponse])
-async def get_my_ships(
+def get_my_ships(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -30,7 +30,7 @@ async def get_my_ships(
 
 
 @router.post("/me/ships", response_model=UserShipResponse)
-async def add_my_ship(
+def add_my_ship(
     ship_data: UserShipCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -49,7 +49,7 @@ async def add_my_ship(
 
 
 @router.patch("/me/ships/{ship_id}", response_model=UserShipResponse)
-async def update_my_ship(
+def update_my_ship(
     ship_id: int,
     ship_data: UserShipUpdate,
     db: Session = Depends(get_db),
@@ -76,7 +76,7 @@ async def update_my_ship(
 
 
 @router.delete("/me/ships/{ship_id}")
-async def delete_my_ship(
+def delete_my_ship(
     ship_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -97,7 +97,7 @@ async def delete_my_ship(
 # ============== View Other User's Ships (for Mission Planning) ==============
 
 @router.get("/{user_id}/ships", response_model=List[UserShipResponse])
-async def get_user_ships(
+def get_user_ships(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -65,7 +65,7 @@ def check_staffel_manager(user: User, db: Session):
 # ============== Kommandogruppen ==============
 
 @router.get("/command-groups", response_model=List[CommandGroupResponse])
-async def get_command_groups(
+def get_command_groups(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -74,7 +74,7 @@ async def get_command_groups(
 
 
 @router.get("/command-groups/{group_id}", response_model=CommandGroupDetailResponse)
-async def get_command_group(
+def get_command_group(
     group_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -87,7 +87,7 @@ async def get_command_group(
 
 
 @router.post("/command-groups", response_model=CommandGroupResponse)
-async def create_command_group(
+def create_command_group(
     data: CommandGroupCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -107,7 +107,7 @@ async def create_command_group(
 
 
 @router.patch("/command-groups/{group_id}", response_model=CommandGroupResponse)
-async def update_command_group(
+def update_command_group(
     group_id: int,
     data: CommandGroupUpdate,
     db: Session = Depends(get_db),
@@ -132,7 +132,7 @@ async def update_command_group(
 # ============== Mitglieder ==============
 
 @router.get("/command-groups/{group_id}/members", response_model=List[UserCommandGroupResponse])
-async def get_group_members(
+def get_group_members(
     group_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -144,7 +144,7 @@ async def get_group_members(
 
 
 @router.post("/command-groups/{group_id}/members", response_model=UserCommandGroupResponse)
-async def add_member_to_group(
+def add_member_to_group(
     group_id: int,
     data: AddMemberToGroup,
     db: Session = Depends(get_db),
@@ -184,7 +184,7 @@ async def add_member_to_group(
 
 
 @router.patch("/members/{membership_id}", response_model=UserCommandGroupResponse)
-async def update_member_status(
+def update_member_status(
     membership_id: int,
     data: MemberStatusUpdate,
     db: Session = Depends(get_db),
@@ -207,7 +207,7 @@ async def update_member_status(
 
 
 @router.delete("/members/{membership_id}")
-async def remove_member(
+def remove_member(
     membership_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -227,7 +227,7 @@ async def remove_member(
 # ============== Einsatzrollen ==============
 
 @router.get("/operational-roles", response_model=List[OperationalRoleResponse])
-async def get_operational_roles(
+def get_operational_roles(
     command_group_id: int = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -240,7 +240,7 @@ async def get_operational_roles(
 
 
 @router.post("/operational-roles", response_model=OperationalRoleResponse)
-async def create_operational_role(
+def create_operational_role(
     data: OperationalRoleCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -261,7 +261,7 @@ async def create_operational_role(
 
 
 @router.patch("/operational-roles/{role_id}", response_model=OperationalRoleResponse)
-async def update_operational_role(
+def update_operational_role(
     role_id: int,
     data: OperationalRoleUpdate,
     db: Session = Depends(get_db),
@@ -284,7 +284,7 @@ async def update_operational_role(
 
 
 @router.delete("/operational-roles/{role_id}")
-async def delete_operational_role(
+def delete_operational_role(
     role_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -304,7 +304,7 @@ async def delete_operational_role(
 # ============== User Einsatzrollen ==============
 
 @router.post("/users/{user_id}/operational-roles", response_model=UserOperationalRoleResponse)
-async def assign_operational_role(
+def assign_operational_role(
     user_id: int,
     data: UserOperationalRoleCreate,
     db: Session = Depends(get_db),
@@ -343,7 +343,7 @@ async def assign_operational_role(
 
 
 @router.patch("/user-operational-roles/{assignment_id}", response_model=UserOperationalRoleResponse)
-async def update_operational_role_assignment(
+def update_operational_role_assignment(
     assignment_id: int,
     data: UserOperationalRoleUpdate,
     db: Session = Depends(get_db),
@@ -365,7 +365,7 @@ async def update_operational_role_assignment(
 
 
 @router.delete("/user-operational-roles/{assignment_id}")
-async def remove_operational_role(
+def remove_operational_role(
     assignment_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -385,7 +385,7 @@ async def remove_operational_role(
 # ============== Funktionsrollen ==============
 
 @router.get("/function-roles", response_model=List[FunctionRoleResponse])
-async def get_function_roles(
+def get_function_roles(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -394,7 +394,7 @@ async def get_function_roles(
 
 
 @router.post("/function-roles", response_model=FunctionRoleResponse)
-async def create_function_role(
+def create_function_role(
     data: FunctionRoleCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -414,7 +414,7 @@ async def create_function_role(
 
 
 @router.patch("/function-roles/{role_id}", response_model=FunctionRoleResponse)
-async def update_function_role(
+def update_function_role(
     role_id: int,
     data: FunctionRoleUpdate,
     db: Session = Depends(get_db),
@@ -437,7 +437,7 @@ async def update_function_role(
 
 
 @router.delete("/function-roles/{role_id}")
-async def delete_function_role(
+def delete_function_role(
     role_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -457,7 +457,7 @@ async def delete_function_role(
 # ============== User Funktionsrollen ==============
 
 @router.post("/users/{user_id}/function-roles", response_model=UserFunctionRoleResponse)
-async def assign_function_role(
+def assign_function_role(
     user_id: int,
     data: UserFunctionRoleCreate,
     db: Session = Depends(get_db),
@@ -495,7 +495,7 @@ async def assign_function_role(
 
 
 @router.delete("/user-function-roles/{assignment_id}")
-async def remove_function_role(
+def remove_function_role(
     assignment_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -515,7 +515,7 @@ async def remove_function_role(
 # ============== Schiffe ==============
 
 @router.get("/command-groups/{group_id}/ships", response_model=List[ShipResponse])
-async def get_group_ships(
+def get_group_ships(
     group_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -527,7 +527,7 @@ async def get_group_ships(
 
 
 @router.post("/command-groups/{group_id}/ships", response_model=ShipResponse)
-async def add_ship_to_group(
+def add_ship_to_group(
     group_id: int,
     data: ShipCreate,
     db: Session = Depends(get_db),
@@ -553,7 +553,7 @@ async def add_ship_to_group(
 
 
 @router.patch("/ships/{ship_id}", response_model=ShipResponse)
-async def update_ship(
+def update_ship(
     ship_id: int,
     data: ShipUpdate,
     db: Session = Depends(get_db),
@@ -576,7 +576,7 @@ async def update_ship(
 
 
 @router.delete("/ships/{ship_id}")
-async def remove_ship(
+def remove_ship(
     ship_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -596,7 +596,7 @@ async def remove_ship(
 # ============== Übersicht ==============
 
 @router.get("/overview", response_model=StaffelOverviewResponse)
-async def get_staffel_overview(
+def get_staffel_overview(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -663,7 +663,7 @@ async def get_staffel_overview(
 
 
 @router.get("/users/{user_id}/profile", response_model=UserStaffelProfile)
-async def get_user_staffel_profile(
+def get_user_staffel_profile(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -696,7 +696,7 @@ async def get_user_staffel_profile(
 # ============== Self-Service KG-Anmeldung ==============
 
 @router.get("/my-command-groups", response_model=MyCommandGroupsResponse)
-async def get_my_command_groups(
+def get_my_command_groups(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -715,7 +715,7 @@ async def get_my_command_groups(
 
 
 @router.post("/my-command-groups", response_model=MyCommandGroupsResponse)
-async def set_my_command_groups(
+def set_my_command_groups(
     data: MyCommandGroupsUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -770,7 +770,7 @@ async def set_my_command_groups(
 # ============== Assignment Matrix ==============
 
 @router.get("/command-groups/{group_id}/assignment-matrix", response_model=AssignmentMatrixResponse)
-async def get_assignment_matrix(
+def get_assignment_matrix(
     group_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -839,7 +839,7 @@ async def get_assignment_matrix(
 
 
 @router.post("/command-groups/{group_id}/assignments/bulk")
-async def bulk_update_assignments(
+def bulk_update_assignments(
     group_id: int,
     data: BulkAssignmentUpdate,
     db: Session = Depends(get_db),
@@ -28,7 +28,7 @@ def get_or_create_treasury(db: Session) -> Treasury:
 
 
 @router.get("/balance", response_model=TreasuryResponse)
-async def get_balance(
+def get_balance(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -37,7 +37,7 @@ async def get_balance(
 
 
 @router.get("/transactions", response_model=List[TransactionResponse])
-async def get_transactions(
+def get_transactions(
     limit: int = 50,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -51,7 +51,7 @@ async def get_transactions(
 
 
 @router.post("/transactions", response_model=TransactionResponse)
-async def create_transaction(
+def create_transaction(
     transaction: TransactionCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -160,7 +160,7 @@ async def create_transaction(
 
 
 @router.get("/summary")
-async def get_summary(
+def get_summary(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -186,7 +186,7 @@ async def get_summary(
 
 
 @router.patch("/transactions/{transaction_id}", response_model=TransactionResponse)
-async def update_transaction(
+def update_transaction(
     transaction_id: int,
     update_data: TransactionUpdate,
     db: Session = Depends(get_db),
@@ -242,7 +242,7 @@ async def update_transaction(
 
 
 @router.delete("/transactions/all")
-async def delete_all_transactions(
+def delete_all_transactions(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -262,7 +262,7 @@ async def delete_all_transactions(
 
 
 @router.delete("/transactions/{transaction_id}")
-async def delete_transaction(
+def delete_transaction(
     transaction_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -298,7 +298,7 @@ async def delete_transaction(
 
 
 @router.post("/import-csv", response_model=CSVImportResponse)
-async def import_csv(
+def import_csv(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -316,7 +316,7 @@ async def import_csv(
             detail="Nur CSV-Dateien erlaubt"
         )
 
-    content = await file.read()
+    content = file.file.read()
     # Versuche verschiedene Encodings
     for encoding in ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']:
         try:
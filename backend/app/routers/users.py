@@ -34,7 +34,7 @@ router = APIRouter()
 
 
 @router.get("", response_model=List[UserResponse])
-async def get_users(
+def get_users(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -43,7 +43,7 @@ async def get_users(
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(
+def get_current_user_info(
     current_user: User = Depends(get_current_user)
 ):
     """Gibt den aktuell eingeloggten Benutzer zurück."""
@@ -51,7 +51,7 @@ async def get_current_user_info(
 
 
 @router.get("/officers", response_model=List[UserResponse])
-async def get_officers(
+def get_officers(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -62,7 +62,7 @@ async def get_officers(
 
 
 @router.get("/pioneers", response_model=List[UserResponse])
-async def get_pioneers(
+def get_pioneers(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -75,7 +75,7 @@ async def get_pioneers(
 # ============================================================================
 
 @router.post("/merge")
-async def merge_users(
+def merge_users(
     merge_request: UserMergeRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -304,7 +304,7 @@ async def merge_users(
 
 
 @router.get("/pending-merges", response_model=List[PendingMergeResponse])
-async def get_pending_merges(
+def get_pending_merges(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -332,7 +332,7 @@ async def get_pending_merges(
 
 
 @router.get("/pending-merges/count")
-async def get_pending_merges_count(
+def get_pending_merges_count(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -343,7 +343,7 @@ async def get_pending_merges_count(
 
 
 @router.post("/pending-merges/{merge_id}/approve")
-async def approve_pending_merge(
+def approve_pending_merge(
     merge_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -576,7 +576,7 @@ async def approve_pending_merge(
 
 
 @router.post("/pending-merges/{merge_id}/reject")
-async def reject_pending_merge(
+def reject_pending_merge(
     merge_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -603,7 +603,7 @@ async def reject_pending_merge(
 # ============================================================================
 
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user(
+def get_user(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -619,7 +619,7 @@ async def get_user(
 
 
 @router.patch("/{user_id}", response_model=UserResponse)
-async def update_user(
+def update_user(
     user_id: int,
     user_update: UserUpdate,
     db: Session = Depends(get_db),
@@ -677,7 +677,7 @@ async def update_user(
 
 
 @router.post("/{user_id}/aliases")
-async def add_alias(
+def add_alias(
     user_id: int,
     alias: str,
     db: Session = Depends(get_db),
@@ -722,7 +722,7 @@ async def add_alias(
 
 
 @router.delete("/{user_id}/aliases/{alias}")
-async def remove_alias(
+def remove_alias(
     user_id: int,
     alias: str,
     db: Session = Depends(get_db),
@@ -762,7 +762,7 @@ async def remove_alias(
 
 
 @router.get("/{user_id}/aliases")
-async def get_aliases(
+def get_aliases(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -782,7 +782,7 @@ async def get_aliases(
 
 
 @router.delete("/{user_id}")
-async def delete_user(
+def delete_user(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
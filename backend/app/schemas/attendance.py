@@ -44,6 +44,7 @@ class AttendanceSessionResponse(BaseModel):
     records: List[AttendanceRecordResponse]
     is_confirmed: bool = False
     has_screenshot: bool = False  # Ob ein Screenshot vorhanden ist
+    has_thumbnail: bool = False  # WebP-Vorschau unter /{id}/thumbnail
     has_loot_session: bool = False  # Ob eine Loot-Session existiert
     loot_session_id: Optional[int] = None
     created_at: datetime
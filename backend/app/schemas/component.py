@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from typing import Optional
-from datetime import datetime
+from datetime import date, datetime
 
 
 class ComponentBase(BaseModel):
@@ -139,6 +139,23 @@ class SCImportStats(BaseModel):
     locations_updated: int = 0
     errors: list[str] = []
     sc_version: Optional[str] = None
+    items_processed: int = 0
+    pages_skipped: int = 0  # Unveränderte Seiten (Hash/ETag), nicht neu geschrieben
+    duration_seconds: Optional[float] = None
+    items_per_second: Optional[float] = None
+
+
+class SCImportProgress(BaseModel):
+    """Fortschritt des SC-Imports (Hintergrund-Job)."""
+    status: str  # idle, running, completed, failed
+    phase: Optional[str] = None  # starting, components, locations, done
+    pages_done: int = 0
+    total_pages: Optional[int] = None
+    resumed_from_page: Optional[int] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    stats: Optional[SCImportStats] = None
 
 
 # UEX Price Schemas
@@ -156,6 +173,32 @@ class ItemPriceResponse(BaseModel):
         from_attributes = True
 
 
+class ComponentPriceSummary(BaseModel):
+    """Vorberechnete Preis-Kennzahlen einer Komponente (ganze aUEC)."""
+    component_id: int
+    min_buy: Optional[int] = None
+    min_buy_terminal: Optional[str] = None
+    max_sell: Optional[int] = None
+    max_sell_terminal: Optional[str] = None
+    median_buy: Optional[int] = None
+    median_sell: Optional[int] = None
+    terminal_count: int = 0
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class PriceHistoryPoint(BaseModel):
+    """Ein Tag im Preisverlauf (bester Preis über alle Terminals)."""
+    day: date
+    min_buy: Optional[int] = None
+    max_sell: Optional[int] = None
+
+    class Config:
+        from_attributes = True
+
+
 class UEXSyncStats(BaseModel):
     """Statistiken nach einem UEX-Sync."""
     id: int
@@ -166,6 +209,13 @@ class UEXSyncStats(BaseModel):
     items_unmatched: int = 0
     status: str
     errors: Optional[str] = None
+    duration_ms: Optional[int] = None
+    rows_per_second: Optional[float] = None
+    mode: Optional[str] = None
+    rows_inserted: Optional[int] = None
+    rows_updated: Optional[int] = None
+    rows_deleted: Optional[int] = None
+    rows_unchanged: Optional[int] = None
 
     class Config:
         from_attributes = True
@@ -251,6 +251,12 @@ class MissionCreate(MissionBase):
     template_id: Optional[int] = None  # Optional: Von Template erstellen
 
 
+class MissionCloneRequest(BaseModel):
+    """Mission als neuen Entwurf kopieren (Einheiten, Positionen, Phasen)."""
+    title: Optional[str] = None                # Standard: "<Titel> (Kopie)"
+    scheduled_date: Optional[datetime] = None  # Standard: Termin der Vorlage
+
+
 class MissionUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None  # Legacy-Feld
@@ -279,6 +285,7 @@ class MissionResponse(MissionBase):
     created_by: Optional[UserResponse] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    revision: int = 0
 
     # Counts
     registration_count: int = 0
@@ -422,3 +429,40 @@ class AssignmentDataResponse(BaseModel):
     operational_roles: List[GroupedOperationalRole]
     eligible_users: List[EligibleUser]
     can_manage: bool
+
+
+# ============== Auto-Zuweisung ==============
+
+class AutoAssignmentProposal(BaseModel):
+    """Eine vorgeschlagene Zuweisung."""
+    position_id: int
+    position_name: str
+    unit_name: str
+    user_id: int
+    user_name: Optional[str] = None
+    score: int
+    is_training: bool = False   # Geforderte Einsatzrolle nur "in Ausbildung"
+    is_preferred: bool = False  # Wunsch-Einheit oder -Position getroffen
+
+
+class AutoAssignProposalResponse(BaseModel):
+    """Optimaler Zuweisungsvorschlag für alle freien Plätze."""
+    mission_id: int
+    revision: int  # Beim Übernehmen mitschicken - schützt vor zwischenzeitlichen Änderungen
+    assignments: List[AutoAssignmentProposal]
+    unassigned_user_ids: List[int]
+    open_slots: int
+    total_score: int
+    duration_ms: float
+
+
+class AutoAssignApplyItem(BaseModel):
+    position_id: int
+    user_id: int
+    is_training: bool = False
+
+
+class AutoAssignApplyRequest(BaseModel):
+    """Vorschlag (ggf. bearbeitet) in einem Schritt übernehmen."""
+    revision: int  # Revision des Vorschlags, 409 wenn die Mission inzwischen geändert wurde
+    assignments: List[AutoAssignApplyItem]
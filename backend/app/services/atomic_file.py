@@ -0,0 +1,25 @@
+"""
+Atomares Schreiben von Dateien (temporäre Datei im Zielordner + os.replace).
+Leser sehen so entweder den alten oder den vollständigen neuen Inhalt, nie
+eine halb geschriebene Datei.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Schreibt data atomar nach path (legt fehlende Ordner an).
+
+    Bei einem Fehler wird die temporäre Datei entfernt und der Fehler weitergereicht.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,319 @@
+"""
+Automatische Crew-Zuweisung für Einsätze.
+
+Aus Anmeldungen (Wunsch-Einheit/-Position), den Rollen-Anforderungen der
+Positionen (MissionPosition.required_role_id), den Einsatzrollen der User
+(UserOperationalRole) und der Einsatzbereitschaft (UserLoadout.is_ready)
+wird eine Punktematrix Person x freier Platz gebaut und mit der
+Ungarischen Methode (O(n²·m)) in einem Durchlauf optimal gelöst.
+
+Das Ergebnis ist ein Vorschlag; apply_assignments() schreibt ihn mit einem
+Bulk-Insert. Bestehende Zuweisungen bleiben unangetastet.
+"""
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.models.loadout import UserLoadout
+from app.models.mission import MissionAssignment, MissionPosition, MissionRegistration, MissionUnit
+from app.models.staffel import UserOperationalRole
+from app.models.user import User
+from app.services.mission_cache import bump_revision
+
+# Punkte (höher = besser)
+SCORE_SLOT = 100            # Jeder besetzte Platz
+SCORE_REQUIRED = 30         # Pflicht-Position
+SCORE_PREFERRED_POSITION = 60
+SCORE_PREFERRED_UNIT = 25
+SCORE_QUALIFIED = 20        # Geforderte Einsatzrolle vorhanden
+SCORE_IN_TRAINING = 5       # Geforderte Einsatzrolle nur "in Ausbildung"
+SCORE_READY = 10            # Mindestens ein angemeldetes Schiff vollständig gefittet
+
+MAX_SCORE = (SCORE_SLOT + SCORE_REQUIRED + SCORE_PREFERRED_POSITION + SCORE_PREFERRED_UNIT
+             + SCORE_QUALIFIED + SCORE_READY)
+FORBIDDEN = 10 ** 9         # Kosten für unzulässige Paare (fehlende Einsatzrolle)
+
+
+@dataclass
+class Slot:
+    """Ein freier Platz (Positionen mit max_count > 1 ergeben mehrere Slots)."""
+    position_id: int
+    unit_id: int
+    required_role_id: Optional[int]
+    is_required: bool
+
+
+@dataclass
+class Candidate:
+    """Ein angemeldeter, noch nicht zugewiesener User."""
+    user_id: int
+    preferred_unit_id: Optional[int]
+    preferred_position_id: Optional[int]
+    is_ready: bool
+    roles: Dict[int, bool] = field(default_factory=dict)  # role_id -> is_training
+
+
+def score(candidate: Candidate, slot: Slot) -> Optional[int]:
+    """Punkte für candidate auf slot, None wenn unzulässig."""
+    points = SCORE_SLOT
+    if slot.required_role_id:
+        if slot.required_role_id not in candidate.roles:
+            return None
+        points += SCORE_IN_TRAINING if candidate.roles[slot.required_role_id] else SCORE_QUALIFIED
+    if slot.is_required:
+        points += SCORE_REQUIRED
+    if candidate.preferred_position_id == slot.position_id:
+        points += SCORE_PREFERRED_POSITION
+    if candidate.preferred_unit_id == slot.unit_id:
+        points += SCORE_PREFERRED_UNIT
+    if candidate.is_ready:
+        points += SCORE_READY
+    return points
+
+
+def hungarian(cost: List[List[int]]) -> List[Tuple[int, int]]:
+    """Ungarische Methode (Potentiale + kürzeste Augmentierungspfade).
+
+    cost: n x m Matrix mit n <= m. Gibt die Paare (zeile, spalte) der
+    kostenminimalen Zuordnung zurück, jede Zeile genau einmal.
+    """
+    n = len(cost)
+    m = len(cost[0]) if n else 0
+    inf = float("inf")
+    u = [0] * (n + 1)
+    v = [0] * (m + 1)
+    p = [0] * (m + 1)    # p[j] = Zeile auf Spalte j (1-basiert, 0 = frei)
+    way = [0] * (m + 1)
+    columns = range(1, m + 1)
+
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            row = cost[i0 - 1]
+            ui0 = u[i0]
+            delta = inf
+            j1 = 0
+            for j in columns:
+                if not used[j]:
+                    cur = row[j - 1] - ui0 - v[j]
+                    if cur < minv[j]:
+                        minv[j] = cur
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    return [(p[j] - 1, j - 1) for j in columns if p[j]]
+
+
+def solve(candidates: List[Candidate], slots: List[Slot]) -> List[Tuple[Candidate, Slot, int]]:
+    """Punktemaximale Zuordnung Person -> Slot (jede Person höchstens einmal)."""
+    if not candidates or not slots:
+        return []
+
+    scores = [[score(c, s) for s in slots] for c in candidates]
+    cost = [[FORBIDDEN if pts is None else MAX_SCORE - pts for pts in row] for row in scores]
+
+    # Die Methode braucht Zeilen <= Spalten - sonst transponiert lösen
+    if len(candidates) <= len(slots):
+        pairs = hungarian(cost)
+    else:
+        pairs = [(i, j) for j, i in hungarian([list(col) for col in zip(*cost)])]
+
+    return [
+        (candidates[i], slots[j], scores[i][j])
+        for i, j in sorted(pairs, key=lambda pair: pair[1])
+        if scores[i][j] is not None
+    ]
+
+
+# ============== Laden / Schreiben ==============
+
+def load_problem(db: Session, mission_id: int) -> Tuple[List[Candidate], List[Slot], dict]:
+    """Lädt freie Slots und Kandidaten einer Mission mit einer festen Anzahl Queries.
+    Gibt (candidates, slots, positions) zurück; positions: id -> (name, unit_name)."""
+    positions = db.execute(
+        select(
+            MissionPosition.id, MissionPosition.name, MissionPosition.max_count,
+            MissionPosition.required_role_id, MissionPosition.is_required,
+            MissionUnit.id, MissionUnit.name,
+        )
+        .join(MissionUnit, MissionPosition.unit_id == MissionUnit.id)
+        .where(MissionUnit.mission_id == mission_id)
+        .order_by(MissionUnit.sort_order, MissionUnit.id, MissionPosition.sort_order, MissionPosition.id)
+    ).all()
+    position_ids = [row[0] for row in positions]
+
+    # Bestehende Zuweisungen (Backups belegen keinen Platz)
+    occupied: Dict[int, int] = {}
+    assigned_users: Set[int] = set()
+    if position_ids:
+        for position_id, user_id, is_backup in db.execute(
+            select(MissionAssignment.position_id, MissionAssignment.user_id, MissionAssignment.is_backup)
+            .where(MissionAssignment.position_id.in_(position_ids))
+        ):
+            if user_id:
+                assigned_users.add(user_id)
+            if not is_backup:
+                occupied[position_id] = occupied.get(position_id, 0) + 1
+
+    slots = []
+    for position_id, _, max_count, required_role_id, is_required, unit_id, _ in positions:
+        free = (max_count or 1) - occupied.get(position_id, 0)
+        slots.extend(Slot(position_id, unit_id, required_role_id, bool(is_required)) for _ in range(free))
+
+    registrations = db.execute(
+        select(
+            MissionRegistration.user_id, MissionRegistration.preferred_unit_id,
+            MissionRegistration.preferred_position_id, MissionRegistration.user_loadout_ids,
+        )
+        .where(
+            MissionRegistration.mission_id == mission_id,
+            MissionRegistration.status != "declined",
+        )
+        .order_by(MissionRegistration.registered_at, MissionRegistration.id)
+    ).all()
+    registrations = [r for r in registrations if r.user_id not in assigned_users]
+    user_ids = [r.user_id for r in registrations]
+
+    roles: Dict[int, Dict[int, bool]] = {}
+    if user_ids:
+        for user_id, role_id, is_training in db.execute(
+            select(UserOperationalRole.user_id, UserOperationalRole.operational_role_id,
+                   UserOperationalRole.is_training)
+            .where(UserOperationalRole.user_id.in_(user_ids))
+        ):
+            user_roles = roles.setdefault(user_id, {})
+            # Volle Qualifikation schlägt "in Ausbildung"
+            user_roles[role_id] = user_roles.get(role_id, True) and bool(is_training)
+
+    loadout_ids = {lid for r in registrations for lid in (r.user_loadout_ids or [])}
+    ready_loadouts: Set[int] = set()
+    if loadout_ids:
+        ready_loadouts = set(db.execute(
+            select(UserLoadout.id).where(UserLoadout.id.in_(loadout_ids), UserLoadout.is_ready == True)
+        ).scalars())
+
+    candidates = [
+        Candidate(
+            user_id=r.user_id,
+            preferred_unit_id=r.preferred_unit_id,
+            preferred_position_id=r.preferred_position_id,
+            is_ready=any(lid in ready_loadouts for lid in (r.user_loadout_ids or [])),
+            roles=roles.get(r.user_id, {}),
+        )
+        for r in registrations
+    ]
+    position_names = {row[0]: (row[1], row[6]) for row in positions}
+    return candidates, slots, position_names
+
+
+def build_proposal(db: Session, mission_id: int, revision: int) -> dict:
+    """Berechnet einen Zuweisungsvorschlag (schreibt nichts)."""
+    start = time.perf_counter()
+    candidates, slots, position_names = load_problem(db, mission_id)
+    result = solve(candidates, slots)
+
+    names = {}
+    if result:
+        names = dict(db.execute(
+            select(User.id, func.coalesce(User.display_name, User.username))
+            .where(User.id.in_([c.user_id for c, _, _ in result]))
+        ).all())
+
+    assigned = {c.user_id for c, _, _ in result}
+    filled: Dict[int, int] = {}
+    for _, slot, _ in result:
+        filled[slot.position_id] = filled.get(slot.position_id, 0) + 1
+
+    return {
+        "mission_id": mission_id,
+        "revision": revision,
+        "assignments": [
+            {
+                "position_id": slot.position_id,
+                "position_name": position_names[slot.position_id][0],
+                "unit_name": position_names[slot.position_id][1],
+                "user_id": candidate.user_id,
+                "user_name": names.get(candidate.user_id),
+                "score": points,
+                "is_training": bool(slot.required_role_id and candidate.roles.get(slot.required_role_id)),
+                "is_preferred": candidate.preferred_position_id == slot.position_id
+                or candidate.preferred_unit_id == slot.unit_id,
+            }
+            for candidate, slot, points in result
+        ],
+        "unassigned_user_ids": [c.user_id for c in candidates if c.user_id not in assigned],
+        "open_slots": len(slots) - len(result),
+        "total_score": sum(points for _, _, points in result),
+        "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+
+
+def apply_assignments(db: Session, mission_id: int, items: list, assigned_by_id: int) -> int:
+    """Schreibt Zuweisungen (position_id, user_id, is_training) per Bulk-Insert
+    und markiert die Anmeldungen als "assigned". Kein Commit.
+
+    Raises:
+        ValueError: Position gehört nicht zur Mission, User nicht angemeldet
+            oder Position bereits voll
+    """
+    if not items:
+        return 0
+
+    candidates, slots, _ = load_problem(db, mission_id)
+    free: Dict[int, int] = {}
+    for slot in slots:
+        free[slot.position_id] = free.get(slot.position_id, 0) + 1
+    open_users = {c.user_id for c in candidates}
+
+    seen_users = set()
+    for item in items:
+        if item.user_id not in open_users or item.user_id in seen_users:
+            raise ValueError(f"User {item.user_id} ist nicht (mehr) zuweisbar")
+        if free.get(item.position_id, 0) <= 0:
+            raise ValueError(f"Position {item.position_id} ist nicht frei")
+        free[item.position_id] -= 1
+        seen_users.add(item.user_id)
+
+    db.execute(MissionAssignment.__table__.insert(), [
+        {
+            "position_id": item.position_id,
+            "user_id": item.user_id,
+            "is_backup": False,
+            "is_training": item.is_training,
+            "assigned_by_id": assigned_by_id,
+        }
+        for item in items
+    ])
+    db.execute(
+        update(MissionRegistration.__table__)
+        .where(
+            MissionRegistration.__table__.c.mission_id == mission_id,
+            MissionRegistration.__table__.c.user_id.in_(seen_users),
+        )
+        .values(status="assigned")
+    )
+    bump_revision(db, mission_id)
+    return len(items)
@@ -0,0 +1,110 @@
+"""
+Blob Store für Binärdaten (z.B. Anwesenheits-Screenshots).
+Inhaltsadressiert: Der Schlüssel ist der SHA-256 der Daten, identische
+Uploads werden also nur einmal gespeichert.
+
+FileSystemBlobStore ist die lokale Variante und steht gleichzeitig als
+Ersatz für einen Object Storage (S3 o.ä.) - weitere Backends implementieren
+dieselbe Schnittstelle und werden in get_blob_store() ausgewählt.
+"""
+import hashlib
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+from app.config import get_settings
+from app.services.atomic_file import atomic_write_bytes
+
+# Chunk-Größe beim Streamen von Blobs
+CHUNK_SIZE = 64 * 1024
+
+
+class BlobStore(ABC):
+    """Schnittstelle aller Blob-Store-Backends."""
+
+    @abstractmethod
+    def put(self, data: bytes) -> str:
+        """Speichert Daten und gibt den Schlüssel zurück."""
+
+    @abstractmethod
+    def open(self, key: str) -> BinaryIO:
+        """Öffnet einen Blob zum Lesen."""
+
+    @abstractmethod
+    def size(self, key: str) -> int:
+        """Größe in Bytes."""
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """True, wenn der Blob vorhanden ist."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Löscht den Blob (kein Fehler, wenn er fehlt)."""
+
+    def read(self, key: str) -> bytes:
+        with self.open(key) as f:
+            return f.read()
+
+    def iter_range(self, key: str, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+        """Liest Bytes [start, end] (inklusive) in Chunks - für Streaming und Range-Requests."""
+        if end is None:
+            end = self.size(key) - 1
+        remaining = end - start + 1
+        with self.open(key) as f:
+            f.seek(start)
+            while remaining > 0:
+                chunk = f.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+
+class FileSystemBlobStore(BlobStore):
+    """Blobs als Dateien unter root/<aa>/<bb>/<sha256>."""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    @staticmethod
+    def key_for(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        if len(key) != 64 or not all(c in "0123456789abcdef" for c in key):
+            raise ValueError(f"Ungültiger Blob-Schlüssel: {key}")
+        return self.root / key[:2] / key[2:4] / key
+
+    def put(self, data: bytes) -> str:
+        key = self.key_for(data)
+        path = self._path(key)
+        if path.exists():
+            return key
+
+        atomic_write_bytes(path, data)
+        return key
+
+    def open(self, key: str) -> BinaryIO:
+        return open(self._path(key), "rb")
+
+    def size(self, key: str) -> int:
+        return self._path(key).stat().st_size
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def delete(self, key: str) -> None:
+        path = self._path(key)
+        if path.exists():
+            path.unlink()
+
+
+@lru_cache()
+def get_blob_store() -> BlobStore:
+    """Gibt den konfigurierten Blob Store zurück."""
+    settings = get_settings()
+    if settings.blob_store_backend == "filesystem":
+        return FileSystemBlobStore(settings.blob_store_path)
+    raise ValueError(f"Unbekanntes Blob-Store-Backend: {settings.blob_store_backend}")
@@ -0,0 +1,59 @@
+"""
+Datei-Cache für dekodierte Erkul-Loadouts (ein JSON pro Code, mit TTL).
+Erkul-Links werden beim Bulk-Import typischerweise erst in der Vorschau und
+direkt danach beim Import abgerufen - der zweite Abruf kommt aus dem Cache.
+
+Abgelaufene Einträge werden beim Schreiben regelmäßig weggeräumt, zusätzlich
+ist die Zahl der Dateien auf erkul_cache_max_entries begrenzt.
+"""
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Optional
+
+from app.config import get_settings
+from app.services.atomic_file import atomic_write_bytes
+from app.services.file_cache import CacheSweeper
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+_sweeper = CacheSweeper(
+    Path(settings.erkul_cache_path), "*.json",
+    max_age_seconds=settings.erkul_cache_ttl_seconds,
+    max_entries=settings.erkul_cache_max_entries,
+)
+
+
+def _path(code: str) -> Optional[Path]:
+    # Codes sind alphanumerisch, alles andere wird nicht gecacht (kein Path-Traversal)
+    if not code or not code.isalnum():
+        return None
+    return Path(settings.erkul_cache_path) / f"{code}.json"
+
+
+def get_cached_loadout(code: str) -> Optional[dict]:
+    """Gibt das gecachte Loadout zurück (None wenn nicht vorhanden oder abgelaufen)."""
+    path = _path(code)
+    if path is None or not path.exists():
+        return None
+    if time.time() - path.stat().st_mtime > settings.erkul_cache_ttl_seconds:
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def store_loadout(code: str, loadout: dict) -> None:
+    """Speichert ein dekodiertes Loadout (atomar, Fehler werden ignoriert)."""
+    path = _path(code)
+    if path is None:
+        return
+    try:
+        atomic_write_bytes(path, json.dumps(loadout).encode("utf-8"))
+    except OSError as e:
+        logger.warning("Erkul-Cache Fehler: %s", e)
+        return
+    _sweeper.maybe_sweep()
@@ -0,0 +1,56 @@
+"""
+Aufräumen der Datei-Caches (Erkul, FleetYards).
+Abgelaufene Dateien werden gelöscht, darüber hinaus bleiben höchstens
+max_entries Dateien (die neuesten) liegen.
+"""
+import threading
+import time
+from pathlib import Path
+
+
+class CacheSweeper:
+    """Räumt ein Cache-Verzeichnis auf, höchstens einmal pro interval_seconds."""
+
+    def __init__(self, root: Path, pattern: str, max_age_seconds: float, max_entries: int,
+                 interval_seconds: float = 600):
+        self.root = root
+        self.pattern = pattern
+        self.max_age_seconds = max_age_seconds
+        self.max_entries = max_entries
+        self.interval_seconds = interval_seconds
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+        self.removed = 0
+
+    def maybe_sweep(self) -> None:
+        """Nach einem Schreibzugriff aufrufen; läuft nur, wenn das Intervall um ist."""
+        with self._lock:
+            now = time.time()
+            if now - self._last_sweep < self.interval_seconds:
+                return
+            self._last_sweep = now
+        self.sweep()
+
+    def sweep(self) -> int:
+        """Löscht alte Dateien und alles über max_entries. Gibt die Anzahl zurück."""
+        now = time.time()
+        files = []
+        for path in self.root.glob(self.pattern):
+            try:
+                files.append((path.stat().st_mtime, path))
+            except OSError:
+                continue  # gleichzeitig gelöscht
+        files.sort(reverse=True)  # neueste zuerst
+
+        removed = 0
+        for index, (mtime, path) in enumerate(files):
+            if index < self.max_entries and now - mtime <= self.max_age_seconds:
+                continue
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        with self._lock:
+            self.removed += removed
+        return removed
@@ -0,0 +1,176 @@
+"""
+Persistenter Cache für FleetYards-Antworten (ein JSON pro Anfrage, mit TTL).
+
+Frische Einträge werden lokal beantwortet. Abgelaufene Einträge werden mit
+If-None-Match / If-Modified-Since revalidiert (304 = Eintrag bleibt gültig).
+Ist FleetYards nicht erreichbar oder antwortet mit 5xx, wird der letzte
+bekannte Stand ausgeliefert - Erkul-Imports funktionieren so auch offline.
+
+Einträge älter als fleetyards_cache_max_age_seconds werden beim Schreiben
+regelmäßig weggeräumt, die Zahl der Dateien ist zusätzlich begrenzt.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+
+from app.config import get_settings
+from app.services.atomic_file import atomic_write_bytes
+from app.services.file_cache import CacheSweeper
+from app.services.http_clients import http_clients
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Kein Eintrag und Upstream nicht erreichbar
+MISSING = object()
+
+
+class FleetYardsCache:
+    """Datei-Cache mit Revalidierung und Hit/Miss-Zählern."""
+
+    def __init__(self, root: str, ttl_seconds: int, max_age_seconds: int, max_entries: int):
+        self.root = Path(root)
+        self.ttl_seconds = ttl_seconds
+        self.sweeper = CacheSweeper(self.root, "*/*.json", max_age_seconds, max_entries)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.stale_served = 0
+
+    def _count(self, attribute: str):
+        with self._lock:
+            setattr(self, attribute, getattr(self, attribute) + 1)
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.root / digest[:2] / f"{digest}.json"
+
+    def _load(self, key: str) -> Optional[dict]:
+        try:
+            return json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, key: str, entry: dict):
+        path = self._path(key)
+        try:
+            atomic_write_bytes(path, json.dumps(entry).encode("utf-8"))
+        except OSError as e:
+            logger.warning("FleetYards-Cache Fehler: %s", e)
+            return
+        self.sweeper.maybe_sweep()
+
+    def _lookup(self, key: str) -> tuple:
+        """Gibt (entry, fresh, headers) zurück; headers für die Revalidierung."""
+        entry = self._load(key)
+        if entry and time.time() - entry["fetched_at"] < self.ttl_seconds:
+            return entry, True, {}
+
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return entry, False, headers
+
+    def _handle_response(self, key: str, entry: Optional[dict], resp: Optional[httpx.Response]) -> Any:
+        """Wertet die Upstream-Antwort aus (resp=None: nicht erreichbar)."""
+        if resp is not None and resp.status_code == 304 and entry:
+            self._count("revalidated")
+            entry["fetched_at"] = time.time()
+            self._store(key, entry)
+            return entry["data"]
+
+        if resp is not None and resp.status_code == 200:
+            self._count("misses")
+            data = resp.json()
+            self._store(key, {
+                "key": key,
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+                "data": data,
+            })
+            return data
+
+        if resp is not None and resp.status_code < 500:
+            self._count("misses")
+            return None
+
+        # Netzwerkfehler oder 5xx: letzten bekannten Stand ausliefern
+        if entry:
+            self._count("stale_served")
+            return entry["data"]
+        self._count("misses")
+        return MISSING
+
+    @staticmethod
+    def _request_kwargs(params: Optional[dict], headers: dict, timeout: Optional[float]) -> dict:
+        kwargs = {"params": params, "headers": headers}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        return kwargs
+
+    def get_json(self, key: str, url: str, params: Optional[dict] = None, timeout: Optional[float] = None) -> Any:
+        """JSON einer GET-Anfrage, aus dem Cache oder von FleetYards.
+
+        Returns:
+            Die Daten, None bei 4xx (z.B. Schiff unbekannt) oder MISSING,
+            wenn weder Upstream noch Cache eine Antwort liefern.
+        """
+        entry, fresh, headers = self._lookup(key)
+        if fresh:
+            self._count("hits")
+            return entry["data"]
+
+        try:
+            resp = http_clients.get_sync("fleetyards").get(url, **self._request_kwargs(params, headers, timeout))
+        except httpx.HTTPError as e:
+            logger.warning("FleetYards nicht erreichbar (%s), nutze Cache", e)
+            resp = None
+        return self._handle_response(key, entry, resp)
+
+    async def get_json_async(
+        self, key: str, url: str, params: Optional[dict] = None, timeout: Optional[float] = None
+    ) -> Any:
+        """Wie get_json, aber über den async Client (für Endpunkte im Event-Loop)."""
+        entry, fresh, headers = self._lookup(key)
+        if fresh:
+            self._count("hits")
+            return entry["data"]
+
+        try:
+            async with http_clients.async_session("fleetyards") as client:
+                resp = await client.get(url, **self._request_kwargs(params, headers, timeout))
+        except httpx.HTTPError as e:
+            logger.warning("FleetYards nicht erreichbar (%s), nutze Cache", e)
+            resp = None
+        return self._handle_response(key, entry, resp)
+
+    def stats(self) -> dict:
+        """Zähler für Monitoring."""
+        lookups = self.hits + self.misses + self.revalidated + self.stale_served
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "stale_served": self.stale_served,
+            "hit_rate": round((lookups - self.misses) / lookups, 4) if lookups else 0.0,
+            "ttl_seconds": self.ttl_seconds,
+            "swept": self.sweeper.removed,
+        }
+
+
+fleetyards_cache = FleetYardsCache(
+    settings.fleetyards_cache_path,
+    settings.fleetyards_cache_ttl_seconds,
+    settings.fleetyards_cache_max_age_seconds,
+    settings.fleetyards_cache_max_entries,
+)
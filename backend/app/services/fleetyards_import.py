@@ -1,9 +1,9 @@
 """FleetYards API Import für Schiffsdaten und Hardpoints."""
 
-import httpx
 from sqlalchemy.orm import Session
 
 from app.models.loadout import Ship, ShipHardpoint
+from app.services.fleetyards_cache import MISSING, fleetyards_cache
 
 FLEETYARDS_BASE = "https://api.fleetyards.net/v1"
 
@@ -54,21 +54,26 @@ def _parse_size(size_value) -> int:
 
 
 def fetch_ship_model(slug: str) -> dict | None:
-    """Hole Schiffsdaten von FleetYards API."""
-    with httpx.Client(timeout=30.0, follow_redirects=True) as client:
-        resp = client.get(f"{FLEETYARDS_BASE}/models/{slug}")
-        if resp.status_code != 200:
-            return None
-        return resp.json()
+    """Hole Schiffsdaten von FleetYards API (über den Cache)."""
+    data = fleetyards_cache.get_json(f"model:{slug}", f"{FLEETYARDS_BASE}/models/{slug}")
+    return None if data is MISSING else data
 
 
 def fetch_ship_hardpoints(slug: str) -> list[dict] | None:
-    """Hole Hardpoints von FleetYards API."""
-    with httpx.Client(timeout=30.0, follow_redirects=True) as client:
-        resp = client.get(f"{FLEETYARDS_BASE}/models/{slug}/hardpoints")
-        if resp.status_code != 200:
-            return None
-        return resp.json()
+    """Hole Hardpoints von FleetYards API (über den Cache)."""
+    data = fleetyards_cache.get_json(f"hardpoints:{slug}", f"{FLEETYARDS_BASE}/models/{slug}/hardpoints")
+    return None if data is MISSING else data
+
+
+async def fetch_ship_async(slug: str) -> tuple[dict | None, list[dict] | None]:
+    """Schiffsdaten + Hardpoints über den async Client (für store_ship_from_fleetyards)."""
+    model_data = await fleetyards_cache.get_json_async(f"model:{slug}", f"{FLEETYARDS_BASE}/models/{slug}")
+    if model_data is MISSING or not model_data:
+        return None, None
+    hardpoint_data = await fleetyards_cache.get_json_async(
+        f"hardpoints:{slug}", f"{FLEETYARDS_BASE}/models/{slug}/hardpoints"
+    )
+    return model_data, None if hardpoint_data is MISSING else hardpoint_data
 
 
 def import_ship_from_fleetyards(db: Session, slug: str) -> Ship:
@@ -81,10 +86,21 @@ def import_ship_from_fleetyards(db: Session, slug: str) -> Ship:
         ValueError: Wenn Schiff nicht gefunden
     """
     model_data = fetch_ship_model(slug)
+    hardpoint_data = fetch_ship_hardpoints(slug) if model_data else None
+    return store_ship_from_fleetyards(db, slug, model_data, hardpoint_data)
+
+
+def store_ship_from_fleetyards(
+    db: Session, slug: str, model_data: dict | None, hardpoint_data: list[dict] | None
+) -> Ship:
+    """Schreibt bereits abgerufene FleetYards-Daten (Schiff + Hardpoints) in die DB.
+
+    Raises:
+        ValueError: Wenn Schiff oder Hardpoints fehlen
+    """
     if not model_data:
         raise ValueError(f"Schiff '{slug}' nicht bei FleetYards gefunden")
 
-    hardpoint_data = fetch_ship_hardpoints(slug)
     if hardpoint_data is None:
         raise ValueError(f"Hardpoints für '{slug}' konnten nicht geladen werden")
 
@@ -167,21 +183,38 @@ def import_ship_from_fleetyards(db: Session, slug: str) -> Ship:
     return ship
 
 
+def _search_params(query: str) -> dict:
+    return {"q[nameCont]": query, "perPage": 10}
+
+
+def _search_results(results) -> list[dict]:
+    if not isinstance(results, list):
+        return []
+    return [
+        {
+            "name": m.get("name", ""),
+            "slug": m.get("slug", ""),
+            "manufacturer": m.get("manufacturer", {}).get("name", "") if m.get("manufacturer") else "",
+        }
+        for m in results
+    ]
+
+
 def search_ships_fleetyards(query: str) -> list[dict]:
-    """Suche Schiffe auf FleetYards (für Autocomplete)."""
-    with httpx.Client(timeout=15.0, follow_redirects=True) as client:
-        resp = client.get(
-            f"{FLEETYARDS_BASE}/models",
-            params={"q[nameCont]": query, "perPage": 10},
-        )
-        if resp.status_code != 200:
-            return []
-        results = resp.json()
-        return [
-            {
-                "name": m.get("name", ""),
-                "slug": m.get("slug", ""),
-                "manufacturer": m.get("manufacturer", {}).get("name", "") if m.get("manufacturer") else "",
-            }
-            for m in results
-        ]
+    """Suche Schiffe auf FleetYards (für Autocomplete, über den Cache)."""
+    return _search_results(fleetyards_cache.get_json(
+        f"search:{query.strip().lower()}",
+        f"{FLEETYARDS_BASE}/models",
+        params=_search_params(query),
+        timeout=15.0,
+    ))
+
+
+async def search_ships_fleetyards_async(query: str) -> list[dict]:
+    """Wie search_ships_fleetyards, aber über den async Client."""
+    return _search_results(await fleetyards_cache.get_json_async(
+        f"search:{query.strip().lower()}",
+        f"{FLEETYARDS_BASE}/models",
+        params=_search_params(query),
+        timeout=15.0,
+    ))
@@ -0,0 +1,217 @@
+"""
+Gemeinsame HTTP-Clients für alle externen Integrationen (SC-Wiki, UEX,
+FleetYards, Erkul, Discord).
+
+Pro Integration (= pro Host) ein langlebiger Client mit eigenem Connection-Pool,
+damit TCP- und TLS-Verbindungen wiederverwendet werden. HTTP/2 wird genutzt,
+wenn das Paket "h2" installiert ist. Verbindungsfehler werden vom Transport
+automatisch wiederholt; Status-basierte Retries bleiben Sache der Aufrufer.
+
+Die async Clients gehören zum Event-Loop des Servers (in der Lifespan von
+main.py gestartet/geschlossen). Aufrufer nutzen async_session(): im Server-Loop
+liefert es den gemeinsamen Client, in jedem anderen Loop (SC-Import im
+Hintergrund-Thread, Scripts, Tests ohne Lifespan) einen eigenen.
+"""
+import asyncio
+import importlib.util
+import threading
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Optional
+
+import httpx
+
+from app.config import get_settings
+
+settings = get_settings()
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class ClientProfile:
+    """Konfiguration eines Clients."""
+    timeout: float
+    headers: dict = field(default_factory=dict)
+
+
+PROFILES: Dict[str, ClientProfile] = {
+    "sc_wiki": ClientProfile(timeout=30.0),
+    "uex": ClientProfile(timeout=60.0),
+    "fleetyards": ClientProfile(timeout=30.0),
+    "erkul": ClientProfile(
+        timeout=15.0,
+        headers={"Origin": "https://www.erkul.games", "Referer": "https://www.erkul.games/"},
+    ),
+    "discord": ClientProfile(timeout=15.0),
+}
+
+
+class ClientMetrics:
+    """Zähler pro Client: Requests vs. neu aufgebaute Verbindungen."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+        self.http2_responses = 0
+
+    def count(self, attribute: str):
+        with self._lock:
+            setattr(self, attribute, getattr(self, attribute) + 1)
+
+    def stats(self) -> dict:
+        reused = max(self.requests - self.connections_opened, 0)
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "connection_reuse_rate": round(reused / self.requests, 4) if self.requests else 0.0,
+            "http2_responses": self.http2_responses,
+        }
+
+
+class HTTPClientRegistry:
+    """Registry der gemeinsamen Clients (ein Singleton pro Prozess)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_clients: Dict[str, httpx.AsyncClient] = {}
+        self._sync_clients: Dict[str, httpx.Client] = {}
+        self.metrics: Dict[str, ClientMetrics] = {name: ClientMetrics() for name in PROFILES}
+
+    # ---------- Erzeugung ----------
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=settings.http_max_connections_per_host,
+            max_keepalive_connections=settings.http_max_connections_per_host,
+            keepalive_expiry=settings.http_keepalive_seconds,
+        )
+
+    def _timeout(self, profile: ClientProfile) -> httpx.Timeout:
+        return httpx.Timeout(profile.timeout, connect=min(profile.timeout, 10.0))
+
+    def _create_async(self, name: str) -> httpx.AsyncClient:
+        profile = PROFILES[name]
+        metrics = self.metrics[name]
+
+        async def trace(event: str, info: dict):
+            if event == "connection.connect_tcp.complete":
+                metrics.count("connections_opened")
+
+        async def on_request(request: httpx.Request):
+            metrics.count("requests")
+            request.extensions["trace"] = trace
+
+        async def on_response(response: httpx.Response):
+            if response.http_version == "HTTP/2":
+                metrics.count("http2_responses")
+
+        return httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE and settings.http2_enabled,
+                limits=self._limits(),
+                retries=settings.http_connect_retries,
+            ),
+            timeout=self._timeout(profile),
+            headers=profile.headers,
+            follow_redirects=True,
+            event_hooks={"request": [on_request], "response": [on_response]},
+        )
+
+    def _create_sync(self, name: str) -> httpx.Client:
+        profile = PROFILES[name]
+        metrics = self.metrics[name]
+
+        def trace(event: str, info: dict):
+            if event == "connection.connect_tcp.complete":
+                metrics.count("connections_opened")
+
+        def on_request(request: httpx.Request):
+            metrics.count("requests")
+            request.extensions["trace"] = trace
+
+        def on_response(response: httpx.Response):
+            if response.http_version == "HTTP/2":
+                metrics.count("http2_responses")
+
+        return httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=HTTP2_AVAILABLE and settings.http2_enabled,
+                limits=self._limits(),
+                retries=settings.http_connect_retries,
+            ),
+            timeout=self._timeout(profile),
+            headers=profile.headers,
+            follow_redirects=True,
+            event_hooks={"request": [on_request], "response": [on_response]},
+        )
+
+    # ---------- Zugriff ----------
+
+    def start(self):
+        """Merkt sich den Event-Loop des Servers (Lifespan-Startup)."""
+        self._loop = asyncio.get_running_loop()
+
+    def _in_server_loop(self) -> bool:
+        return self._loop is not None and asyncio.get_running_loop() is self._loop
+
+    def get_async(self, name: str) -> httpx.AsyncClient:
+        """Gemeinsamer async Client (nur im Event-Loop des Servers verwenden).
+
+        Der Client ist an den Loop gebunden, in dem er erzeugt wurde; außerhalb
+        des mit start() registrierten Loops gibt es daher einen RuntimeError.
+        """
+        if not self._in_server_loop():
+            raise RuntimeError(
+                f"HTTP-Client '{name}' außerhalb des Server-Loops angefordert - async_session() verwenden"
+            )
+        client = self._async_clients.get(name)
+        if client is None:
+            client = self._async_clients[name] = self._create_async(name)
+        return client
+
+    def get_sync(self, name: str) -> httpx.Client:
+        """Gemeinsamer sync Client (thread-safe, z.B. für Threadpool-Endpunkte)."""
+        with self._lock:
+            client = self._sync_clients.get(name)
+            if client is None:
+                client = self._sync_clients[name] = self._create_sync(name)
+            return client
+
+    @asynccontextmanager
+    async def async_session(self, name: str) -> AsyncIterator[httpx.AsyncClient]:
+        """Async Client für den aktuellen Loop: im Server-Loop der gemeinsame,
+        in fremden Loops ein eigener (mit gleicher Konfiguration und Metriken),
+        der am Ende geschlossen wird."""
+        if self._in_server_loop():
+            yield self.get_async(name)
+            return
+        client = self._create_async(name)
+        try:
+            yield client
+        finally:
+            await client.aclose()
+
+    async def aclose(self):
+        """Schließt alle Clients (Lifespan-Shutdown)."""
+        for client in self._async_clients.values():
+            await client.aclose()
+        self._async_clients.clear()
+        with self._lock:
+            for client in self._sync_clients.values():
+                client.close()
+            self._sync_clients.clear()
+        self._loop = None
+
+    def stats(self) -> dict:
+        """Metriken für Monitoring."""
+        return {
+            "http2_available": HTTP2_AVAILABLE,
+            "http2_enabled": settings.http2_enabled,
+            "clients": {name: metrics.stats() for name, metrics in self.metrics.items()},
+        }
+
+
+http_clients = HTTPClientRegistry()
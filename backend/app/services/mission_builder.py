@@ -0,0 +1,142 @@
+"""
+Anlegen kompletter Einsatz-Strukturen (Einheiten, Positionen, Phasen) per
+Multi-Row-Insert - für Templates und das Klonen von Missionen.
+
+Statt ein ORM-Objekt nach dem anderen mit Flush dazwischen anzulegen, wird
+jede Ebene mit einem executemany-Insert geschrieben. Die neuen IDs kommen per
+INSERT ... RETURNING in Parameter-Reihenfolge zurück (SQLite >= 3.35,
+PostgreSQL). Da die Inserts am ORM vorbei laufen, wird Mission.revision
+explizit erhöht.
+"""
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.mission import Mission, MissionPhase, MissionUnit, MissionPosition, MissionStatus
+from app.services.mission_cache import bump_revision
+
+
+def _insert_returning_ids(db: Session, table, rows: List[dict]) -> List[int]:
+    """Fügt alle Zeilen ein und gibt ihre IDs in der Reihenfolge von rows zurück."""
+    if not rows:
+        return []
+    stmt = table.insert().returning(table.c.id, sort_by_parameter_order=True)
+    return list(db.execute(stmt, rows).scalars())
+
+
+def instantiate_tree(db: Session, mission_id: int, units: list, phases: list) -> dict:
+    """Legt Einheiten (mit "positions") und Phasen für eine Mission an.
+
+    units/phases: Dicts im Format von MissionTemplate.template_data.
+    Gibt die neuen IDs zurück: {"unit_ids", "position_ids", "phase_ids"}. Kein Commit.
+    """
+    unit_table = MissionUnit.__table__
+    position_table = MissionPosition.__table__
+    phase_table = MissionPhase.__table__
+
+    unit_ids = _insert_returning_ids(db, unit_table, [
+        {
+            "mission_id": mission_id,
+            "name": unit_data.get("name"),
+            "unit_type": unit_data.get("unit_type"),
+            "description": unit_data.get("description"),
+            "ship_name": unit_data.get("ship_name"),
+            "ship_id": unit_data.get("ship_id"),
+            "radio_frequencies": unit_data.get("radio_frequencies"),
+            "sort_order": unit_data.get("sort_order", 0),
+            "crew_count": unit_data.get("crew_count", 1),
+        }
+        for unit_data in units
+    ])
+
+    position_rows = [
+        {
+            "unit_id": unit_id,
+            "name": pos_data.get("name"),
+            "position_type": pos_data.get("position_type"),
+            "is_required": pos_data.get("is_required", True),
+            "min_count": pos_data.get("min_count", 1),
+            "max_count": pos_data.get("max_count", 1),
+            "required_role_id": pos_data.get("required_role_id"),
+            "notes": pos_data.get("notes"),
+            "sort_order": pos_data.get("sort_order", 0),
+        }
+        for unit_id, unit_data in zip(unit_ids, units)
+        for pos_data in unit_data.get("positions", [])
+    ]
+    position_ids = _insert_returning_ids(db, position_table, position_rows)
+
+    phase_ids = _insert_returning_ids(db, phase_table, [
+        {
+            "mission_id": mission_id,
+            "phase_number": phase_data.get("phase_number"),
+            "title": phase_data.get("title"),
+            "description": phase_data.get("description"),
+            "start_time": phase_data.get("start_time"),
+            "sort_order": phase_data.get("sort_order", phase_data.get("phase_number", 0)),
+        }
+        for phase_data in phases
+    ])
+
+    if unit_ids or phase_ids:
+        bump_revision(db, mission_id)
+
+    return {"unit_ids": unit_ids, "position_ids": position_ids, "phase_ids": phase_ids}
+
+
+def mission_tree_data(db: Session, mission_id: int) -> tuple:
+    """Liest Einheiten (mit Positionen) und Phasen einer Mission im Template-Format.
+    Drei Queries, unabhängig von der Größe. Gibt (units, phases) zurück."""
+    unit_table = MissionUnit.__table__
+    position_table = MissionPosition.__table__
+    phase_table = MissionPhase.__table__
+
+    unit_rows = db.execute(
+        select(unit_table).where(unit_table.c.mission_id == mission_id)
+        .order_by(unit_table.c.sort_order, unit_table.c.id)
+    ).mappings().all()
+    units = {row["id"]: {**row, "positions": []} for row in unit_rows}
+
+    if units:
+        position_rows = db.execute(
+            select(position_table).where(position_table.c.unit_id.in_(units))
+            .order_by(position_table.c.sort_order, position_table.c.id)
+        ).mappings().all()
+        for row in position_rows:
+            units[row["unit_id"]]["positions"].append(dict(row))
+
+    phases = db.execute(
+        select(phase_table).where(phase_table.c.mission_id == mission_id)
+        .order_by(phase_table.c.sort_order, phase_table.c.id)
+    ).mappings().all()
+
+    return list(units.values()), [dict(row) for row in phases]
+
+
+def clone_mission(db: Session, source: Mission, created_by_id: int, title: str, scheduled_date) -> tuple:
+    """Kopiert eine Mission samt Einheiten, Positionen und Phasen als neuen Entwurf.
+    Anmeldungen und Zuweisungen werden nicht übernommen. Kein Commit.
+    Gibt (neue Mission, IDs aus instantiate_tree) zurück."""
+    mission = Mission(
+        title=title,
+        description=source.description,
+        mission_context=source.mission_context,
+        mission_objective=source.mission_objective,
+        preparation_notes=source.preparation_notes,
+        special_notes=source.special_notes,
+        scheduled_date=scheduled_date,
+        duration_minutes=source.duration_minutes,
+        status=MissionStatus.DRAFT,
+        start_location_id=source.start_location_id,
+        equipment_level=source.equipment_level,
+        target_group=source.target_group,
+        rules_of_engagement=source.rules_of_engagement,
+        created_by_id=created_by_id,
+    )
+    db.add(mission)
+    db.flush()
+
+    units, phases = mission_tree_data(db, source.id)
+    ids = instantiate_tree(db, mission.id, units, phases)
+    return mission, ids
@@ -0,0 +1,245 @@
+"""
+Snapshot-Cache für die lesenden Einsatzplaner-Endpunkte (Detail, Briefing,
+Zuweisungs-Daten). Gespeichert wird die fertig serialisierte JSON-Antwort
+samt ETag, versioniert über Mission.revision.
+
+Invalidierung: Jede ORM-Änderung an einer Mission oder ihren Phasen, Einheiten,
+Positionen, Zuweisungen und Anmeldungen erhöht Mission.revision im selben
+Flush. Ebenso Änderungen an Loadouts/Schiffen oder angezeigten Feldern eines
+Users, der in der Mission angemeldet oder eingeteilt ist. Ein Snapshot wird nur
+ausgeliefert, wenn seine Revision der aktuellen in der DB entspricht - das
+funktioniert auch über mehrere Prozesse hinweg. Bulk-Writes außerhalb des ORM
+müssen bump_revision() aufrufen.
+
+Die Revision wird per Core-UPDATE erhöht und lässt Mission.updated_at
+unverändert (das ist die letzte inhaltliche Bearbeitung der Mission selbst).
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import chain
+from typing import Optional
+
+from fastapi import Request, Response
+from sqlalchemy import event, inspect, or_, select, union, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+
+from app.config import get_settings
+from app.models.loadout import UserLoadout
+from app.models.mission import (
+    Mission, MissionPhase, MissionUnit, MissionPosition, MissionAssignment, MissionRegistration, UserShip
+)
+from app.models.user import User
+
+settings = get_settings()
+
+_INFO_KEY = "mission_cache_invalidate"
+
+# User-Felder, die in den Snapshots (Zuweisungen, Anmeldungen) erscheinen
+_USER_SNAPSHOT_FIELDS = (
+    "username", "display_name", "discord_id", "avatar", "avatar_custom", "role",
+    "is_pioneer", "is_treasurer", "is_kg_verwalter", "is_pending", "aliases",
+)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Serialisierte Antwort einer Mission in einer bestimmten Revision."""
+    revision: int
+    body: bytes
+    etag: str
+
+
+class MissionSnapshotCache:
+    """Größenbegrenzter TTL-Cache (LRU): (mission_id, art) -> Snapshot."""
+
+    def __init__(self, ttl_seconds: float, max_size: int, enabled: bool = True):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.enabled = enabled
+        self._store: OrderedDict = OrderedDict()  # (mission_id, kind) -> (snapshot, gültig_bis)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, mission_id: int, kind: str, revision: int) -> Optional[Snapshot]:
+        """Gibt den Snapshot zurück, wenn er zur aktuellen Revision passt."""
+        if not self.enabled:
+            return None
+        key = (mission_id, kind)
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None or entry[0].revision != revision or entry[1] < time.time():
+                self._store.pop(key, None)
+                self.misses += 1
+                return None
+            self._store.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, mission_id: int, kind: str, revision: int, body: bytes) -> Snapshot:
+        """Speichert eine serialisierte Antwort (ETag = Hash des Inhalts)."""
+        snapshot = Snapshot(
+            revision=revision,
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+        )
+        if self.enabled:
+            with self._lock:
+                self._store[(mission_id, kind)] = (snapshot, time.time() + self.ttl_seconds)
+                self._store.move_to_end((mission_id, kind))
+                while len(self._store) > self.max_size:
+                    self._store.popitem(last=False)
+        return snapshot
+
+    def invalidate(self, mission_id: int):
+        """Entfernt alle Snapshots einer Mission."""
+        with self._lock:
+            for key in [k for k in self._store if k[0] == mission_id]:
+                del self._store[key]
+
+    def clear(self):
+        """Leert den Cache komplett (z.B. in Tests)."""
+        with self._lock:
+            self._store.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Metriken für Monitoring."""
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "snapshots_cached": len(self._store),
+            "ttl_seconds": self.ttl_seconds,
+            "max_size": self.max_size,
+        }
+
+
+mission_cache = MissionSnapshotCache(
+    ttl_seconds=settings.mission_cache_ttl_seconds,
+    max_size=settings.mission_cache_max_size,
+    enabled=settings.mission_cache_enabled,
+)
+
+
+def snapshot_response(request: Request, snapshot: Snapshot) -> Response:
+    """Liefert den Snapshot aus (304, wenn der Client ihn schon hat)."""
+    headers = {"ETag": snapshot.etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == snapshot.etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
+
+
+def current_revision(db: Session, mission_id: int) -> Optional[tuple]:
+    """(revision, status) einer Mission oder None - eine leichte Query pro Request."""
+    return db.execute(
+        select(Mission.revision, Mission.status).where(Mission.id == mission_id)
+    ).first()
+
+
+def _increment_revisions(connection, mission_ids) -> None:
+    """Core-UPDATE: revision + 1, updated_at explizit beibehalten (kein onupdate)."""
+    table = Mission.__table__
+    connection.execute(
+        update(table)
+        .where(table.c.id.in_(list(mission_ids)))
+        .values(revision=table.c.revision + 1, updated_at=table.c.updated_at)
+    )
+
+
+def bump_revision(db: Session, mission_id: int):
+    """Erhöht die Revision nach Bulk-Writes außerhalb des ORM (ohne Commit)."""
+    _increment_revisions(db.connection(), [mission_id])
+    db.info.setdefault(_INFO_KEY, set()).add(mission_id)
+
+
+# ============== Revision über Session-Events ==============
+
+def _changed_user_id(obj) -> Optional[int]:
+    """User, dessen Darstellung in Einsätzen sich ändert (Loadouts, Schiffe, Anzeige)."""
+    if isinstance(obj, (UserLoadout, UserShip)):
+        return obj.user_id
+    if isinstance(obj, User) and obj.id is not None:
+        attrs = inspect(obj).attrs
+        if any(attrs[field].history.has_changes() for field in _USER_SNAPSHOT_FIELDS):
+            return obj.id
+    return None
+
+
+def _changed_mission_ids(session: Session) -> set:
+    """Missionen aller geänderten Objekte - höchstens zwei Queries pro Flush."""
+    mission_ids, unit_ids, position_ids, user_ids = set(), set(), set(), set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Mission):
+            mission_ids.add(obj.id)
+        elif isinstance(obj, (MissionPhase, MissionUnit, MissionRegistration)):
+            mission_ids.add(obj.mission_id)
+        elif isinstance(obj, MissionPosition):
+            unit_ids.add(obj.unit_id)
+        elif isinstance(obj, MissionAssignment):
+            position_ids.add(obj.position_id)
+        else:
+            user_ids.add(_changed_user_id(obj))
+    unit_ids.discard(None)
+    position_ids.discard(None)
+    user_ids.discard(None)
+
+    if unit_ids or position_ids:
+        # Positionen -> Einheit und Zuweisungen -> Position -> Einheit in einer Query
+        rows = session.execute(
+            select(MissionUnit.mission_id)
+            .outerjoin(MissionPosition, MissionPosition.unit_id == MissionUnit.id)
+            .where(or_(MissionUnit.id.in_(list(unit_ids)), MissionPosition.id.in_(list(position_ids))))
+            .distinct()
+        )
+        mission_ids.update(rows.scalars())
+
+    if user_ids:
+        rows = session.execute(union(
+            select(MissionRegistration.mission_id).where(MissionRegistration.user_id.in_(list(user_ids))),
+            select(MissionUnit.mission_id)
+            .join(MissionPosition, MissionPosition.unit_id == MissionUnit.id)
+            .join(MissionAssignment, MissionAssignment.position_id == MissionPosition.id)
+            .where(MissionAssignment.user_id.in_(list(user_ids))),
+        ))
+        mission_ids.update(rows.scalars())
+
+    mission_ids.discard(None)
+    return mission_ids - {obj.id for obj in session.deleted if isinstance(obj, Mission)}
+
+
+@event.listens_for(Session, "before_flush")
+def _bump_changed_missions(session, flush_context, instances):
+    """Erhöht Mission.revision für jede betroffene Mission (einmal pro Flush)."""
+    with session.no_autoflush:
+        mission_ids = _changed_mission_ids(session)
+    if not mission_ids:
+        return
+
+    _increment_revisions(session.connection(), mission_ids)
+    # Geladene Missionen lesen die neue Revision beim nächsten Zugriff aus der DB
+    for mission_id in mission_ids:
+        mission = session.identity_map.get(identity_key(Mission, mission_id))
+        if mission is not None:
+            session.expire(mission, ["revision"])
+    session.info.setdefault(_INFO_KEY, set()).update(mission_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_missions(session):
+    """Alte Snapshots sofort freigeben (die Revision macht sie ohnehin ungültig)."""
+    for mission_id in session.info.pop(_INFO_KEY, ()):
+        mission_cache.invalidate(mission_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_missions(session):
+    session.info.pop(_INFO_KEY, None)
+
@@ -0,0 +1,125 @@
+"""
+Preisverlauf und Preis-Rollups.
+Wird vom UEX-Sync nach dem Aktualisieren von item_prices aufgerufen.
+"""
+from collections import defaultdict
+from datetime import date
+from statistics import median
+from typing import Optional
+
+from sqlalchemy import and_, delete, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.models.item_price import ItemPrice, ItemPriceHistory, ComponentPriceRollup
+
+BATCH_SIZE = 2000
+
+
+def to_auec(value: Optional[float]) -> Optional[int]:
+    """Preis als ganze aUEC (0 bzw. leer = nicht verfügbar)."""
+    if value is None or value <= 0:
+        return None
+    return int(round(value))
+
+
+def _upsert(db: Session):
+    """INSERT ... ON CONFLICT im Dialekt der Session."""
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    return dialect.insert(ItemPriceHistory.__table__)
+
+
+def record_price_history(db: Session, day: Optional[date] = None) -> int:
+    """Schreibt den aktuellen Preisstand als Tages-Bucket in den Verlauf.
+
+    Upsert pro Tages-Bucket: pro (Komponente, Terminal, Tag) ein Eintrag, ein
+    erneuter Sync am selben Tag aktualisiert dessen Preise per ON CONFLICT.
+    Frühere Tage bleiben unangetastet. Gibt die Anzahl der Einträge zurück.
+    Committet nicht.
+    """
+    day = day or date.today()
+
+    rows = db.query(
+        ItemPrice.component_id,
+        ItemPrice.terminal_id,
+        func.min(ItemPrice.price_buy),
+        func.max(ItemPrice.price_sell),
+    ).filter(
+        ItemPrice.component_id.isnot(None),
+        ItemPrice.terminal_id.isnot(None),
+    ).group_by(ItemPrice.component_id, ItemPrice.terminal_id).all()
+
+    entries = []
+    for component_id, terminal_id, price_buy, price_sell in rows:
+        buy, sell = to_auec(price_buy), to_auec(price_sell)
+        if buy is None and sell is None:
+            continue
+        entries.append({
+            "component_id": component_id,
+            "terminal_id": terminal_id,
+            "day": day,
+            "price_buy": buy,
+            "price_sell": sell,
+        })
+
+    stmt = _upsert(db)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["component_id", "terminal_id", "day"],
+        set_={"price_buy": stmt.excluded.price_buy, "price_sell": stmt.excluded.price_sell},
+    )
+    for i in range(0, len(entries), BATCH_SIZE):
+        db.execute(stmt, entries[i:i + BATCH_SIZE])
+    return len(entries)
+
+
+def refresh_price_rollups(db: Session) -> int:
+    """Berechnet die Kennzahlen pro Komponente neu (min. Kauf, max. Verkauf,
+    Median, Terminal des besten Preises). Committet nicht."""
+    rows = db.query(
+        ItemPrice.component_id,
+        ItemPrice.terminal_name,
+        ItemPrice.price_buy,
+        ItemPrice.price_sell,
+    ).filter(ItemPrice.component_id.isnot(None)).all()
+
+    by_component = defaultdict(list)
+    for row in rows:
+        by_component[row.component_id].append(row)
+
+    rollups = []
+    for component_id, prices in by_component.items():
+        buys = [(to_auec(p.price_buy), p.terminal_name) for p in prices if to_auec(p.price_buy)]
+        sells = [(to_auec(p.price_sell), p.terminal_name) for p in prices if to_auec(p.price_sell)]
+        if not buys and not sells:
+            continue
+
+        best_buy = min(buys) if buys else (None, None)
+        best_sell = max(sells) if sells else (None, None)
+        rollups.append({
+            "component_id": component_id,
+            "min_buy": best_buy[0],
+            "min_buy_terminal": best_buy[1],
+            "max_sell": best_sell[0],
+            "max_sell_terminal": best_sell[1],
+            "median_buy": int(median(b for b, _ in buys)) if buys else None,
+            "median_sell": int(median(s for s, _ in sells)) if sells else None,
+            "terminal_count": len({p.terminal_name for p in prices}),
+        })
+
+    table = ComponentPriceRollup.__table__
+    db.execute(delete(table))
+    for i in range(0, len(rollups), BATCH_SIZE):
+        db.execute(insert(table), rollups[i:i + BATCH_SIZE])
+    return len(rollups)
+
+
+def get_price_history(db: Session, component_id: int, since: date) -> list:
+    """Verlauf einer Komponente: pro Tag günstigster Kauf- und bester Verkaufspreis."""
+    return db.query(
+        ItemPriceHistory.day,
+        func.min(ItemPriceHistory.price_buy).label("min_buy"),
+        func.max(ItemPriceHistory.price_sell).label("max_sell"),
+    ).filter(
+        and_(ItemPriceHistory.component_id == component_id, ItemPriceHistory.day >= since)
+    ).group_by(ItemPriceHistory.day).order_by(ItemPriceHistory.day).all()
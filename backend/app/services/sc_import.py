@@ -2,16 +2,42 @@
 Star Citizen Data Import Service.
 Importiert Komponenten und Orte von der star-citizen.wiki API.
 """
+import asyncio
+import hashlib
+import json
+import random
+import threading
+import time
 import httpx
+from datetime import datetime, timezone
 from typing import Optional
+from sqlalchemy import bindparam, insert, select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
 
-from app.models.component import Component, SCLocation
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.component import (
+    Component, SCLocation, SCImportCheckpoint, SCImportPageHash, normalize_search
+)
 from app.schemas.component import SCImportStats
+from app.services.http_clients import http_clients
 
+settings = get_settings()
 
 SC_API_BASE = "https://api.star-citizen.wiki/api/v2"
 
+# Limit um Endlos-Importe zu vermeiden
+MAX_PAGES = 500
+
+# Abbruch, wenn so viele Seiten auch nach allen Retries fehlschlagen
+MAX_FAILED_PAGES = 3
+
+# HTTP-Status, bei denen ein erneuter Versuch sinnvoll ist
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 30.0
+
 # Mapping von SC-API Typen zu unseren Kategorien (englische Bezeichnungen)
 COMPONENT_TYPE_MAPPING = {
     # Ship Components
@@ -63,122 +89,318 @@ COMPONENT_TYPE_MAPPING = {
 }
 
 
+class SCApiError(Exception):
+    """Fehler beim Abruf der star-citizen.wiki API (nach allen Retries)."""
+
+
 class SCImportService:
-    """Service für den Import von Star Citizen Daten."""
+    """Service für den Import von Star Citizen Daten.
+
+    Seiten werden asynchron und begrenzt parallel abgerufen, die DB-Schreibzugriffe
+    laufen nacheinander. Nach jeder Seite wird ein Checkpoint gespeichert, damit ein
+    abgebrochener Import bei gleicher SC-Version dort weitermacht.
+    """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, concurrency: Optional[int] = None, force: bool = False):
         self.db = db
+        self.force = force  # True = auch unveränderte Seiten neu schreiben
+        self.page_hashes: dict = {}
         self.stats = SCImportStats()
-        self.client = httpx.Client(timeout=30.0, follow_redirects=True)
-
-    def __del__(self):
-        if hasattr(self, 'client'):
-            self.client.close()
-
-    def import_all(self) -> SCImportStats:
+        self.concurrency = concurrency or settings.sc_import_concurrency
+        self.client: Optional[httpx.AsyncClient] = None
+        self.checkpoint: Optional[SCImportCheckpoint] = None
+        self.uuid_to_id: dict = {}
+        self.location_ids: dict = {}
+        self.location_rows: dict = {}
+
+        # Fortschritt (für den Progress-Endpunkt)
+        self.phase = "starting"
+        self.pages_done = 0
+        self.total_pages: Optional[int] = None
+        self.resumed_from_page: Optional[int] = None
+
+    def import_all(self, resume: bool = True) -> SCImportStats:
+        """Importiert alle relevanten SC-Daten (synchroner Einstieg)."""
+        return asyncio.run(self.import_all_async(resume))
+
+    async def import_all_async(self, resume: bool = True) -> SCImportStats:
         """Importiert alle relevanten SC-Daten."""
-        # Hole zuerst die aktuelle SC-Version
-        version = self._get_sc_version()
-        self.stats.sc_version = version
-
-        # Importiere Komponenten
-        self._import_components()
+        started = time.perf_counter()
+        async with http_clients.async_session("sc_wiki") as client:
+            self.client = client
 
-        # Importiere Orte mit Shops
-        self._import_locations()
+            # Hole zuerst die aktuelle SC-Version
+            version = await self._get_sc_version()
+            self.stats.sc_version = version
+            self.checkpoint = self._load_checkpoint(version, resume)
+            self.page_hashes = {h.page_key: h for h in self.db.query(SCImportPageHash).all()}
 
+            try:
+                # Importiere Komponenten
+                self.phase = "components"
+                await self._import_components()
+
+                # Importiere Orte mit Shops
+                self.phase = "locations"
+                await self._import_locations()
+            except Exception:
+                self.db.rollback()
+                self._finish_checkpoint("failed")
+                raise
+
+        complete = self.total_pages is not None and self.checkpoint.last_completed_page >= self.total_pages
+        self._finish_checkpoint("completed" if complete else "failed")
+        self.phase = "done"
+
+        elapsed = time.perf_counter() - started
+        self.stats.duration_seconds = round(elapsed, 2)
+        if elapsed > 0:
+            self.stats.items_per_second = round(self.stats.items_processed / elapsed, 1)
         return self.stats
 
-    def _get_sc_version(self) -> Optional[str]:
+    def _load_checkpoint(self, version: Optional[str], resume: bool) -> SCImportCheckpoint:
+        """Setzt einen abgebrochenen Lauf derselben SC-Version fort oder startet neu."""
+        last = self.db.query(SCImportCheckpoint).order_by(SCImportCheckpoint.id.desc()).first()
+        if (
+            resume and last and last.status != "completed"
+            and last.sc_version == version and last.last_completed_page > 0
+        ):
+            last.status = "running"
+            last.finished_at = None
+            self.db.commit()
+            self.resumed_from_page = last.last_completed_page + 1
+            self.total_pages = last.total_pages
+            self.pages_done = last.last_completed_page
+            return last
+
+        checkpoint = SCImportCheckpoint(sc_version=version, last_completed_page=0, status="running")
+        self.db.add(checkpoint)
+        self.db.commit()
+        return checkpoint
+
+    def _finish_checkpoint(self, status: str):
+        self.checkpoint.status = status
+        self.checkpoint.finished_at = func.now()
+        self.db.commit()
+
+    async def _get_json(self, url: str, params: Optional[dict] = None) -> dict:
+        """GET mit Retry und exponentiellem Backoff (inkl. Retry-After)."""
+        data, _ = await self._get(url, params)
+        return data
+
+    async def _get(self, url: str, params: Optional[dict] = None, etag: Optional[str] = None) -> tuple:
+        """Wie _get_json, aber mit If-None-Match. Gibt (data, etag) zurück,
+        data ist None bei 304 Not Modified."""
+        headers = {"If-None-Match": etag} if etag else None
+        max_retries = settings.sc_import_max_retries
+        for attempt in range(max_retries + 1):
+            retry_after = None
+            try:
+                response = await self.client.get(url, params=params, headers=headers)
+            except httpx.TransportError as e:
+                error = f"{type(e).__name__}: {e}"
+            else:
+                if response.status_code == 200:
+                    return response.json(), response.headers.get("etag")
+                if response.status_code == 304:
+                    return None, etag
+                if response.status_code not in RETRY_STATUS_CODES:
+                    raise SCApiError(f"HTTP {response.status_code}")
+                error = f"HTTP {response.status_code}"
+                retry_after = response.headers.get("retry-after")
+
+            if attempt == max_retries:
+                raise SCApiError(f"{error} (nach {max_retries} Wiederholungen)")
+
+            delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt)
+            if retry_after and retry_after.isdigit():
+                delay = min(BACKOFF_MAX_SECONDS, float(retry_after))
+            await asyncio.sleep(delay * (0.5 + random.random() / 2))  # Jitter
+
+    async def _get_sc_version(self) -> Optional[str]:
         """Ermittelt die aktuelle SC-Version aus der API."""
         try:
-            response = self.client.get(f"{SC_API_BASE}/vehicles?limit=1")
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("data") and len(data["data"]) > 0:
-                    version = data["data"][0].get("version")
-                    if version and len(version) > 20:
-                        version = version[:20]
-                    return version
+            data = await self._get_json(f"{SC_API_BASE}/vehicles", {"limit": 1})
+            if data.get("data") and len(data["data"]) > 0:
+                version = data["data"][0].get("version")
+                if version and len(version) > 20:
+                    version = version[:20]
+                return version
         except Exception as e:
             self.stats.errors.append(f"Fehler beim Abrufen der SC-Version: {str(e)}")
         return None
 
-    def _import_components(self):
-        """Importiert Schiffskomponenten und Waffen."""
-        page = 1
-        total_pages = 1
-        max_pages = 500  # Limit um Timeout zu vermeiden
-        consecutive_errors = 0
-
-        while page <= min(total_pages, max_pages):
+    async def _fetch_page(self, page: int, semaphore: asyncio.Semaphore) -> tuple:
+        """Holt eine Item-Seite. Gibt (page, data, error, etag) zurück;
+        data ist None, wenn der Server 304 Not Modified meldet."""
+        async with semaphore:
             try:
-                response = self.client.get(
-                    f"{SC_API_BASE}/items",
-                    params={"page": page, "limit": 100}
+                data, etag = await self._get(
+                    f"{SC_API_BASE}/items", {"page": page, "limit": 100}, self._known_etag(f"items:{page}")
                 )
+                return page, data, None, etag
+            except Exception as e:
+                return page, None, str(e), None
+
+    def _known_etag(self, page_key: str) -> Optional[str]:
+        """ETag der letzten Version dieser Seite (nur ohne force und bei gleicher SC-Version)."""
+        known = self.page_hashes.get(page_key)
+        if self.force or not known or known.sc_version != self.stats.sc_version:
+            return None
+        return known.etag
+
+    def _content_hash(self, payload) -> str:
+        """SHA-256 über SC-Version + Inhalt (Versionswechsel = alles neu schreiben)."""
+        content = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(f"{self.stats.sc_version}\n{content}".encode()).hexdigest()
+
+    def _is_unchanged(self, page_key: str, content_hash: Optional[str]) -> bool:
+        """True, wenn die Seite seit dem letzten Import gleich geblieben ist."""
+        if self.force:
+            return False
+        if content_hash is None:
+            return page_key in self.page_hashes  # 304 Not Modified
+        known = self.page_hashes.get(page_key)
+        return known is not None and known.content_hash == content_hash
+
+    def _remember_hash(self, page_key: str, content_hash: str, etag: Optional[str]):
+        """Merkt sich den Hash (wird mit den Seitendaten committet)."""
+        known = self.page_hashes.get(page_key)
+        if known is None:
+            known = SCImportPageHash(page_key=page_key)
+            self.db.add(known)
+            self.page_hashes[page_key] = known
+        known.content_hash = content_hash
+        known.etag = etag
+        known.sc_version = self.stats.sc_version
+
+    async def _import_components(self):
+        """Importiert Schiffskomponenten und Waffen (Seiten parallel abrufen)."""
+        start_page = self.checkpoint.last_completed_page + 1
+        if self.total_pages is not None and start_page > self.total_pages:
+            return  # Komponenten im vorherigen Lauf bereits vollständig
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        self.uuid_to_id = self._load_uuid_map()
+
+        # Erste Seite liefert die Gesamtzahl der Seiten (ohne ETag, wir brauchen meta)
+        page, data, error, etag = await self._fetch_page_uncached(start_page, semaphore)
+        if error:
+            self.stats.errors.append(f"API-Fehler Seite {page}: {error}")
+            return
+
+        last_page = data.get("meta", {}).get("last_page", 1)
+        self.total_pages = min(last_page, MAX_PAGES)
+        self.checkpoint.total_pages = self.total_pages
+        if last_page > MAX_PAGES:
+            self.stats.errors.append(f"Import auf {MAX_PAGES} Seiten limitiert (von {last_page})")
+
+        completed = set()
+        self._process_page(page, data, completed, etag)
 
-                if response.status_code != 200:
-                    self.stats.errors.append(f"API-Fehler Seite {page}: {response.status_code}")
-                    consecutive_errors += 1
-                    page += 1
-                    # Nach 3 aufeinanderfolgenden Fehlern abbrechen
-                    if consecutive_errors >= 3:
-                        self.stats.errors.append("Abbruch nach 3 aufeinanderfolgenden API-Fehlern")
+        tasks = [
+            asyncio.create_task(self._fetch_page(p, semaphore))
+            for p in range(start_page + 1, self.total_pages + 1)
+        ]
+        failed_pages = 0
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                page, data, error, etag = await next_result
+                if error:
+                    self.stats.errors.append(f"API-Fehler Seite {page}: {error}")
+                    failed_pages += 1
+                    if failed_pages >= MAX_FAILED_PAGES:
+                        self.stats.errors.append(
+                            f"Abbruch nach {MAX_FAILED_PAGES} fehlgeschlagenen Seiten - "
+                            "der nächste Import setzt am Checkpoint fort"
+                        )
                         break
                     continue
+                self._process_page(page, data, completed, etag)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _fetch_page_uncached(self, page: int, semaphore: asyncio.Semaphore) -> tuple:
+        """Holt eine Item-Seite immer vollständig (kein If-None-Match)."""
+        async with semaphore:
+            try:
+                data, etag = await self._get(f"{SC_API_BASE}/items", {"page": page, "limit": 100})
+                return page, data, None, etag
+            except Exception as e:
+                return page, None, str(e), None
+
+    def _process_page(self, page: int, data: Optional[dict], completed: set, etag: Optional[str] = None):
+        """Schreibt die Items einer Seite und schiebt den Checkpoint weiter.
+        Unveränderte Seiten (Hash oder 304) werden nicht geschrieben."""
+        page_key = f"items:{page}"
+        content_hash = self._content_hash(data.get("data", [])) if data is not None else None
+        if self._is_unchanged(page_key, content_hash):
+            self.stats.pages_skipped += 1
+            self._complete_page(page, completed)
+            return
 
-                consecutive_errors = 0  # Reset bei Erfolg
-                data = response.json()
-                total_pages = data.get("meta", {}).get("last_page", 1)
-                items = data.get("data", [])
+        rows = {}
+        for item in data.get("data", []):
+            try:
+                values = self._component_values(item)
+                if values:
+                    rows[values["sc_uuid"]] = values  # Duplikate innerhalb der Seite: letzter gewinnt
+            except Exception as item_error:
+                self.stats.errors.append(f"Fehler bei Item {item.get('name', 'Unknown')}: {str(item_error)}")
 
-                for item in items:
-                    try:
-                        self._process_item(item)
-                    except Exception as item_error:
-                        self.stats.errors.append(f"Fehler bei Item {item.get('name', 'Unknown')}: {str(item_error)}")
+        try:
+            self._upsert_components(list(rows.values()))
+            self.stats.items_processed += len(rows)
+            self._remember_hash(page_key, content_hash, etag)
+        except Exception as write_error:
+            self.db.rollback()
+            self.stats.errors.append(f"Schreibfehler Seite {page}: {str(write_error)}")
+            return
 
-                # Commit jede Seite um Datenverlust bei Fehlern zu minimieren
-                try:
-                    self.db.commit()
-                except Exception as commit_error:
-                    self.db.rollback()
-                    self.stats.errors.append(f"Commit-Fehler Seite {page}: {str(commit_error)}")
+        self._complete_page(page, completed)
 
-                page += 1
+    def _complete_page(self, page: int, completed: set):
+        """Schiebt den Checkpoint weiter und committet die Seite."""
+        # Checkpoint = höchste Seite, bis zu der alle Seiten importiert sind
+        completed.add(page)
+        watermark = self.checkpoint.last_completed_page
+        while watermark + 1 in completed:
+            watermark += 1
+        self.checkpoint.last_completed_page = watermark
+        self.pages_done += 1
 
-            except Exception as e:
-                self.stats.errors.append(f"Fehler auf Seite {page}: {str(e)}")
-                consecutive_errors += 1
-                page += 1
-                if consecutive_errors >= 3:
-                    self.stats.errors.append("Abbruch nach 3 aufeinanderfolgenden Fehlern")
-                    break
-
-        # Finaler Commit (falls letzte Seite erfolgreich war)
+        # Commit jede Seite um Datenverlust bei Fehlern zu minimieren
         try:
             self.db.commit()
-        except Exception:
+        except Exception as commit_error:
             self.db.rollback()
-
-        if total_pages > max_pages:
-            self.stats.errors.append(f"Import auf {max_pages} Seiten limitiert (von {total_pages})")
-
-    def _process_item(self, item: dict):
-        """Verarbeitet ein einzelnes Item aus der API."""
+            completed.discard(page)
+            self.stats.errors.append(f"Commit-Fehler Seite {page}: {str(commit_error)}")
+            # Nach Rollback sind Zuordnung und Hashes evtl. veraltet
+            self.uuid_to_id = self._load_uuid_map()
+            self.page_hashes = {h.page_key: h for h in self.db.query(SCImportPageHash).all()}
+
+    def _load_uuid_map(self) -> dict:
+        """sc_uuid -> Component-ID aller bereits importierten Komponenten."""
+        return dict(self.db.query(Component.sc_uuid, Component.id).filter(
+            Component.sc_uuid.isnot(None)
+        ).all())
+
+    def _component_values(self, item: dict) -> Optional[dict]:
+        """Wandelt ein Item aus der API in Spaltenwerte um (None = nicht importieren)."""
         sc_type = item.get("type", "")
 
         # Nur relevante Typen importieren
         if sc_type not in COMPONENT_TYPE_MAPPING:
-            return
+            return None
 
         category, sub_category = COMPONENT_TYPE_MAPPING[sc_type]
         uuid = item.get("uuid")
 
         # UUID ist Pflicht
         if not uuid:
-            return
+            return None
 
         name = item.get("name", "Unknown")
 
@@ -277,106 +499,113 @@ class SCImportService:
             if shop_names:
                 shop_locations = ", ".join(shop_names[:10])  # Max 10 Shops
 
-        # Prüfen ob bereits vorhanden (via UUID)
-        existing = self.db.query(Component).filter(Component.sc_uuid == uuid).first()
-
-        if existing:
-            # Update
-            existing.name = name
-            existing.category = category
-            existing.sub_category = sub_category
-            existing.manufacturer = manufacturer
-            existing.sc_type = sc_type
-            existing.sc_version = self.stats.sc_version
-            existing.is_predefined = True
+        return {
+            "name": name,
+            "search_name": normalize_search(name),  # Bulk-Writes umgehen den Mapper-Event
+            "category": category,
+            "sub_category": sub_category,
+            "sc_uuid": uuid,
+            "manufacturer": manufacturer,
+            "search_manufacturer": normalize_search(manufacturer),
+            "sc_type": sc_type,
+            "sc_version": self.stats.sc_version,
+            "is_predefined": True,
             # Erweiterte Felder
-            existing.class_name = class_name
-            existing.grade = grade
-            existing.item_class = item_class
-            existing.size = size
-            existing.volume = volume
-            existing.durability = durability
-            existing.power_base = power_base
-            existing.power_draw = power_draw
-            existing.cooling_rate = cooling_rate
-            existing.shield_hp = shield_hp
-            existing.shield_regen = shield_regen
-            existing.power_output = power_output
-            existing.quantum_speed = quantum_speed
-            existing.quantum_range = quantum_range
-            existing.quantum_fuel_rate = quantum_fuel_rate
-            existing.shop_locations = shop_locations
-            self.stats.components_updated += 1
-        else:
-            # Neu anlegen
-            component = Component(
-                name=name,
-                category=category,
-                sub_category=sub_category,
-                sc_uuid=uuid,
-                manufacturer=manufacturer,
-                sc_type=sc_type,
-                sc_version=self.stats.sc_version,
-                is_predefined=True,
-                # Erweiterte Felder
-                class_name=class_name,
-                grade=grade,
-                item_class=item_class,
-                size=size,
-                volume=volume,
-                durability=durability,
-                power_base=power_base,
-                power_draw=power_draw,
-                cooling_rate=cooling_rate,
-                shield_hp=shield_hp,
-                shield_regen=shield_regen,
-                power_output=power_output,
-                quantum_speed=quantum_speed,
-                quantum_range=quantum_range,
-                quantum_fuel_rate=quantum_fuel_rate,
-                shop_locations=shop_locations
+            "class_name": class_name,
+            "grade": grade,
+            "item_class": item_class,
+            "size": size,
+            "volume": volume,
+            "durability": durability,
+            "power_base": power_base,
+            "power_draw": power_draw,
+            "cooling_rate": cooling_rate,
+            "shield_hp": shield_hp,
+            "shield_regen": shield_regen,
+            "power_output": power_output,
+            "quantum_speed": quantum_speed,
+            "quantum_range": quantum_range,
+            "quantum_fuel_rate": quantum_fuel_rate,
+            "shop_locations": shop_locations,
+        }
+
+    def _upsert_components(self, rows: list):
+        """Schreibt die Komponenten einer Seite als Bulk-Insert + Bulk-Update.
+
+        Die sc_uuid -> id Zuordnung wird einmal vorab geladen, statt pro Item
+        ein SELECT abzusetzen.
+        """
+        table = Component.__table__
+        inserts = [row for row in rows if row["sc_uuid"] not in self.uuid_to_id]
+        updates = [
+            {"_id": self.uuid_to_id[row["sc_uuid"]], **{f"new_{k}": v for k, v in row.items() if k != "sc_uuid"}}
+            for row in rows if row["sc_uuid"] in self.uuid_to_id
+        ]
+
+        if inserts:
+            self.db.execute(insert(table), inserts)
+            new_ids = self.db.execute(
+                select(table.c.sc_uuid, table.c.id).where(
+                    table.c.sc_uuid.in_([row["sc_uuid"] for row in inserts])
+                )
             )
-            self.db.add(component)
-            self.stats.components_added += 1
+            self.uuid_to_id.update(dict(new_ids.all()))
+            self.stats.components_added += len(inserts)
 
-    def _import_locations(self):
+        if updates:
+            # Bind-Parameter dürfen nicht wie die Spalten heißen (SET-Klausel)
+            stmt = update(table).where(table.c.id == bindparam("_id")).values(
+                {k: bindparam(f"new_{k}") for k in rows[0] if k != "sc_uuid"}
+            )
+            self.db.execute(stmt, updates)
+            self.stats.components_updated += len(updates)
+
+    async def _import_locations(self):
         """Importiert Orte mit Shops aus der Starmap."""
         try:
             # Hole alle Sternensysteme
-            response = self.client.get(f"{SC_API_BASE}/starsystems?limit=100")
-            if response.status_code != 200:
-                self.stats.errors.append(f"Starmap API-Fehler: {response.status_code}")
-                return
-
-            data = response.json()
-            systems = data.get("data", [])
-
-            for system in systems:
-                system_name = system.get("name")
-                # Hole Details für jedes System
-                self._import_system_locations(system_name)
+            data = await self._get_json(f"{SC_API_BASE}/starsystems", {"limit": 100})
+            systems = [system.get("name") for system in data.get("data", [])]
+
+            # Details aller Systeme parallel holen, danach gesammelt schreiben
+            semaphore = asyncio.Semaphore(self.concurrency)
+            results = await asyncio.gather(*[
+                self._fetch_system(system_name, semaphore) for system_name in systems
+            ])
+            self.location_ids = {
+                (loc.name, loc.system_name): loc.id
+                for loc in self.db.query(SCLocation.id, SCLocation.name, SCLocation.system_name).all()
+            }
+            self.location_rows = {}
+            for system_name, system_data in results:
+                if system_data is None:
+                    continue
+                page_key = f"starsystem:{system_name}"
+                content_hash = self._content_hash(system_data)
+                if self._is_unchanged(page_key, content_hash):
+                    self.stats.pages_skipped += 1
+                    continue
+                self._remember_hash(page_key, content_hash, None)
+                # Celestial Objects (Planeten, Monde, Stationen)
+                for obj in system_data.get("celestial_objects", []):
+                    self._process_celestial_object(obj, system_name, None)
 
+            self._upsert_locations(list(self.location_rows.values()))
             self.db.commit()
 
         except Exception as e:
+            self.db.rollback()
             self.stats.errors.append(f"Fehler beim Location-Import: {str(e)}")
 
-    def _import_system_locations(self, system_name: str):
-        """Importiert Locations eines Sternensystems."""
-        try:
-            response = self.client.get(f"{SC_API_BASE}/starsystems/{system_name}")
-            if response.status_code != 200:
-                return
-
-            data = response.json().get("data", {})
-
-            # Celestial Objects (Planeten, Monde, Stationen)
-            celestial_objects = data.get("celestial_objects", [])
-            for obj in celestial_objects:
-                self._process_celestial_object(obj, system_name, None)
-
-        except Exception as e:
-            self.stats.errors.append(f"Fehler bei System {system_name}: {str(e)}")
+    async def _fetch_system(self, system_name: str, semaphore: asyncio.Semaphore) -> tuple:
+        """Holt die Details eines Sternensystems."""
+        async with semaphore:
+            try:
+                data = await self._get_json(f"{SC_API_BASE}/starsystems/{system_name}")
+                return system_name, data.get("data", {})
+            except Exception as e:
+                self.stats.errors.append(f"Fehler bei System {system_name}: {str(e)}")
+                return system_name, None
 
     def _process_celestial_object(self, obj: dict, system_name: str, parent_name: Optional[str]):
         """Verarbeitet ein celestial object rekursiv."""
@@ -392,26 +621,13 @@ class SCImportService:
             if len(display_name) > 200:
                 display_name = display_name[:200]
 
-            existing = self.db.query(SCLocation).filter(
-                SCLocation.name == display_name,
-                SCLocation.system_name == system_name
-            ).first()
-
-            if existing:
-                existing.location_type = obj_type
-                existing.parent_name = parent_name
-                existing.has_shops = True
-                self.stats.locations_updated += 1
-            else:
-                location = SCLocation(
-                    name=display_name,
-                    location_type=obj_type,
-                    parent_name=parent_name,
-                    system_name=system_name,
-                    has_shops=True
-                )
-                self.db.add(location)
-                self.stats.locations_added += 1
+            self.location_rows[(display_name, system_name)] = {
+                "name": display_name,
+                "location_type": obj_type,
+                "parent_name": parent_name,
+                "system_name": system_name,
+                "has_shops": True,
+            }
 
         # Rekursiv für Kinder (Monde um Planeten, etc.)
         children = obj.get("children", [])
@@ -420,7 +636,104 @@ class SCImportService:
             self._process_celestial_object(child, system_name, current_name)
 
 
-def run_sc_import(db: Session) -> SCImportStats:
+    def _upsert_locations(self, rows: list):
+        """Schreibt alle Orte als Bulk-Insert + Bulk-Update (Zuordnung über Name + System)."""
+        table = SCLocation.__table__
+        inserts = [row for row in rows if (row["name"], row["system_name"]) not in self.location_ids]
+        updates = [
+            {
+                "_id": self.location_ids[(row["name"], row["system_name"])],
+                "new_location_type": row["location_type"],
+                "new_parent_name": row["parent_name"],
+            }
+            for row in rows if (row["name"], row["system_name"]) in self.location_ids
+        ]
+
+        if inserts:
+            self.db.execute(insert(table), inserts)
+            self.stats.locations_added += len(inserts)
+
+        if updates:
+            self.db.execute(
+                update(table).where(table.c.id == bindparam("_id")).values(
+                    location_type=bindparam("new_location_type"),
+                    parent_name=bindparam("new_parent_name"),
+                    has_shops=True,
+                ),
+                updates
+            )
+            self.stats.locations_updated += len(updates)
+
+
+def run_sc_import(db: Session, resume: bool = True, force: bool = False) -> SCImportStats:
     """Führt den SC-Import aus."""
-    service = SCImportService(db)
-    return service.import_all()
+    service = SCImportService(db, force=force)
+    return service.import_all(resume)
+
+
+class SCImportJobManager:
+    """Führt den SC-Import als Hintergrund-Job aus (höchstens einer gleichzeitig)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.service: Optional[SCImportService] = None
+        self.status = "idle"  # idle, running, completed, failed
+        self.error: Optional[str] = None
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, resume: bool = True, force: bool = False) -> bool:
+        """Startet den Import. Gibt False zurück, wenn bereits einer läuft."""
+        with self._lock:
+            if self.is_running():
+                return False
+            self.status = "running"
+            self.error = None
+            self.started_at = datetime.now(timezone.utc)
+            self.finished_at = None
+            self.service = None
+            self._thread = threading.Thread(
+                target=self._run, args=(resume, force), name="sc-import", daemon=True
+            )
+            self._thread.start()
+            return True
+
+    def _run(self, resume: bool, force: bool):
+        # Eigene Session: der Job läuft außerhalb des Requests weiter
+        db = SessionLocal()
+        try:
+            self.service = SCImportService(db, force=force)
+            stats = self.service.import_all(resume)
+            # Unvollständige Läufe (z.B. MAX_FAILED_PAGES) enden ohne Exception,
+            # der Checkpoint steht dann aber auf "failed"
+            self.status = self.service.checkpoint.status
+            if self.status == "failed":
+                self.error = "; ".join(stats.errors)[:2000] or "Import unvollständig"
+        except Exception as e:
+            self.status = "failed"
+            self.error = str(e)[:2000]
+        finally:
+            self.finished_at = datetime.now(timezone.utc)
+            db.close()
+
+    def progress(self) -> dict:
+        """Aktueller Fortschritt für den Progress-Endpunkt."""
+        service = self.service
+        return {
+            "status": self.status,
+            "phase": service.phase if service else None,
+            "pages_done": service.pages_done if service else 0,
+            "total_pages": service.total_pages if service else None,
+            "resumed_from_page": service.resumed_from_page if service else None,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            "stats": service.stats if service else None,
+        }
+
+
+sc_import_jobs = SCImportJobManager()
@@ -0,0 +1,189 @@
+"""
+Speicherung von Anwesenheits-Screenshots im Blob Store inkl. WebP-Thumbnail.
+
+Blobs sind inhaltsadressiert und können von mehreren Sessions geteilt werden.
+Schreiben (put bis Commit) und Löschen laufen deshalb unter _blob_lock, und
+purge_blobs() prüft die Referenzen erst unmittelbar vor dem Löschen. Der Lock
+gilt pro Prozess; bei mehreren Workern bleibt ein (harmloser) Rest an
+verwaisten Blobs möglich, aber kein gelöschter Blob einer Session.
+"""
+import logging
+import re
+import threading
+from contextlib import contextmanager
+from io import BytesIO
+from typing import Iterator, List, Optional
+
+from fastapi import HTTPException, Request, status
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.models.attendance import AttendanceSession
+from app.services.blob_store import BlobStore, get_blob_store
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Maximale Kantenlänge der Thumbnails für Listenansichten
+THUMBNAIL_SIZE = (320, 320)
+
+# Serialisiert Upload (put bis Commit) und purge_blobs() innerhalb des Prozesses
+_blob_lock = threading.RLock()
+
+# Magic Bytes -> Content-Type
+IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF8", "image/gif"),
+    (b"BM", "image/bmp"),
+)
+
+
+def detect_content_type(data: bytes) -> str:
+    """Ermittelt den Bildtyp anhand der ersten Bytes."""
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    for signature, content_type in IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return content_type
+    return "image/png"
+
+
+def create_thumbnail(data: bytes) -> Optional[bytes]:
+    """Erzeugt ein verkleinertes WebP-Thumbnail (None wenn nicht möglich)."""
+    if not PIL_AVAILABLE:
+        return None
+    try:
+        image = Image.open(BytesIO(data))
+        image.thumbnail(THUMBNAIL_SIZE)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGB")
+        output = BytesIO()
+        image.save(output, format="WEBP", quality=70)
+        return output.getvalue()
+    except Exception as e:
+        logger.warning("Thumbnail-Fehler: %s", e)
+        return None
+
+
+def store_screenshot(session: AttendanceSession, data: bytes, store: Optional[BlobStore] = None) -> None:
+    """Legt Screenshot und Thumbnail im Blob Store ab und setzt die Schlüssel an der Session."""
+    store = store or get_blob_store()
+    session.screenshot_key = store.put(data)
+    session.screenshot_content_type = detect_content_type(data)
+    session.screenshot_size = len(data)
+
+    thumbnail = create_thumbnail(data)
+    session.thumbnail_key = store.put(thumbnail) if thumbnail else None
+
+
+@contextmanager
+def screenshot_upload(db: Session, session: AttendanceSession, data: Optional[bytes]) -> Iterator[None]:
+    """Speichert den Screenshot (falls vorhanden) für eine neue Session; der Block committet die Session.
+
+    Schlägt der Block fehl, wird zurückgerollt und die gerade geschriebenen
+    Blobs werden wieder entfernt, sofern keine andere Session sie nutzt.
+    """
+    if not data:
+        yield
+        return
+    with _blob_lock:
+        store_screenshot(session, data)
+        keys = [k for k in (session.screenshot_key, session.thumbnail_key) if k]
+        try:
+            yield
+        except BaseException:
+            db.rollback()
+            purge_blobs(db, keys)
+            raise
+
+
+def release_screenshot(db: Session, session: AttendanceSession) -> List[str]:
+    """Entfernt den Screenshot von einer Session.
+
+    Gibt die bisherigen Blob-Schlüssel zurück. Diese nach dem Commit an
+    purge_blobs() übergeben, das nur noch unreferenzierte Blobs löscht.
+    """
+    keys = [k for k in (session.screenshot_key, session.thumbnail_key) if k]
+
+    session.screenshot_key = None
+    session.screenshot_content_type = None
+    session.screenshot_size = None
+    session.thumbnail_key = None
+    return keys
+
+
+def purge_blobs(db: Session, keys: List[str]) -> None:
+    """Löscht Blobs, die von keiner Session mehr referenziert werden.
+
+    Die Referenzen werden unter _blob_lock neu geprüft (committeter Stand),
+    damit ein gleichzeitiger Upload desselben Bildes seinen Blob behält.
+    """
+    if not keys:
+        return
+    store = get_blob_store()
+    with _blob_lock:
+        try:
+            for key in keys:
+                still_used = db.query(AttendanceSession.id).filter(
+                    (AttendanceSession.screenshot_key == key) | (AttendanceSession.thumbnail_key == key)
+                ).first()
+                if not still_used:
+                    store.delete(key)
+        finally:
+            # Nur gelesen - Lese-Transaktion beenden
+            db.rollback()
+
+
+def blob_response(request: Request, key: str, media_type: str) -> Response:
+    """Streamt einen Blob, unterstützt HTTP Range-Requests (206 Partial Content)."""
+    store = get_blob_store()
+    if not store.exists(key):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Datei nicht im Blob Store gefunden"
+        )
+    total = store.size(key)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "private, max-age=86400, immutable",  # inhaltsadressiert
+        "ETag": f'"{key}"',
+    }
+
+    if request.headers.get("if-none-match") == f'"{key}"':
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    range_header = request.headers.get("range")
+    match = re.fullmatch(r"bytes=(\d*)-(\d*)", range_header.strip()) if range_header else None
+    if match and (match.group(1) or match.group(2)):
+        if match.group(1):
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else total - 1
+        else:
+            # Suffix-Range: die letzten N Bytes
+            start = max(0, total - int(match.group(2)))
+            end = total - 1
+        end = min(end, total - 1)
+
+        if start > end:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={"Content-Range": f"bytes */{total}"}
+            )
+
+        headers["Content-Range"] = f"bytes {start}-{end}/{total}"
+        headers["Content-Length"] = str(end - start + 1)
+        return StreamingResponse(
+            store.iter_range(key, start, end),
+            status_code=status.HTTP_206_PARTIAL_CONTENT,
+            media_type=media_type,
+            headers=headers
+        )
+
+    headers["Content-Length"] = str(total)
+    return StreamingResponse(store.iter_range(key), media_type=media_type, headers=headers)
@@ -0,0 +1,76 @@
+"""
+In-Process Event-Bus für Transfer-Request-Änderungen.
+SSE-Verbindungen abonnieren den Bus und berechnen ihre Badge-Zähler neu,
+sobald eine Statusänderung veröffentlicht wird (statt alle 30s zu pollen).
+
+Events werden nur an betroffene User zugestellt (Anfragender, Besitzer)
+sowie an Abonnenten mit Gesamtsicht (Pioneers/Admins), damit nicht jede
+Änderung sämtliche offenen Streams ihre Zähler neu laden lässt.
+
+Hinweis: Der Bus lebt im Prozess. Bei mehreren Uvicorn-Workern erreicht ein
+Event nur die Verbindungen des Workers, der die Änderung verarbeitet hat.
+"""
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, Iterable
+
+
+def _notify(queue: asyncio.Queue) -> None:
+    """Legt eine Benachrichtigung ab (maximal eine ausstehende pro Abonnent)."""
+    if not queue.full():
+        queue.put_nowait(True)
+
+
+@dataclass
+class _Subscriber:
+    loop: asyncio.AbstractEventLoop
+    user_id: int
+    sees_all: bool
+
+
+class TransferEventBus:
+    """Verteilt "Transfer-Requests geändert"-Events an die betroffenen Streams."""
+
+    def __init__(self):
+        self._subscribers: Dict[asyncio.Queue, _Subscriber] = {}
+
+    def subscribe(self, user_id: int, sees_all: bool = True) -> asyncio.Queue:
+        """Registriert einen neuen Abonnenten im laufenden Event-Loop.
+
+        sees_all=True (Standard, bis der User geladen ist) empfängt alle Events.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._subscribers[queue] = _Subscriber(asyncio.get_running_loop(), user_id, sees_all)
+        return queue
+
+    def set_scope(self, queue: asyncio.Queue, sees_all: bool) -> None:
+        """Aktualisiert, ob der Abonnent alle Events braucht (Pioneer/Admin)."""
+        subscriber = self._subscribers.get(queue)
+        if subscriber is not None:
+            subscriber.sees_all = sees_all
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Entfernt einen Abonnenten (z.B. wenn der Client die Verbindung trennt)."""
+        self._subscribers.pop(queue, None)
+
+    def publish(self, user_ids: Iterable[int]) -> None:
+        """Benachrichtigt die Abonnenten der betroffenen User und alle mit Gesamtsicht.
+
+        Threadsicher, auch aus Sync-Endpunkten aufrufbar.
+        """
+        affected = set(user_ids)
+        for queue, subscriber in list(self._subscribers.items()):
+            if not subscriber.sees_all and subscriber.user_id not in affected:
+                continue
+            try:
+                subscriber.loop.call_soon_threadsafe(_notify, queue)
+            except RuntimeError:
+                # Loop bereits geschlossen
+                self._subscribers.pop(queue, None)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+
+transfer_event_bus = TransferEventBus()
@@ -2,37 +2,73 @@
 UEX API Import Service.
 Importiert Preise und Shop-Standorte von der UEX API (uexcorp.space).
 """
-import httpx
+import time
 from datetime import datetime
 from typing import Optional
+from sqlalchemy import bindparam, delete, insert, select, update
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 
+from app.config import get_settings
 from app.models.component import Component
-from app.models.item_price import ItemPrice, UEXSyncLog
+from app.models.item_price import ItemPrice, ItemPriceStaging, UEXSyncLog
+from app.services.http_clients import http_clients
+from app.services.price_history import record_price_history, refresh_price_rollups
 
 
 UEX_API_BASE = "https://api.uexcorp.uk/2.0"
 
+# Zeilen pro executemany-Batch beim Befüllen der Staging-Tabelle
+STAGING_BATCH_SIZE = 2000
+
+SYNC_MODES = ("diff", "full")
+
+# Spalten, die beim Diff verglichen bzw. aktualisiert werden
+DIFF_FIELDS = (
+    "component_id", "uex_id", "item_uuid", "item_name", "terminal_id", "terminal_name",
+    "price_buy", "price_sell", "category_id", "date_added", "date_modified",
+)
+
+settings = get_settings()
+
+
+class IncompleteSyncError(ValueError):
+    """Neuer Datenbestand ist verdächtig klein, der Sync wurde verweigert."""
+
+
+def _normalize(value):
+    """Vergleichbarer Wert (SQLite liefert Datetimes ohne Zeitzone zurück)."""
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    return value
+
 
 class UEXImportService:
     """Service für den Import von UEX Preisdaten."""
 
     def __init__(self, db: Session):
         self.db = db
-        self.client = httpx.Client(timeout=60.0, follow_redirects=True)
+        self.client = http_clients.get_sync("uex")
         self.log: Optional[UEXSyncLog] = None
 
-    def __del__(self):
-        if hasattr(self, 'client'):
-            self.client.close()
+    def sync_prices(self, mode: str = "diff", force: bool = False) -> UEXSyncLog:
+        """Synchronisiert alle Preisdaten von UEX.
+
+        mode="diff": Vergleicht nach (uex_id, terminal_id) und schreibt nur
+        neue, geänderte und entfallene Zeilen (Standard, günstig für häufige Syncs).
+        mode="full": Daten per Bulk-Insert in die Staging-Tabelle ->
+        validieren -> item_prices in einer Transaktion austauschen.
+        force=True: Übernimmt die Daten auch dann, wenn deutlich weniger Preise
+        als bisher ankommen (z.B. wenn UEX tatsächlich Terminals entfernt hat).
+        """
+        if mode not in SYNC_MODES:
+            raise ValueError(f"Unbekannter Sync-Modus: {mode}")
 
-    def sync_prices(self) -> UEXSyncLog:
-        """Synchronisiert alle Preisdaten von UEX."""
         # Erstelle Log-Eintrag
-        self.log = UEXSyncLog(status="running")
+        self.log = UEXSyncLog(status="running", mode=mode)
         self.db.add(self.log)
         self.db.commit()
+        started = time.perf_counter()
 
         try:
             # Hole alle Preise von UEX
@@ -48,61 +84,191 @@ class UEXImportService:
             # Baue UUID -> Component Mapping für schnelles Matching
             uuid_to_component = self._build_uuid_mapping()
 
-            # Lösche alte Preise (vollständiger Sync)
-            self.db.query(ItemPrice).delete()
-            self.db.commit()
+            rows = []
+            for price_entry in prices_data:
+                row = self._build_row(price_entry, uuid_to_component)
+                if row is not None:
+                    rows.append(row)
 
-            # Verarbeite Preisdaten
-            items_matched = 0
-            items_unmatched = 0
+            if mode == "full":
+                staged = self._load_staging(rows)
+                self._validate_staging(staged, len(rows), force)
+                self._swap_from_staging()
+            else:
+                self._check_row_count(len(rows), force)
+                self._apply_diff(rows)
 
-            for price_entry in prices_data:
-                try:
-                    component_id = self._match_component(price_entry, uuid_to_component)
-
-                    item_price = ItemPrice(
-                        component_id=component_id,
-                        uex_id=price_entry.get("id"),
-                        item_uuid=price_entry.get("item_uuid"),
-                        item_name=price_entry.get("item_name", "Unknown"),
-                        terminal_id=price_entry.get("id_terminal"),
-                        terminal_name=price_entry.get("terminal_name", "Unknown"),
-                        price_buy=price_entry.get("price_buy"),
-                        price_sell=price_entry.get("price_sell"),
-                        category_id=price_entry.get("id_category"),
-                        date_added=self._parse_timestamp(price_entry.get("date_added")),
-                        date_modified=self._parse_timestamp(price_entry.get("date_modified")),
-                    )
-                    self.db.add(item_price)
-
-                    if component_id:
-                        items_matched += 1
-                    else:
-                        items_unmatched += 1
-
-                except Exception as e:
-                    # Einzelne Fehler nicht abbrechen lassen
-                    pass
+            # Tages-Bucket im Preisverlauf + Kennzahlen pro Komponente
+            record_price_history(self.db)
+            refresh_price_rollups(self.db)
 
-            self.db.commit()
+            items_matched = sum(1 for row in rows if row["component_id"])
 
             # Update Log
+            self._finish_log(started, len(rows))
             self.log.items_processed = len(prices_data)
             self.log.items_matched = items_matched
-            self.log.items_unmatched = items_unmatched
+            self.log.items_unmatched = len(rows) - items_matched
             self.log.status = "completed"
-            self.log.finished_at = func.now()
+
+            # Preise, Verlauf, Kennzahlen und Log in einer Transaktion: schlägt
+            # ein Schritt fehl, bleibt der alte Stand und das Log sagt "failed"
             self.db.commit()
 
+        except IncompleteSyncError as e:
+            # Verweigerung im Log festhalten, damit sie in /uex/stats sichtbar ist
+            self.db.rollback()
+            self._finish_log(started, 0)
+            self.log.status = "refused"
+            self.log.errors = str(e)[:2000]
+            self.db.commit()
+            raise
+
         except Exception as e:
+            self.db.rollback()
+            self._finish_log(started, 0)
             self.log.status = "failed"
             self.log.errors = str(e)[:2000]
-            self.log.finished_at = func.now()
             self.db.commit()
             raise
 
         return self.log
 
+    def _build_row(self, price_entry: dict, uuid_to_component: dict) -> Optional[dict]:
+        """Wandelt einen UEX-Eintrag in eine Zeile für die Staging-Tabelle um."""
+        try:
+            return {
+                "component_id": self._match_component(price_entry, uuid_to_component),
+                "uex_id": price_entry.get("id"),
+                "item_uuid": price_entry.get("item_uuid"),
+                "item_name": price_entry.get("item_name") or "Unknown",
+                "terminal_id": price_entry.get("id_terminal"),
+                "terminal_name": price_entry.get("terminal_name") or "Unknown",
+                "price_buy": self._parse_price(price_entry.get("price_buy")),
+                "price_sell": self._parse_price(price_entry.get("price_sell")),
+                "category_id": price_entry.get("id_category"),
+                "date_added": self._parse_timestamp(price_entry.get("date_added")),
+                "date_modified": self._parse_timestamp(price_entry.get("date_modified")),
+            }
+        except Exception:
+            # Einzelne fehlerhafte Einträge überspringen
+            return None
+
+    def _load_staging(self, rows: list) -> int:
+        """Leert die Staging-Tabelle und befüllt sie per executemany."""
+        staging = ItemPriceStaging.__table__
+        self.db.execute(delete(staging))
+        for i in range(0, len(rows), STAGING_BATCH_SIZE):
+            self.db.execute(insert(staging), rows[i:i + STAGING_BATCH_SIZE])
+        self.db.commit()
+        return self.db.execute(select(func.count()).select_from(staging)).scalar()
+
+    def _validate_staging(self, staged: int, expected: int, force: bool = False):
+        """Bricht ab, wenn die Staging-Daten unvollständig oder verdächtig klein sind."""
+        if staged == 0:
+            raise ValueError("Staging-Tabelle ist leer - Sync abgebrochen")
+        if staged != expected:
+            raise ValueError(f"Staging unvollständig: {staged} von {expected} Zeilen")
+        self._check_row_count(staged, force)
+
+    def _check_row_count(self, incoming: int, force: bool = False):
+        """Schützt vor unvollständigen API-Antworten.
+
+        Neue Daten müssen mindestens settings.uex_min_staged_ratio des alten
+        Bestands umfassen; force=True überspringt diese Prüfung.
+        """
+        if incoming == 0:
+            raise ValueError("Keine gültigen Preise erhalten - Sync abgebrochen")
+        if force:
+            return
+
+        current = self.db.query(func.count(ItemPrice.id)).scalar()
+        if current and incoming < current * settings.uex_min_staged_ratio:
+            raise IncompleteSyncError(
+                f"Nur {incoming} Preise erhalten (bisher {current}) - "
+                "vermutlich unvollständige API-Antwort, Sync abgebrochen"
+            )
+
+    def _swap_from_staging(self):
+        """Tauscht den Inhalt von item_prices aus (ohne Commit, den macht sync_prices).
+
+        Leser sehen bis zum Commit den alten Stand (SQLite WAL / MVCC),
+        danach sofort den neuen - nie eine leere oder halbe Tabelle.
+        """
+        staging = ItemPriceStaging.__table__
+        target = ItemPrice.__table__
+        columns = [c.name for c in staging.columns if c.name != "id"]
+
+        self.db.execute(delete(target))
+        self.db.execute(
+            insert(target).from_select(
+                columns,
+                select(*[staging.c[name] for name in columns]).order_by(staging.c.id)
+            )
+        )
+        self.db.execute(delete(staging))
+
+    def _apply_diff(self, rows: list):
+        """Gleicht item_prices mit den neuen Daten ab (ohne Commit, den macht sync_prices).
+
+        Schlüssel ist (uex_id, terminal_id). Unveränderte Zeilen werden nicht
+        angefasst, das spart Schreibzugriffe auf die SQLite-Datei.
+        """
+        table = ItemPrice.__table__
+
+        incoming = {}
+        for row in rows:
+            incoming[(row["uex_id"], row["terminal_id"])] = row  # Duplikate: letzter gewinnt
+
+        existing = {}
+        duplicate_ids = []
+        for current in self.db.execute(select(table.c.id, *[table.c[f] for f in DIFF_FIELDS])).mappings():
+            key = (current["uex_id"], current["terminal_id"])
+            if key in existing:
+                duplicate_ids.append(current["id"])
+            else:
+                existing[key] = current
+
+        inserts = []
+        updates = []
+        unchanged = 0
+        for key, row in incoming.items():
+            current = existing.pop(key, None)
+            if current is None:
+                inserts.append(row)
+            elif any(_normalize(current[f]) != _normalize(row[f]) for f in DIFF_FIELDS):
+                # Bind-Parameter dürfen nicht wie die Spalten heißen (SET-Klausel)
+                updates.append({"_id": current["id"], **{f"new_{f}": row[f] for f in DIFF_FIELDS}})
+            else:
+                unchanged += 1
+
+        delete_ids = [current["id"] for current in existing.values()] + duplicate_ids
+
+        for i in range(0, len(inserts), STAGING_BATCH_SIZE):
+            self.db.execute(insert(table), inserts[i:i + STAGING_BATCH_SIZE])
+
+        if updates:
+            stmt = update(table).where(table.c.id == bindparam("_id")).values(
+                {**{f: bindparam(f"new_{f}") for f in DIFF_FIELDS}, "synced_at": func.now()}
+            )
+            for i in range(0, len(updates), STAGING_BATCH_SIZE):
+                self.db.execute(stmt, updates[i:i + STAGING_BATCH_SIZE])
+
+        for i in range(0, len(delete_ids), STAGING_BATCH_SIZE):
+            self.db.execute(delete(table).where(table.c.id.in_(delete_ids[i:i + STAGING_BATCH_SIZE])))
+
+        self.log.rows_inserted = len(inserts)
+        self.log.rows_updated = len(updates)
+        self.log.rows_deleted = len(delete_ids)
+        self.log.rows_unchanged = unchanged
+
+    def _finish_log(self, started: float, rows: int):
+        """Schreibt Laufzeit und Zeilenrate ins Sync-Log."""
+        elapsed = time.perf_counter() - started
+        self.log.finished_at = func.now()
+        self.log.duration_ms = int(elapsed * 1000)
+        self.log.rows_per_second = round(rows / elapsed, 1) if elapsed > 0 and rows else None
+
     def _fetch_all_prices(self) -> list:
         """Holt alle Preisdaten von der UEX API."""
         try:
@@ -144,6 +310,12 @@ class UEXImportService:
 
         return None
 
+    def _parse_price(self, value) -> Optional[float]:
+        """Konvertiert einen Preis zu float (None bei leeren/ungültigen Werten)."""
+        if value is None or value == "":
+            return None
+        return float(value)
+
     def _parse_timestamp(self, timestamp: Optional[int]) -> Optional[datetime]:
         """Konvertiert Unix-Timestamp zu datetime."""
         if timestamp:
@@ -154,7 +326,7 @@ class UEXImportService:
         return None
 
 
-def run_uex_import(db: Session) -> UEXSyncLog:
+def run_uex_import(db: Session, mode: str = "diff", force: bool = False) -> UEXSyncLog:
     """Führt den UEX-Import aus."""
     service = UEXImportService(db)
-    return service.sync_prices()
+    return service.sync_prices(mode, force)
@@ -0,0 +1,83 @@
+"""
+Benchmark für die automatische Crew-Zuweisung (Ungarische Methode).
+Synthetischer Einsatz ohne Datenbank: 150 Anmeldungen auf 40 Einheiten x 5
+Positionen, ein Teil davon mit Rollen-Anforderung. Prüft zusätzlich an
+kleinen Zufallsmatrizen gegen eine Brute-Force-Lösung.
+
+Ausführen: cd backend && python -m scripts.benchmark_auto_assign [--people 150] [--units 40]
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.auto_assign import Candidate, Slot, hungarian, solve  # noqa: E402
+
+ROLES = [1, 2, 3, 4, 5, 6]
+
+
+def make_problem(people: int, units: int, positions: int, rnd: random.Random):
+    slots = [
+        Slot(position_id=u * 100 + p, unit_id=u,
+             required_role_id=rnd.choice([None, None] + ROLES), is_required=rnd.random() < 0.7)
+        for u in range(units)
+        for p in range(positions)
+    ]
+    candidates = [
+        Candidate(
+            user_id=i,
+            preferred_unit_id=rnd.randrange(units),
+            preferred_position_id=rnd.choice([None, rnd.choice(slots).position_id]),
+            is_ready=rnd.random() < 0.6,
+            roles={role: rnd.random() < 0.2 for role in rnd.sample(ROLES, 2)},
+        )
+        for i in range(people)
+    ]
+    return candidates, slots
+
+
+def check_optimality(rounds: int, rnd: random.Random):
+    """Vergleicht hungarian() mit Brute-Force auf kleinen Matrizen."""
+    for _ in range(rounds):
+        n = rnd.randint(1, 5)
+        m = rnd.randint(n, 6)
+        cost = [[rnd.randint(0, 50) for _ in range(m)] for _ in range(n)]
+        best = min(
+            sum(cost[i][perm[i]] for i in range(n))
+            for perm in itertools.permutations(range(m), n)
+        )
+        assert sum(cost[i][j] for i, j in hungarian(cost)) == best, f"nicht optimal: {cost}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Auto-Zuweisung")
+    parser.add_argument("--people", type=int, default=150)
+    parser.add_argument("--units", type=int, default=40)
+    parser.add_argument("--positions", type=int, default=5, help="Positionen pro Einheit")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rnd = random.Random(42)
+    check_optimality(300, rnd)
+    print("OK: Ungarische Methode optimal auf 300 Zufallsmatrizen")
+
+    candidates, slots = make_problem(args.people, args.units, args.positions, rnd)
+    best = None
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        result = solve(candidates, slots)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+
+    preferred = sum(1 for c, s, _ in result if c.preferred_unit_id == s.unit_id)
+    print(f"{len(candidates)} Personen, {len(slots)} Plätze: {len(result)} zugewiesen, "
+          f"{preferred} in Wunsch-Einheit, Punkte {sum(p for _, _, p in result)}")
+    print(f"beste Zeit: {best:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Misst die Latenz von /api/inventory/my, während ein schwerer Endpunkt läuft.
+Zeigt, ob parallele Requests sich überlappen oder gegenseitig blockieren.
+
+Ausführen (Server muss laufen):
+    cd backend && python -m scripts.benchmark_concurrency --token <JWT>
+
+Optionen:
+    --base-url     API-Basis (Standard: http://localhost:8000)
+    --heavy        Pfad des schweren Endpunkts (Standard: /api/inventory/dashboard)
+    --requests     Anzahl Messungen für /api/inventory/my (Standard: 200)
+    --concurrency  Parallele Requests gegen /api/inventory/my (Standard: 10)
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+def percentile(values: list, pct: float) -> float:
+    """Einfaches Perzentil (nearest rank) in Millisekunden."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def hammer_heavy(client: httpx.AsyncClient, path: str, stop: asyncio.Event) -> int:
+    """Ruft den schweren Endpunkt in Schleife auf, bis die Messung fertig ist."""
+    calls = 0
+    while not stop.is_set():
+        await client.get(path)
+        calls += 1
+    return calls
+
+
+async def measure_light(client: httpx.AsyncClient, total: int, concurrency: int) -> list:
+    """Misst die Latenzen von /api/inventory/my in ms."""
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.get("/api/inventory/my")
+            latencies.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+
+    await asyncio.gather(*(one() for _ in range(total)))
+    return latencies
+
+
+async def run(args) -> None:
+    headers = {"Authorization": f"Bearer {args.token}"}
+    async with httpx.AsyncClient(base_url=args.base_url, headers=headers, timeout=120.0) as client:
+        # Baseline ohne Last
+        baseline = await measure_light(client, args.requests, args.concurrency)
+
+        # Unter Last: schwerer Endpunkt läuft parallel
+        stop = asyncio.Event()
+        heavy_task = asyncio.create_task(hammer_heavy(client, args.heavy, stop))
+        loaded = await measure_light(client, args.requests, args.concurrency)
+        stop.set()
+        heavy_calls = await heavy_task
+
+    print(f"{'Szenario':<22} {'p50 (ms)':>10} {'p99 (ms)':>10} {'mean (ms)':>10}")
+    for label, values in (("ohne Last", baseline), (f"mit {args.heavy}", loaded)):
+        print(
+            f"{label:<22} {percentile(values, 50):>10.1f} {percentile(values, 99):>10.1f} "
+            f"{statistics.mean(values):>10.1f}"
+        )
+    print(f"Aufrufe schwerer Endpunkt während Messung: {heavy_calls}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrency-Benchmark für /api/inventory/my")
+    parser.add_argument("--token", required=True, help="JWT eines eingeloggten Users")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--heavy", default="/api/inventory/dashboard")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark für das Pioneer-Lager-Dashboard: alte Pro-Pioneer-Schleife vs. GROUP BY Aggregation.
+Legt eine temporäre SQLite-Datenbank mit 50 Pioneers x 5.000 Lager-Einträgen an.
+
+Ausführen: cd backend && python -m scripts.benchmark_dashboard [--pioneers 50] [--rows 5000]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Eigene Datenbank, bevor app.database importiert wird
+_tmpdir = tempfile.mkdtemp(prefix="poison_bench_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmpdir, 'bench.db')}"
+os.environ["DEBUG"] = "false"
+
+from app.database import Base, engine, SessionLocal, AsyncSessionLocal  # noqa: E402
+from app.models import User, Inventory, Component, Location  # noqa: E402
+from app.routers.inventory import get_inventory_dashboard  # noqa: E402
+
+CATEGORIES = ["Schilde", "Waffen", "Kühler", "Kraftwerke", "Quantenantriebe", "Erze", None]
+
+
+def seed(pioneers: int, rows: int) -> None:
+    """Füllt die Datenbank per Core-Bulk-Insert."""
+    Base.metadata.create_all(bind=engine)
+    rnd = random.Random(42)
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [
+            {"id": i, "username": f"pioneer{i}", "role": "OFFICER", "is_pioneer": True,
+             "is_pending": False, "is_treasurer": False, "is_kg_verwalter": False}
+            for i in range(1, pioneers + 1)
+        ])
+        conn.execute(Location.__table__.insert(), [
+            {"id": i, "name": f"Station {i}"} for i in range(1, 31)
+        ])
+        conn.execute(Component.__table__.insert(), [
+            {"id": i, "name": f"Item {i}", "category": rnd.choice(CATEGORIES)}
+            for i in range(1, 2001)
+        ])
+        conn.execute(Inventory.__table__.insert(), [
+            {"user_id": u, "component_id": rnd.randint(1, 2000),
+             "location_id": rnd.choice([None] + list(range(1, 31))),
+             "quantity": rnd.randint(0, 20)}
+            for u in range(1, pioneers + 1)
+            for _ in range(rows)
+        ])
+
+
+def legacy_dashboard() -> dict:
+    """Bisherige Implementierung: eine Query pro Pioneer + Lazy-Loads pro Zeile."""
+    db = SessionLocal()
+    try:
+        pioneers = db.query(User).filter(User.is_pioneer == True).all()
+        total_items = 0
+        total_quantity = 0
+        stats = []
+        for pioneer in pioneers:
+            inventory = db.query(Inventory).filter(
+                Inventory.user_id == pioneer.id,
+                Inventory.quantity > 0
+            ).all()
+            if not inventory:
+                continue
+            total_items += len(inventory)
+            total_quantity += sum(i.quantity for i in inventory)
+            by_location = {}
+            by_category = {}
+            for inv in inventory:
+                loc = by_location.setdefault(inv.location_id or 0, {
+                    "name": inv.location.name if inv.location else None, "qty": 0
+                })
+                loc["qty"] += inv.quantity
+                cat = inv.component.category or "Unbekannt"
+                by_category[cat] = by_category.get(cat, 0) + inv.quantity
+            stats.append((pioneer.id, by_location, by_category))
+        return {"total_items": total_items, "total_quantity": total_quantity, "total_pioneers": len(stats)}
+    finally:
+        db.close()
+
+
+async def grouped_dashboard() -> dict:
+    async with AsyncSessionLocal() as db:
+        return await get_inventory_dashboard(db=db, current_user=None)
+
+
+def timed(fn, repeat: int):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dashboard-Benchmark")
+    parser.add_argument("--pioneers", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=5000, help="Lager-Einträge pro Pioneer")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"Seede {args.pioneers} Pioneers x {args.rows} Einträge in {_tmpdir} ...")
+    seed(args.pioneers, args.rows)
+
+    old_ms, old = timed(legacy_dashboard, args.repeat)
+    new_ms, new = timed(lambda: asyncio.run(grouped_dashboard()), args.repeat)
+
+    for key in ("total_items", "total_quantity", "total_pioneers"):
+        assert old[key] == new[key], f"{key} weicht ab: {old[key]} != {new[key]}"
+
+    print(f"{'Variante':<20} {'beste Zeit (ms)':>16}")
+    print(f"{'alt (pro Pioneer)':<20} {old_ms:>16.1f}")
+    print(f"{'neu (GROUP BY)':<20} {new_ms:>16.1f}")
+    print(f"Faktor: {old_ms / new_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
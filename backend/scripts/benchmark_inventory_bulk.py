@@ -0,0 +1,179 @@
+"""
+Benchmark für Sammel-Umzug und Patch-Reset eines persönlichen Lagers:
+bisherige Schleife (Lookup + Log-Insert pro Eintrag) vs. set-basierte
+Statements in einer Transaktion. 2.000 Lager-Einträge, temporäre SQLite-DB.
+
+Ausführen: cd backend && python -m scripts.benchmark_inventory_bulk [--rows 2000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Eigene Datenbank, bevor app.database importiert wird
+_tmpdir = tempfile.mkdtemp(prefix="poison_bench_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmpdir, 'bench.db')}"
+os.environ["DEBUG"] = "false"
+
+from app.database import Base, engine, SessionLocal  # noqa: E402
+from app.models import User, Inventory, Component, Location  # noqa: E402
+from app.models.inventory_log import InventoryLog, InventoryAction  # noqa: E402
+from app.routers.inventory import bulk_move_location, patch_reset, log_inventory_change  # noqa: E402
+from app.schemas.inventory import BulkLocationTransfer, PatchResetRequest, PatchKeptItem  # noqa: E402
+
+USER_ID = 1
+LOCATIONS = 10
+
+
+def seed(rows: int) -> None:
+    """Setzt die Datenbank zurück und füllt sie per Core-Bulk-Insert."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    rnd = random.Random(42)
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [
+            {"id": USER_ID, "username": "member", "role": "MEMBER", "is_pioneer": False,
+             "is_pending": False, "is_treasurer": False, "is_kg_verwalter": False}
+        ])
+        conn.execute(Location.__table__.insert(), [
+            {"id": i, "name": f"Station {i}"} for i in range(1, LOCATIONS + 1)
+        ])
+        conn.execute(Component.__table__.insert(), [
+            {"id": i, "name": f"Item {i}"} for i in range(1, rows + 1)
+        ])
+        # Jede Komponente an 1-2 Standorten, damit beim Umzug zusammengeführt wird
+        entries = []
+        for component_id in rnd.sample(range(1, rows + 1), rows // 2):
+            for location_id in rnd.sample(range(1, LOCATIONS + 1), 2):
+                entries.append({"user_id": USER_ID, "component_id": component_id,
+                                "location_id": location_id, "quantity": rnd.randint(1, 20)})
+        conn.execute(Inventory.__table__.insert(), entries[:rows])
+
+
+def snapshot() -> dict:
+    """Summe pro (Komponente, Standort) zum Vergleich der Ergebnisse."""
+    with engine.connect() as conn:
+        rows = conn.execute(Inventory.__table__.select().where(Inventory.__table__.c.quantity > 0)).all()
+        logs = conn.execute(InventoryLog.__table__.select()).all()
+    totals = {}
+    for row in rows:
+        key = (row.component_id, row.location_id)
+        totals[key] = totals.get(key, 0) + row.quantity
+    return {"totals": totals, "logs": sorted((l.component_id, l.quantity, l.quantity_after) for l in logs)}
+
+
+def patch_request(rows: int) -> PatchResetRequest:
+    rnd = random.Random(7)
+    kept = rnd.sample(range(1, rows + 1), rows * 3 // 4)
+    return PatchResetRequest(
+        new_location_id=1,
+        kept_items=[PatchKeptItem(inventory_id=i, quantity=rnd.randint(0, 15)) for i in kept],
+    )
+
+
+def legacy_bulk_move(from_location_id, to_location_id):
+    """Bisherige Implementierung: ein Lookup pro Eintrag."""
+    db = SessionLocal()
+    try:
+        items = db.query(Inventory).filter(
+            Inventory.user_id == USER_ID, Inventory.quantity > 0,
+            Inventory.location_id == from_location_id,
+        ).all()
+        for item in items:
+            existing = db.query(Inventory).filter(
+                Inventory.user_id == USER_ID,
+                Inventory.component_id == item.component_id,
+                Inventory.location_id == to_location_id,
+            ).first()
+            if existing and existing.id != item.id:
+                existing.quantity += item.quantity
+                item.quantity = 0
+            else:
+                item.location_id = to_location_id
+        db.commit()
+    finally:
+        db.close()
+
+
+def legacy_patch_reset(request: PatchResetRequest):
+    """Bisherige Implementierung: Lookup und Log-Insert pro Eintrag."""
+    db = SessionLocal()
+    try:
+        new_location = db.query(Location).filter(Location.id == request.new_location_id).first()
+        kept_map = {ki.inventory_id: ki.quantity for ki in request.kept_items}
+        items = db.query(Inventory).filter(Inventory.user_id == USER_ID, Inventory.quantity > 0).all()
+        for item in items:
+            new_qty = max(0, kept_map.get(item.id, 0))
+            before = item.quantity
+            if new_qty == 0:
+                log_inventory_change(db, USER_ID, item.component_id, InventoryAction.REMOVE,
+                                     -before, before, 0, notes="Patch-Reset: Item verloren")
+                item.quantity = 0
+                continue
+            if new_qty < before:
+                log_inventory_change(db, USER_ID, item.component_id, InventoryAction.REMOVE,
+                                     -(before - new_qty), before, new_qty, notes="Patch-Reset: Menge reduziert")
+                item.quantity = new_qty
+            quantity = item.quantity
+            existing = db.query(Inventory).filter(
+                Inventory.user_id == USER_ID,
+                Inventory.component_id == item.component_id,
+                Inventory.location_id == request.new_location_id,
+            ).first()
+            if existing and existing.id != item.id:
+                existing.quantity += item.quantity
+                item.quantity = 0
+            else:
+                item.location_id = request.new_location_id
+            log_inventory_change(db, USER_ID, item.component_id, InventoryAction.ADD,
+                                 0, quantity, quantity, notes=f"Patch-Reset: Verschoben nach {new_location.name}")
+        db.commit()
+    finally:
+        db.close()
+
+
+def call_endpoint(endpoint, payload):
+    db = SessionLocal()
+    try:
+        user = db.get(User, USER_ID)
+        endpoint(payload, db=db, current_user=user)
+    finally:
+        db.close()
+
+
+def timed(label: str, rows: int, fn) -> tuple:
+    seed(rows)
+    start = time.perf_counter()
+    fn()
+    elapsed = (time.perf_counter() - start) * 1000
+    return elapsed, snapshot()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Sammel-Umzug / Patch-Reset")
+    parser.add_argument("--rows", type=int, default=2000, help="Lager-Einträge des Users")
+    args = parser.parse_args()
+    request = patch_request(args.rows)
+
+    cases = [
+        ("bulk-move", lambda: legacy_bulk_move(2, 1),
+         lambda: call_endpoint(bulk_move_location, BulkLocationTransfer(from_location_id=2, to_location_id=1))),
+        ("patch-reset", lambda: legacy_patch_reset(request),
+         lambda: call_endpoint(patch_reset, request)),
+    ]
+
+    print(f"{'Operation':<14} {'alt (ms)':>10} {'neu (ms)':>10} {'Faktor':>8}")
+    for label, legacy, new in cases:
+        old_ms, old = timed(label, args.rows, legacy)
+        new_ms, result = timed(label, args.rows, new)
+        assert old["totals"] == result["totals"], f"{label}: Mengen weichen ab"
+        assert len(old["logs"]) == len(result["logs"]), f"{label}: Anzahl Log-Einträge weicht ab"
+        print(f"{label:<14} {old_ms:>10.1f} {new_ms:>10.1f} {old_ms / new_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
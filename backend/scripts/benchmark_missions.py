@@ -0,0 +1,286 @@
+"""
+Benchmark und Query-Zähler für den Einsatzplaner.
+
+detail: Mission-Detailansicht (build_mission_detail) mit wachsender Anzahl Anmeldungen.
+        Die Anzahl der SQL-Statements muss konstant bleiben - steigt sie mit
+        den Anmeldungen, ist wieder eine Query pro Anmeldung hinzugekommen.
+list:   Missionsliste (get_missions) mit 200 Missionen - bisheriges Laden aller
+        Units/Positionen/Zuweisungen/Anmeldungen vs. Zähler per SQL-Subquery.
+template: Mission aus einem großen Template (20 Einheiten x 6 Positionen)
+        anlegen - ORM-Objekt für Objekt vs. instantiate_tree (Multi-Row-Insert).
+
+Ausführen: cd backend && python -m scripts.benchmark_missions [detail|list|template] [--missions 200]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Eigene Datenbank, bevor app.database importiert wird
+_tmpdir = tempfile.mkdtemp(prefix="poison_bench_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmpdir, 'bench.db')}"
+os.environ["DEBUG"] = "false"
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.orm import joinedload  # noqa: E402
+
+from app.database import Base, engine, SessionLocal  # noqa: E402
+from app.models import User  # noqa: E402
+from app.models.loadout import Ship, MetaLoadout, UserLoadout  # noqa: E402
+from app.models.mission import (  # noqa: E402
+    Mission, MissionPhase, MissionUnit, MissionPosition, MissionRegistration, MissionAssignment, UserShip
+)
+from app.services.mission_builder import instantiate_tree  # noqa: E402
+from app.routers.mission import build_mission_detail, get_missions, mission_to_response  # noqa: E402
+
+ADMIN_ID = 1
+UNITS_PER_MISSION = 6
+POSITIONS_PER_UNIT = 5
+
+
+class QueryCounter:
+    """Zählt die SQL-Statements der Engine."""
+
+    def __init__(self):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+
+def seed_users(users: int) -> None:
+    """Setzt die Datenbank zurück und legt User, Schiffe und Loadouts an."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    rnd = random.Random(42)
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [
+            {"id": i, "username": f"user{i}", "role": "ADMIN" if i == ADMIN_ID else "MEMBER",
+             "is_pioneer": False, "is_pending": False, "is_treasurer": False, "is_kg_verwalter": False}
+            for i in range(1, users + 1)
+        ])
+        conn.execute(Ship.__table__.insert(), [{"id": i, "name": f"Ship {i}"} for i in range(1, 11)])
+        conn.execute(MetaLoadout.__table__.insert(), [
+            {"id": i, "ship_id": i, "name": f"Meta {i}"} for i in range(1, 11)
+        ])
+        conn.execute(UserLoadout.__table__.insert(), [
+            {"id": i, "user_id": i, "loadout_id": (i % 10) + 1, "ship_id": (i % 10) + 1,
+             "is_ready": rnd.random() < 0.7}
+            for i in range(1, users + 1)
+        ])
+        conn.execute(UserShip.__table__.insert(), [
+            {"user_id": i, "ship_name": f"Ship {i % 10}"} for i in range(1, users + 1) if i % 3
+        ])
+
+
+def seed_mission(mission_id: int, registrations: int, rnd: random.Random) -> None:
+    """Legt eine Mission mit Einheiten, Positionen, Zuweisungen und Anmeldungen an."""
+    with engine.begin() as conn:
+        conn.execute(Mission.__table__.insert(), [{
+            "id": mission_id, "title": f"Einsatz {mission_id}", "status": "PUBLISHED",
+            "scheduled_date": datetime(2026, 1, 1) + timedelta(days=mission_id),
+            "created_by_id": ADMIN_ID,
+        }])
+        unit_ids = []
+        for u in range(UNITS_PER_MISSION):
+            result = conn.execute(MissionUnit.__table__.insert(), [{
+                "mission_id": mission_id, "name": f"Einheit {u}", "sort_order": u,
+            }])
+            unit_ids.append(result.inserted_primary_key[0])
+        position_ids = []
+        for unit_id in unit_ids:
+            for p in range(POSITIONS_PER_UNIT):
+                result = conn.execute(MissionPosition.__table__.insert(), [{
+                    "unit_id": unit_id, "name": f"Position {p}", "sort_order": p, "max_count": 2,
+                }])
+                position_ids.append(result.inserted_primary_key[0])
+        user_ids = rnd.sample(range(2, 2 + registrations), registrations)
+        conn.execute(MissionRegistration.__table__.insert(), [
+            {"mission_id": mission_id, "user_id": user_id, "user_loadout_ids": [user_id],
+             "status": "registered"}
+            for user_id in user_ids
+        ])
+        conn.execute(MissionAssignment.__table__.insert(), [
+            {"position_id": position_id, "user_id": user_id, "assigned_by_id": ADMIN_ID}
+            for position_id, user_id in zip(position_ids, user_ids)
+        ])
+
+
+def run_detail(registrations: list) -> None:
+    seed_users(max(registrations) + 2)
+    counter = QueryCounter()
+    rnd = random.Random(42)
+    for mission_id, count in enumerate(registrations, start=1):
+        seed_mission(mission_id, count, rnd)
+
+    print(f"{'Anmeldungen':>12} {'Queries':>8} {'Zeit (ms)':>10}")
+    query_counts = set()
+    for mission_id, count in enumerate(registrations, start=1):
+        db = SessionLocal()
+        try:
+            counter.count = 0
+            start = time.perf_counter()
+            response = build_mission_detail(db, mission_id)
+            elapsed = (time.perf_counter() - start) * 1000
+        finally:
+            db.close()
+        assert len(response["registrations"]) == count
+        query_counts.add(counter.count)
+        print(f"{count:>12} {counter.count:>8} {elapsed:>10.1f}")
+
+    assert len(query_counts) == 1, f"Query-Anzahl hängt von den Anmeldungen ab: {sorted(query_counts)}"
+    print("OK: konstante Anzahl Queries")
+
+
+def legacy_list(limit: int) -> list:
+    """Bisherige Implementierung: alle Unterobjekte laden und in Python zählen."""
+    db = SessionLocal()
+    try:
+        missions = db.query(Mission).options(
+            joinedload(Mission.created_by),
+            joinedload(Mission.start_location),
+            joinedload(Mission.units).joinedload(MissionUnit.positions).joinedload(MissionPosition.assignments),
+            joinedload(Mission.registrations),
+        ).order_by(Mission.scheduled_date.desc()).limit(limit).all()
+        return [mission_to_response(m, db) for m in missions]
+    finally:
+        db.close()
+
+
+def sql_count_list(limit: int) -> list:
+    db = SessionLocal()
+    try:
+        admin = db.get(User, ADMIN_ID)
+        return get_missions(status_filter=None, upcoming=False, limit=limit, db=db, current_user=admin)
+    finally:
+        db.close()
+
+
+def run_list(missions: int, registrations: int, repeat: int) -> None:
+    seed_users(registrations + 2)
+    rnd = random.Random(42)
+    for mission_id in range(1, missions + 1):
+        seed_mission(mission_id, registrations, rnd)
+    counter = QueryCounter()
+
+    results = {}
+    print(f"{'Variante':<16} {'Queries':>8} {'beste Zeit (ms)':>16}")
+    for label, fn in (("alt (joinedload)", legacy_list), ("neu (Subquery)", sql_count_list)):
+        best = None
+        for _ in range(repeat):
+            counter.count = 0
+            start = time.perf_counter()
+            results[label] = fn(missions)
+            elapsed = (time.perf_counter() - start) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{label:<16} {counter.count:>8} {best:>16.1f}")
+
+    old, new = results.values()
+    keys = ("id", "total_positions", "assignment_count", "registration_count")
+    assert [tuple(m[k] for k in keys) for m in old] == [tuple(m[k] for k in keys) for m in new], "Zähler weichen ab"
+    print("OK: identische Zähler")
+
+
+def make_template(units: int, positions: int) -> dict:
+    """template_data für einen großen Flotten-Einsatz."""
+    return {
+        "units": [
+            {"name": f"Einheit {u}", "unit_type": "wing", "sort_order": u,
+             "radio_frequencies": {"intern": f"102.{u:02d}"},
+             "positions": [
+                 {"name": f"Position {p}", "position_type": "crew", "sort_order": p}
+                 for p in range(positions)
+             ]}
+            for u in range(units)
+        ],
+        "phases": [{"phase_number": i, "title": f"Phase {i}"} for i in range(1, 6)],
+    }
+
+
+def legacy_instantiate(db, mission_id: int, data: dict):
+    """Bisherige Implementierung: ein ORM-Objekt nach dem anderen, Flush pro Einheit."""
+    for unit_data in data.get("units", []):
+        unit = MissionUnit(
+            mission_id=mission_id, name=unit_data.get("name"), unit_type=unit_data.get("unit_type"),
+            ship_name=unit_data.get("ship_name"), radio_frequencies=unit_data.get("radio_frequencies"),
+            sort_order=unit_data.get("sort_order", 0),
+        )
+        db.add(unit)
+        db.flush()
+        for pos_data in unit_data.get("positions", []):
+            db.add(MissionPosition(
+                unit_id=unit.id, name=pos_data.get("name"), position_type=pos_data.get("position_type"),
+                is_required=pos_data.get("is_required", True), min_count=pos_data.get("min_count", 1),
+                max_count=pos_data.get("max_count", 1), sort_order=pos_data.get("sort_order", 0),
+            ))
+    for phase_data in data.get("phases", []):
+        db.add(MissionPhase(
+            mission_id=mission_id, phase_number=phase_data.get("phase_number"),
+            title=phase_data.get("title"), sort_order=phase_data.get("phase_number", 0),
+        ))
+
+
+def run_template(units: int, positions: int, repeat: int) -> None:
+    seed_users(2)
+    data = make_template(units, positions)
+    print(f"Template: {units} Einheiten x {positions} Positionen = {units * positions} Positionen")
+    print(f"{'Variante':<18} {'beste Zeit (ms)':>16}")
+    mission_id = 0
+    for label, fn in (("alt (ORM)", legacy_instantiate),
+                      ("neu (Bulk)", lambda db, mid, d: instantiate_tree(db, mid, d["units"], d["phases"]))):
+        best = None
+        for _ in range(repeat):
+            mission_id += 1
+            db = SessionLocal()
+            try:
+                db.add(Mission(id=mission_id, title="Template", scheduled_date=datetime(2026, 1, 1),
+                               created_by_id=ADMIN_ID))
+                db.flush()
+                start = time.perf_counter()
+                fn(db, mission_id, data)
+                db.commit()
+                elapsed = (time.perf_counter() - start) * 1000
+            finally:
+                db.close()
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{label:<18} {best:>16.1f}")
+
+    with engine.connect() as conn:
+        counts = {
+            mid: conn.execute(
+                MissionPosition.__table__.select()
+                .join(MissionUnit.__table__)
+                .where(MissionUnit.__table__.c.mission_id == mid)
+            ).all()
+            for mid in (1, mission_id)
+        }
+    assert len(counts[1]) == len(counts[mission_id]) == units * positions, "Positionen fehlen"
+    print("OK: gleiche Anzahl Positionen")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Einsatzplaner-Benchmark")
+    parser.add_argument("mode", nargs="?", choices=["detail", "list", "template"], default="detail")
+    parser.add_argument("--registrations", type=int, nargs="+", default=[10, 60, 120],
+                        help="Anmeldungen pro Mission (detail; bei list wird der erste Wert genutzt)")
+    parser.add_argument("--missions", type=int, default=200, help="Anzahl Missionen (list)")
+    parser.add_argument("--units", type=int, default=20, help="Einheiten im Template (template)")
+    parser.add_argument("--positions", type=int, default=6, help="Positionen pro Einheit (template)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    if args.mode == "template":
+        run_template(args.units, args.positions, args.repeat)
+    elif args.mode == "list":
+        run_list(args.missions, args.registrations[0], args.repeat)
+    else:
+        run_detail(args.registrations)
+
+
+if __name__ == "__main__":
+    main()
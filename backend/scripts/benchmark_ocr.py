@@ -0,0 +1,82 @@
+"""
+Benchmark für den OCR-Scan: Wall-Time pro Screenshot und Reaktionsfähigkeit
+des Event-Loops, während ein Scan im Process-Pool läuft.
+
+Ausführen: cd backend && python -m scripts.benchmark_ocr <ordner-mit-screenshots>
+(benötigt Tesseract; unterstützt .png, .jpg, .jpeg)
+"""
+import asyncio
+import os
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ocr.scanner import (  # noqa: E402
+    OCR_PSM_MODES, Image, extract_names_from_image, is_ocr_available,
+    preprocess_image, run_psm_pass, unique_names
+)
+from app.ocr.jobs import OCRJobManager  # noqa: E402
+
+
+def scan_sequential(image_bytes: bytes) -> list:
+    """Bisheriges Verhalten: PSM-Durchläufe nacheinander."""
+    processed = preprocess_image(Image.open(BytesIO(image_bytes)))
+    names = []
+    for psm in OCR_PSM_MODES:
+        names.extend(run_psm_pass(processed, psm))
+    return unique_names(names)
+
+
+async def loop_lag_during_scan(manager: OCRJobManager, image_bytes: bytes) -> tuple:
+    """Misst die maximale Verzögerung eines 10ms-Ticks, während der Scan läuft."""
+    job_id = manager.submit(image_bytes, user_id=0, cache_key="benchmark")
+    job = manager.get(job_id)
+    max_lag = 0.0
+    start = time.perf_counter()
+    while not job["future"].done():
+        tick = time.perf_counter()
+        await asyncio.sleep(0.01)
+        max_lag = max(max_lag, (time.perf_counter() - tick - 0.01) * 1000)
+    return (time.perf_counter() - start) * 1000, max_lag
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    if not is_ocr_available():
+        print("Tesseract nicht verfügbar")
+        sys.exit(1)
+
+    files = sorted(
+        p for p in Path(sys.argv[1]).iterdir()
+        if p.suffix.lower() in (".png", ".jpg", ".jpeg")
+    )
+    manager = OCRJobManager(max_workers=2, max_pending=10)
+
+    print(f"{'Datei':<30} {'seq (ms)':>10} {'parallel (ms)':>14} {'pool (ms)':>10} {'max Loop-Lag (ms)':>18}")
+    try:
+        for path in files:
+            image_bytes = path.read_bytes()
+
+            start = time.perf_counter()
+            seq_names = scan_sequential(image_bytes)
+            seq_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            par_names = extract_names_from_image(BytesIO(image_bytes))
+            par_ms = (time.perf_counter() - start) * 1000
+
+            assert seq_names == par_names, f"Ergebnis weicht ab für {path.name}"
+
+            pool_ms, lag_ms = asyncio.run(loop_lag_during_scan(manager, image_bytes))
+            print(f"{path.name[:30]:<30} {seq_ms:>10.0f} {par_ms:>14.0f} {pool_ms:>10.0f} {lag_ms:>18.1f}")
+    finally:
+        manager.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark für das Schreiben der SC-Items: bisheriges SELECT + ORM-add pro Item
+vs. vorab geladene sc_uuid-Zuordnung mit Bulk-Insert/-Update pro Seite.
+Ohne Netzwerk - die Seiten werden synthetisch erzeugt. Zwei Durchläufe:
+erst alles neu (Inserts), dann alles vorhanden (Updates).
+
+Ausführen: cd backend && python -m scripts.benchmark_sc_import [--pages 50]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Eigene Datenbank, bevor app.database importiert wird
+_tmpdir = tempfile.mkdtemp(prefix="poison_bench_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmpdir, 'bench.db')}"
+os.environ["DEBUG"] = "false"
+
+from app.database import Base, engine, SessionLocal  # noqa: E402
+from app.models import Component, SCImportCheckpoint  # noqa: E402
+from app.services.sc_import import COMPONENT_TYPE_MAPPING, SCImportService  # noqa: E402
+
+ITEMS_PER_PAGE = 100
+
+
+def make_pages(pages: int) -> list:
+    """Erzeugt API-Seiten im Format von /items."""
+    rnd = random.Random(42)
+    types = list(COMPONENT_TYPE_MAPPING)
+    return [
+        {"data": [
+            {
+                "uuid": f"{p:04d}-{i:04d}-bench",
+                "name": f"Bench Item {p}-{i}",
+                "type": rnd.choice(types),
+                "class_name": f"BENCH_{p}_{i}",
+                "grade": rnd.choice("ABCD"),
+                "size": rnd.randint(0, 4),
+                "manufacturer": {"name": "Bench Industries"},
+                "shield": {"max_health": rnd.random() * 10000},
+            }
+            for i in range(ITEMS_PER_PAGE)
+        ]}
+        for p in range(pages)
+    ]
+
+
+def legacy_write(pages: list) -> int:
+    """Bisheriges Verhalten: ein SELECT pro Item, ORM-Objekte, Commit pro Seite."""
+    db = SessionLocal()
+    service = SCImportService(db)
+    count = 0
+    try:
+        for page in pages:
+            for item in page["data"]:
+                values = service._component_values(item)
+                if not values:
+                    continue
+                existing = db.query(Component).filter(Component.sc_uuid == values["sc_uuid"]).first()
+                if existing:
+                    for key, value in values.items():
+                        setattr(existing, key, value)
+                else:
+                    db.add(Component(**values))
+                count += 1
+            db.commit()
+    finally:
+        db.close()
+    return count
+
+
+def batched_write(pages: list) -> int:
+    """Neues Verhalten über SCImportService._process_page."""
+    db = SessionLocal()
+    service = SCImportService(db)
+    try:
+        service.checkpoint = SCImportCheckpoint(last_completed_page=0, status="running")
+        db.add(service.checkpoint)
+        service.uuid_to_id = service._load_uuid_map()
+        completed = set()
+        for number, page in enumerate(pages, start=1):
+            service._process_page(number, page, completed)
+        return service.stats.items_processed
+    finally:
+        db.close()
+
+
+def run(label: str, func, pages: list):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    for phase in ("insert", "update"):
+        start = time.perf_counter()
+        count = func(pages)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<10} {phase:<7} {count:>7} Items  {elapsed * 1000:>9.0f} ms  {count / elapsed:>9.0f} Items/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=50)
+    args = parser.parse_args()
+
+    pages = make_pages(args.pages)
+    run("legacy", legacy_write, pages)
+    run("batched", batched_write, pages)
+
+
+if __name__ == "__main__":
+    main()
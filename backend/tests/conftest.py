@@ -0,0 +1,69 @@
+"""
+Gemeinsame Fixtures für die Backend-Tests.
+
+Ausführen:
+    cd backend && python -m pytest
+
+Die Tests laufen gegen eine In-Memory-SQLite-Datenbank, die vor jedem Test
+frisch aus den Models angelegt wird.
+"""
+import os
+
+# Vor dem Import der App setzen: keine Datei-DB, kein SQL-Echo, kein Auth-Cache
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("AUTH_CACHE_ENABLED", "false")
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+import app.models  # noqa: F401  (alle Tabellen registrieren)
+
+
+@pytest.fixture
+def engine():
+    """Frische In-Memory-Datenbank (eine Verbindung, damit alle Sessions sie sehen)."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    """Session auf der Test-Datenbank."""
+    session = sessionmaker(bind=engine, autoflush=False)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def count_statements(engine):
+    """Zählt die SQL-Statements, die innerhalb des with-Blocks abgesetzt werden."""
+    class Counter:
+        def __init__(self):
+            self.statements = []
+
+        def __enter__(self):
+            self.statements = []
+            event.listen(engine, "before_cursor_execute", self._record)
+            return self
+
+        def __exit__(self, *exc):
+            event.remove(engine, "before_cursor_execute", self._record)
+
+        def _record(self, conn, cursor, statement, parameters, context, executemany):
+            self.statements.append(statement)
+
+        @property
+        def count(self):
+            return len(self.statements)
+
+    return Counter()
@@ -0,0 +1,55 @@
+"""Auto-Zuweisung: Berechtigung gegen die geladene Mission, Revision ist Pflicht."""
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.auth.jwt import get_current_user
+from app.database import get_db
+from app.main import app
+from app.models.mission import Mission
+from app.models.user import User, UserRole
+
+
+@pytest.fixture
+def client(db):
+    officer = User(username="officer", role=UserRole.OFFICER)
+    db.add(officer)
+    db.flush()
+    db.add(Mission(title="Einsatz", scheduled_date=datetime(2026, 1, 1), created_by_id=officer.id))
+    db.commit()
+
+    current = {"user": officer}
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: current["user"]
+    # Ohne "with": kein Lifespan (keine Server-Hintergrunddienste im Test)
+    yield TestClient(app), current
+    app.dependency_overrides.clear()
+
+
+def test_apply_requires_revision(client):
+    http, _ = client
+    response = http.post("/api/missions/1/auto-assign/apply", json={"assignments": []})
+    assert response.status_code == 422
+
+
+def test_apply_rejects_stale_revision(client):
+    http, _ = client
+    revision = http.post("/api/missions/1/auto-assign").json()["revision"]
+
+    response = http.post("/api/missions/1/auto-assign/apply", json={"revision": revision + 1, "assignments": []})
+    assert response.status_code == 409
+
+    response = http.post("/api/missions/1/auto-assign/apply", json={"revision": revision, "assignments": []})
+    assert response.status_code == 200
+
+
+def test_auto_assign_checks_manager_and_mission(client, db):
+    http, current = client
+    assert http.post("/api/missions/99/auto-assign").status_code == 404
+
+    member = User(username="member", role=UserRole.MEMBER)
+    db.add(member)
+    db.commit()
+    current["user"] = member
+    assert http.post("/api/missions/1/auto-assign").status_code == 403
@@ -0,0 +1,37 @@
+"""Komponentensuche: FTS-Trigram-Index ab 3 Zeichen, sonst LIKE - Dialekt aus der Session."""
+import pytest
+
+from app.models.component import Component, component_search_filter, normalize_search
+
+
+@pytest.fixture
+def components(db):
+    db.add_all([
+        Component(name="FR-66", manufacturer="Gorgon Defender Industries", category="Ship Components"),
+        Component(name="TS-2", manufacturer="Ascension Astro", category="Ship Components"),
+        Component(name="Bulwark", manufacturer="Gorgon Defender Industries", category="Ship Components"),
+    ])
+    db.commit()
+
+
+def _search(db, q):
+    normalized = normalize_search(q)
+    return sorted(
+        c.name for c in db.query(Component).filter(
+            component_search_filter(normalized, db.get_bind().dialect.name)
+        )
+    )
+
+
+def test_trigram_search_matches_name_and_manufacturer(db, components):
+    assert _search(db, "fr 66") == ["FR-66"]
+    assert _search(db, "gorgon") == ["Bulwark", "FR-66"]
+
+
+def test_short_terms_fall_back_to_like(db, components):
+    assert _search(db, "ts") == ["TS-2"]
+
+
+def test_other_dialects_use_like(db, components):
+    clause = component_search_filter("gorgon", "postgresql")
+    assert "components_fts" not in str(clause)
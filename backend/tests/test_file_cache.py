@@ -0,0 +1,50 @@
+"""Aufräumen der Datei-Caches: Alter und Obergrenze."""
+import os
+import time
+
+from app.services.file_cache import CacheSweeper
+
+
+def _touch(path, age_seconds):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("{}")
+    mtime = time.time() - age_seconds
+    os.utime(path, (mtime, mtime))
+
+
+def test_sweep_removes_expired_and_oldest(tmp_path):
+    for i in range(5):
+        _touch(tmp_path / f"fresh{i}.json", age_seconds=i)
+    _touch(tmp_path / "expired.json", age_seconds=120)
+    _touch(tmp_path / ".tmp-keep", age_seconds=120)
+
+    sweeper = CacheSweeper(tmp_path, "*.json", max_age_seconds=60, max_entries=3)
+
+    assert sweeper.sweep() == 3
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".tmp-keep", "fresh0.json", "fresh1.json", "fresh2.json"]
+
+
+def test_maybe_sweep_runs_once_per_interval(tmp_path):
+    sweeper = CacheSweeper(tmp_path, "**/*.json", max_age_seconds=60, max_entries=10, interval_seconds=600)
+    _touch(tmp_path / "ab" / "old.json", age_seconds=120)
+    sweeper.maybe_sweep()
+    _touch(tmp_path / "ab" / "old2.json", age_seconds=120)
+    sweeper.maybe_sweep()
+
+    assert sweeper.removed == 1
+    assert (tmp_path / "ab" / "old2.json").exists()
+
+
+def test_fleetyards_cache_sweeps_on_store(tmp_path):
+    from app.services.fleetyards_cache import FleetYardsCache
+
+    cache = FleetYardsCache(str(tmp_path), ttl_seconds=60, max_age_seconds=3600, max_entries=2)
+    for i in range(3):
+        cache.sweeper._last_sweep = 0.0
+        cache._store(f"model:{i}", {"fetched_at": time.time(), "data": i})
+        time.sleep(0.01)
+
+    assert len(list(tmp_path.glob("*/*.json"))) == 2
+    assert cache._load("model:0") is None
+    assert cache._load("model:2")["data"] == 2
+    assert cache.stats()["swept"] == 1
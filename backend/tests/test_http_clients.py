@@ -0,0 +1,48 @@
+"""Gemeinsame async Clients sind an den Server-Loop gebunden."""
+import asyncio
+
+import pytest
+
+from app.services.http_clients import HTTPClientRegistry
+
+
+def test_get_async_requires_server_loop():
+    registry = HTTPClientRegistry()
+
+    async def outside_server_loop():
+        with pytest.raises(RuntimeError):
+            registry.get_async("uex")
+        async with registry.async_session("uex") as client:
+            assert not client.is_closed
+        return client
+
+    client = asyncio.run(outside_server_loop())
+    # Kein Loop wurde gemerkt, der Einweg-Client ist geschlossen
+    assert registry._loop is None
+    assert client.is_closed
+    assert registry._async_clients == {}
+
+
+def test_async_session_shares_client_only_in_server_loop():
+    registry = HTTPClientRegistry()
+
+    async def server():
+        registry.start()
+        async with registry.async_session("uex") as first:
+            pass
+        async with registry.async_session("uex") as second:
+            pass
+        assert first is second is registry.get_async("uex")
+        assert not first.is_closed
+        return first
+
+    shared = asyncio.run(server())
+
+    async def other_loop():
+        with pytest.raises(RuntimeError):
+            registry.get_async("uex")
+        async with registry.async_session("uex") as client:
+            assert client is not shared
+
+    asyncio.run(other_loop())
+    asyncio.run(registry.aclose())
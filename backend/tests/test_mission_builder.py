@@ -0,0 +1,48 @@
+"""Einsatz-Strukturen per Multi-Row-Insert: IDs in Einfüge-Reihenfolge."""
+from datetime import datetime
+
+from app.models.mission import Mission, MissionPhase, MissionPosition, MissionUnit
+from app.models.user import User
+from app.services.mission_builder import clone_mission, instantiate_tree
+
+UNITS = [
+    {"name": "GKS", "positions": [{"name": "Kommandant"}, {"name": "Pilot"}]},
+    {"name": "Wing", "positions": [{"name": "Lead"}]},
+]
+PHASES = [{"phase_number": 1, "title": "Sammeln"}, {"phase_number": 2, "title": "Abflug"}]
+
+
+def _mission(db):
+    user = User(username="lead")
+    db.add(user)
+    db.flush()
+    mission = Mission(title="Einsatz", scheduled_date=datetime(2026, 1, 1), created_by_id=user.id)
+    db.add(mission)
+    db.flush()
+    return mission
+
+
+def test_ids_match_rows_when_mission_already_has_units(db):
+    mission = _mission(db)
+    instantiate_tree(db, mission.id, UNITS, PHASES)
+
+    ids = instantiate_tree(db, mission.id, list(reversed(UNITS)), PHASES)
+
+    assert [db.get(MissionUnit, i).name for i in ids["unit_ids"]] == ["Wing", "GKS"]
+    positions = [db.get(MissionPosition, i) for i in ids["position_ids"]]
+    assert [(p.unit_id, p.name) for p in positions] == [
+        (ids["unit_ids"][0], "Lead"),
+        (ids["unit_ids"][1], "Kommandant"),
+        (ids["unit_ids"][1], "Pilot"),
+    ]
+    assert [db.get(MissionPhase, i).title for i in ids["phase_ids"]] == ["Sammeln", "Abflug"]
+
+
+def test_clone_copies_structure(db):
+    source = _mission(db)
+    instantiate_tree(db, source.id, UNITS, PHASES)
+
+    clone, ids = clone_mission(db, source, source.created_by_id, "Kopie", datetime(2026, 2, 1))
+
+    assert len(ids["unit_ids"]) == 2 and len(ids["position_ids"]) == 3 and len(ids["phase_ids"]) == 2
+    assert db.query(MissionUnit).filter(MissionUnit.mission_id == clone.id).count() == 2
@@ -0,0 +1,91 @@
+"""Mission.revision: Core-Bump ohne updated_at, gebündelte Auflösung, Loadout-Änderungen."""
+from datetime import datetime
+
+import pytest
+
+from app.models.loadout import MetaLoadout, Ship, UserLoadout
+from app.models.mission import (
+    Mission, MissionAssignment, MissionPosition, MissionRegistration, MissionUnit
+)
+from app.models.user import User
+import app.services.mission_cache  # noqa: F401  (Session-Events registrieren)
+
+
+@pytest.fixture
+def mission(db):
+    user = User(username="lead")
+    db.add(user)
+    db.flush()
+    mission = Mission(
+        title="Einsatz", scheduled_date=datetime(2026, 1, 1), created_by_id=user.id,
+        updated_at=datetime(2025, 1, 1),
+    )
+    db.add(mission)
+    db.flush()
+    unit = MissionUnit(mission_id=mission.id, name="Wing")
+    db.add(unit)
+    db.flush()
+    db.add_all([MissionPosition(unit_id=unit.id, name=f"Pilot {i}") for i in range(5)])
+    db.commit()
+    return mission
+
+
+def _revision(db, mission):
+    db.expire_all()
+    return db.get(Mission, mission.id).revision
+
+
+def test_bump_keeps_updated_at(db, mission):
+    before = _revision(db, mission)
+    unit = db.query(MissionUnit).one()
+    unit.name = "Wing I"
+    db.commit()
+
+    db.expire_all()
+    assert mission.revision == before + 1
+    assert mission.updated_at == datetime(2025, 1, 1)
+
+
+def test_assignments_resolved_in_one_query(db, mission, count_statements):
+    before = _revision(db, mission)
+    lead = db.query(User).one()
+    positions = db.query(MissionPosition).all()
+
+    with count_statements as counter:
+        db.add_all([MissionAssignment(position_id=p.id, user_id=lead.id, assigned_by_id=lead.id) for p in positions])
+        db.flush()
+
+    lookups = [s for s in counter.statements if "mission_units" in s and s.lstrip().upper().startswith("SELECT")]
+    assert len(lookups) == 1
+    db.commit()
+    assert _revision(db, mission) == before + 1
+
+
+def test_loadout_change_bumps_registered_missions(db, mission):
+    pilot = User(username="pilot")
+    db.add(pilot)
+    db.flush()
+    ship = Ship(name="Gladius", slug="gladius")
+    db.add(ship)
+    db.flush()
+    meta = MetaLoadout(ship_id=ship.id, name="PvP", created_by_id=pilot.id)
+    db.add(meta)
+    db.flush()
+    user_loadout = UserLoadout(user_id=pilot.id, loadout_id=meta.id, ship_id=ship.id, is_ready=False)
+    db.add(user_loadout)
+    db.add(MissionRegistration(mission_id=mission.id, user_id=pilot.id, user_loadout_ids=[]))
+    db.commit()
+    before = _revision(db, mission)
+
+    user_loadout.is_ready = True
+    db.commit()
+    assert _revision(db, mission) == before + 1
+
+    # Reine Login-Felder lösen keinen Bump aus
+    pilot.last_seen_transfers = datetime(2026, 1, 2)
+    db.commit()
+    assert _revision(db, mission) == before + 1
+
+    pilot.display_name = "Ace"
+    db.commit()
+    assert _revision(db, mission) == before + 2
@@ -0,0 +1,76 @@
+"""Mission-Detailansicht: Anzahl der Queries hängt nicht von den Anmeldungen ab."""
+from datetime import datetime
+
+from sqlalchemy.orm import sessionmaker
+
+from app.models.loadout import MetaLoadout, Ship, UserLoadout
+from app.models.mission import (
+    Mission, MissionAssignment, MissionPosition, MissionRegistration, MissionUnit, UserShip
+)
+from app.models.user import User
+from app.routers.mission import build_mission_detail
+
+REGISTRATION_COUNTS = (1, 10, 60)
+
+
+def _seed_mission(db, lead, ship, meta, registrations: int) -> int:
+    """Mission mit Anmeldungen; jeder angemeldete User hat ein Schiff und ein Loadout."""
+    mission = Mission(title=f"Einsatz {registrations}", scheduled_date=datetime(2026, 1, 1), created_by_id=lead.id)
+    db.add(mission)
+    db.flush()
+    unit = MissionUnit(mission_id=mission.id, name="Wing")
+    db.add(unit)
+    db.flush()
+    positions = [MissionPosition(unit_id=unit.id, name=f"Pilot {i}") for i in range(registrations)]
+    db.add_all(positions)
+
+    users = [User(username=f"pilot{registrations}_{i}") for i in range(registrations)]
+    db.add_all(users)
+    db.flush()
+    loadouts = [UserLoadout(user_id=user.id, loadout_id=meta.id, ship_id=ship.id) for user in users]
+    db.add_all(loadouts)
+    db.add_all([UserShip(user_id=user.id, ship_name=ship.name) for user in users])
+    db.flush()
+
+    db.add_all([
+        MissionRegistration(mission_id=mission.id, user_id=user.id, user_loadout_ids=[loadout.id])
+        for user, loadout in zip(users, loadouts)
+    ])
+    db.add_all([
+        MissionAssignment(position_id=position.id, user_id=user.id, assigned_by_id=lead.id)
+        for position, user in zip(positions, users)
+    ])
+    db.commit()
+    return mission.id
+
+
+def test_detail_query_count_is_constant(engine, db, count_statements):
+    lead = User(username="lead")
+    ship = Ship(name="Gladius")
+    db.add_all([lead, ship])
+    db.flush()
+    meta = MetaLoadout(ship_id=ship.id, name="Meta PvP")
+    db.add(meta)
+    db.flush()
+    mission_ids = {count: _seed_mission(db, lead, ship, meta, count) for count in REGISTRATION_COUNTS}
+
+    query_counts = {}
+    for count, mission_id in mission_ids.items():
+        # Frische Session, damit keine Objekte aus der Identity Map Queries einsparen
+        session = sessionmaker(bind=engine)()
+        try:
+            with count_statements as counter:
+                response = build_mission_detail(session, mission_id)
+        finally:
+            session.close()
+        query_counts[count] = counter.count
+
+        registrations = response["registrations"]
+        assert len(registrations) == count
+        assert all(reg["has_ships"] for reg in registrations)
+        assert all(
+            [loadout["ship_name"] for loadout in reg["user_loadouts_resolved"]] == ["Gladius"]
+            for reg in registrations
+        )
+
+    assert len(set(query_counts.values())) == 1, query_counts
@@ -0,0 +1,44 @@
+"""OCR-Ergebnis-Cache: Treffer ohne Commit, Insert ohne Race auf die Unique-Constraint."""
+import pytest
+
+from app.models.ocr_cache import OCRResultCache
+from app.ocr import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_pending_hits():
+    cache._pending_hits.clear()
+    yield
+    cache._pending_hits.clear()
+
+
+def test_duplicate_store_is_ignored(db):
+    cache.store_names(db, "abc:1", ["Alpha"])
+    cache.store_names(db, "abc:1", ["Beta"])
+
+    rows = db.query(OCRResultCache).all()
+    assert [(row.cache_key, row.names) for row in rows] == [("abc:1", '["Alpha"]')]
+
+
+def test_hit_does_not_commit(db, count_statements):
+    cache.store_names(db, "abc:1", ["Alpha"])
+
+    with count_statements as counter:
+        assert cache.get_cached_names(db, "abc:1") == ["Alpha"]
+        assert cache.get_cached_names(db, "abc:1") == ["Alpha"]
+        assert cache.get_cached_names(db, "missing:1") is None
+
+    assert all(statement.lstrip().upper().startswith("SELECT") for statement in counter.statements)
+    assert cache._pending_hits == {"abc:1": 2}
+
+
+def test_hits_are_flushed_before_eviction(db):
+    cache.store_names(db, "abc:1", ["Alpha"])
+    cache.get_cached_names(db, "abc:1")
+    cache.get_cached_names(db, "abc:1")
+
+    cache.store_names(db, "def:1", ["Beta"])
+
+    entry = db.query(OCRResultCache).filter(OCRResultCache.cache_key == "abc:1").one()
+    assert entry.hit_count == 2
+    assert cache._pending_hits == {}
@@ -0,0 +1,97 @@
+"""Badge-Zähler der Transfer-Anfragen: eine Query, unabhängig von der Anzahl Anfragen."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.component import Component
+from app.models.inventory import TransferRequest, TransferRequestStatus
+from app.models.user import User, UserRole
+from app.routers.inventory import compute_pending_counts
+
+
+@pytest.fixture
+def users(db):
+    owner = User(username="pioneer", role=UserRole.MEMBER, is_pioneer=True)
+    other_pioneer = User(username="pioneer2", role=UserRole.MEMBER, is_pioneer=True)
+    requester = User(username="member", role=UserRole.MEMBER)
+    admin = User(username="admin", role=UserRole.ADMIN)
+    db.add_all([owner, other_pioneer, requester, admin])
+    db.commit()
+    return {"owner": owner, "other_pioneer": other_pioneer, "requester": requester, "admin": admin}
+
+
+def add_requests(db, users, statuses):
+    component = Component(name="FR-66")
+    db.add(component)
+    db.flush()
+    for status in statuses:
+        db.add(TransferRequest(
+            requester_id=users["requester"].id,
+            owner_id=users["owner"].id,
+            component_id=component.id,
+            quantity=1,
+            status=status,
+        ))
+    db.commit()
+
+
+STATUSES = [
+    TransferRequestStatus.PENDING,
+    TransferRequestStatus.PENDING,
+    TransferRequestStatus.APPROVED,
+    TransferRequestStatus.AWAITING_RECEIPT,
+    TransferRequestStatus.COMPLETED,
+    TransferRequestStatus.REJECTED,
+]
+
+
+@pytest.mark.parametrize("role", ["owner", "other_pioneer", "requester", "admin"])
+@pytest.mark.parametrize("repeat", [1, 20])
+def test_single_statement(db, users, count_statements, role, repeat):
+    add_requests(db, users, STATUSES * repeat)
+    user = users[role]
+    db.refresh(user)
+
+    with count_statements as counter:
+        compute_pending_counts(db, user)
+
+    assert counter.count == 1, counter.statements
+
+
+def test_single_statement_with_last_seen(db, users, count_statements):
+    add_requests(db, users, STATUSES)
+    requester = users["requester"]
+    requester.last_seen_transfers = datetime.now(timezone.utc) - timedelta(days=1)
+    db.commit()
+    db.refresh(requester)
+
+    with count_statements as counter:
+        counts = compute_pending_counts(db, requester)
+
+    assert counter.count == 1, counter.statements
+    assert counts["has_unread"] is True
+
+
+def test_counts_per_role(db, users):
+    add_requests(db, users, STATUSES)
+
+    owner = compute_pending_counts(db, users["owner"])
+    assert owner["as_owner_pending"] == 2
+    assert owner["as_owner_approved"] == 1
+    assert owner["as_owner_awaiting"] == 1
+
+    # Andere Pioneers sehen Anfragen an Pioneer-Lager mit
+    other = compute_pending_counts(db, users["other_pioneer"])
+    assert other["as_owner_pending"] == 2
+    assert other["as_owner_awaiting"] == 0
+
+    requester = compute_pending_counts(db, users["requester"])
+    assert requester["as_requester_pending"] == 2
+    assert requester["as_requester_approved"] == 1
+    assert requester["awaiting_receipt"] == 1
+    assert requester["total"] == 4
+    assert requester["has_unread"] is True
+
+    admin = compute_pending_counts(db, users["admin"])
+    assert admin["admin_awaiting"] == 1
+    assert admin["total"] == 1
@@ -0,0 +1,121 @@
+"""SC-Import gegen einen lokalen Fixture-Server (echte HTTP-Anfragen, keine Mocks)."""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models.component import Component, SCImportCheckpoint
+from app.services import sc_import
+
+TOTAL_PAGES = 6
+SC_VERSION = "4.0.1-LIVE"
+
+
+def _items_page(page: int, suffix: str = "") -> dict:
+    return {
+        "data": [
+            {"uuid": f"uuid-{page}-{i}", "name": f"Cooler {page}-{i}{suffix}", "type": "Cooler"}
+            for i in range(3)
+        ],
+        "meta": {"last_page": TOTAL_PAGES},
+    }
+
+
+class FixtureServer:
+    """Liefert star-citizen.wiki-ähnliche Antworten; failing_pages antworten mit 500,
+    Items auf changed_pages bekommen einen geänderten Namen."""
+
+    def __init__(self):
+        self.failing_pages = set()
+        self.changed_pages = set()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                if url.path == "/api/v2/vehicles":
+                    body = {"data": [{"version": SC_VERSION}]}
+                elif url.path == "/api/v2/items":
+                    page = int(query["page"][0])
+                    if page in server.failing_pages:
+                        self.send_response(500)
+                        self.end_headers()
+                        return
+                    body = _items_page(page, " v2" if page in server.changed_pages else "")
+                elif url.path == "/api/v2/starsystems":
+                    body = {"data": []}
+                else:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                payload = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}/api/v2"
+
+
+@pytest.fixture
+def fixture_server(monkeypatch):
+    server = FixtureServer()
+    thread = threading.Thread(target=server.httpd.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(sc_import, "SC_API_BASE", server.base_url)
+    monkeypatch.setattr(sc_import.settings, "sc_import_max_retries", 0)
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+
+
+@pytest.fixture
+def jobs(engine, monkeypatch):
+    monkeypatch.setattr(sc_import, "SessionLocal", sessionmaker(bind=engine))
+    return sc_import.SCImportJobManager()
+
+
+def _run_job(jobs: sc_import.SCImportJobManager) -> dict:
+    assert jobs.start()
+    jobs._thread.join(timeout=30)
+    assert not jobs.is_running()
+    return jobs.progress()
+
+
+def test_complete_import_marks_job_completed(fixture_server, jobs, db):
+    progress = _run_job(jobs)
+
+    assert progress["status"] == "completed"
+    assert progress["error"] is None
+    assert db.query(Component).count() == TOTAL_PAGES * 3
+    assert db.query(SCImportCheckpoint.status).scalar() == "completed"
+
+
+def test_too_many_failed_pages_marks_job_failed(fixture_server, jobs, db):
+    fixture_server.failing_pages = {2, 3, 4}
+
+    progress = _run_job(jobs)
+
+    assert progress["status"] == "failed"
+    assert "Abbruch" in progress["error"]
+    assert db.query(SCImportCheckpoint.status).scalar() == "failed"
+
+
+def test_rerun_writes_changed_pages_behind_unchanged_first_page(fixture_server, jobs, db):
+    _run_job(jobs)
+    fixture_server.changed_pages = {4}
+
+    progress = _run_job(jobs)
+
+    assert progress["status"] == "completed"
+    assert progress["stats"].pages_skipped == TOTAL_PAGES - 1
+    assert db.query(Component.name).filter(Component.sc_uuid == "uuid-4-0").scalar() == "Cooler 4-0 v2"
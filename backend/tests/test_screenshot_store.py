@@ -0,0 +1,72 @@
+"""Screenshot-Blobs: geteilte Blobs bleiben erhalten, fehlgeschlagene Uploads räumen auf."""
+import pytest
+
+from app.models.attendance import AttendanceSession
+from app.models.user import User
+from app.services import screenshot_store
+from app.services.blob_store import FileSystemBlobStore
+
+IMAGE = b"\x89PNG\r\n\x1a\n" + b"not really a png"
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = FileSystemBlobStore(str(tmp_path))
+    monkeypatch.setattr(screenshot_store, "get_blob_store", lambda: store)
+    return store
+
+
+@pytest.fixture
+def user(db):
+    user = User(username="officer")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _create_session(db, user, data):
+    session = AttendanceSession(created_by_id=user.id)
+    with screenshot_store.screenshot_upload(db, session, data):
+        db.add(session)
+        db.commit()
+    return session
+
+
+def test_purge_keeps_blob_shared_with_other_session(db, store, user):
+    first = _create_session(db, user, IMAGE)
+    second = _create_session(db, user, IMAGE)
+    assert first.screenshot_key == second.screenshot_key
+
+    keys = screenshot_store.release_screenshot(db, first)
+    db.commit()
+    screenshot_store.purge_blobs(db, keys)
+    assert store.exists(second.screenshot_key)
+
+    keys = screenshot_store.release_screenshot(db, second)
+    db.commit()
+    screenshot_store.purge_blobs(db, keys)
+    assert not store.exists(keys[0])
+
+
+def test_failed_create_removes_new_blob(db, store, user):
+    session = AttendanceSession(created_by_id=user.id)
+    with pytest.raises(RuntimeError):
+        with screenshot_store.screenshot_upload(db, session, IMAGE):
+            db.add(session)
+            db.flush()
+            raise RuntimeError("Commit fehlgeschlagen")
+
+    assert not store.exists(FileSystemBlobStore.key_for(IMAGE))
+    assert db.query(AttendanceSession).count() == 0
+
+
+def test_failed_create_keeps_blob_of_existing_session(db, store, user):
+    existing = _create_session(db, user, IMAGE)
+
+    session = AttendanceSession(created_by_id=user.id)
+    with pytest.raises(RuntimeError):
+        with screenshot_store.screenshot_upload(db, session, IMAGE):
+            db.add(session)
+            raise RuntimeError("Commit fehlgeschlagen")
+
+    assert store.exists(existing.screenshot_key)
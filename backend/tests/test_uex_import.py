@@ -0,0 +1,91 @@
+"""UEX-Sync: Preise, Verlauf und Sync-Log werden gemeinsam committet."""
+from datetime import date
+
+import pytest
+
+from app.models.component import Component
+from app.models.item_price import ItemPrice, ItemPriceHistory, UEXSyncLog
+from app.services import uex_import
+from app.services.price_history import record_price_history
+
+
+def _entry(uex_id, price):
+    return {
+        "id": uex_id, "item_name": f"Item {uex_id}", "id_terminal": 1,
+        "terminal_name": "Area 18", "price_buy": price, "price_sell": None,
+    }
+
+
+@pytest.mark.parametrize("mode", uex_import.SYNC_MODES)
+def test_failed_rollup_keeps_old_prices(db, monkeypatch, mode):
+    service = uex_import.UEXImportService(db)
+    monkeypatch.setattr(service, "_fetch_all_prices", lambda: [_entry(1, 100), _entry(2, 200)])
+    service.sync_prices(mode)
+
+    def broken_rollups(db):
+        raise RuntimeError("Rollup fehlgeschlagen")
+
+    monkeypatch.setattr(service, "_fetch_all_prices", lambda: [_entry(1, 150), _entry(2, 250)])
+    monkeypatch.setattr(uex_import, "refresh_price_rollups", broken_rollups)
+    with pytest.raises(RuntimeError):
+        service.sync_prices(mode)
+
+    prices = sorted(price for (price,) in db.query(ItemPrice.price_buy))
+    assert prices == [100, 200]
+    logs = db.query(UEXSyncLog).order_by(UEXSyncLog.id).all()
+    assert [log.status for log in logs] == ["completed", "failed"]
+    assert logs[1].rows_updated is None
+
+
+@pytest.mark.parametrize("mode", uex_import.SYNC_MODES)
+def test_shrunken_sync_is_refused_and_logged(db, monkeypatch, mode):
+    service = uex_import.UEXImportService(db)
+    monkeypatch.setattr(service, "_fetch_all_prices", lambda: [_entry(i, 100) for i in range(1, 5)])
+    service.sync_prices(mode)
+
+    monkeypatch.setattr(service, "_fetch_all_prices", lambda: [_entry(1, 150)])
+    with pytest.raises(uex_import.IncompleteSyncError):
+        service.sync_prices(mode)
+
+    assert db.query(ItemPrice).count() == 4
+    refused = db.query(UEXSyncLog).order_by(UEXSyncLog.id.desc()).first()
+    assert refused.status == "refused"
+    assert "Nur 1 Preise erhalten (bisher 4)" in refused.errors
+
+    # force übergeht die Prüfung
+    assert service.sync_prices(mode, force=True).status == "completed"
+    assert [price for (price,) in db.query(ItemPrice.price_buy)] == [150]
+
+
+def test_min_staged_ratio_comes_from_settings(db, monkeypatch):
+    service = uex_import.UEXImportService(db)
+    monkeypatch.setattr(service, "_fetch_all_prices", lambda: [_entry(i, 100) for i in range(1, 5)])
+    service.sync_prices()
+
+    monkeypatch.setattr(uex_import.settings, "uex_min_staged_ratio", 0.2)
+    monkeypatch.setattr(service, "_fetch_all_prices", lambda: [_entry(1, 150)])
+    assert service.sync_prices().status == "completed"
+    assert db.query(ItemPrice).count() == 1
+
+
+def test_price_history_upserts_day_bucket(db):
+    component = Component(name="FR-66", category="Ship Components")
+    db.add(component)
+    db.flush()
+    price = ItemPrice(component_id=component.id, item_name="FR-66", terminal_id=1,
+                      terminal_name="Area 18", price_buy=100)
+    db.add(price)
+    db.flush()
+
+    record_price_history(db, date(2026, 1, 1))
+    record_price_history(db, date(2026, 1, 2))
+    first = db.query(ItemPriceHistory).filter_by(day=date(2026, 1, 2)).one()
+
+    price.price_buy = 120
+    db.flush()
+    record_price_history(db, date(2026, 1, 2))
+    db.expire_all()
+
+    history = db.query(ItemPriceHistory).order_by(ItemPriceHistory.day).all()
+    assert [(h.day.day, h.price_buy) for h in history] == [(1, 100), (2, 120)]
+    assert history[1].id == first.id
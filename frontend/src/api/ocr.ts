@@ -0,0 +1,31 @@
+import axios, { type AxiosResponse } from 'axios'
+import { apiClient } from './client'
+
+/**
+ * Lädt einen Screenshot zum OCR-Scan hoch und wartet auf das Ergebnis.
+ * OCR läuft im Hintergrund; bei Cache-Treffer ist der Job sofort fertig.
+ * Jobs leben nur im Server-Prozess: meldet der Server 404 (anderer Worker,
+ * Neustart), wird der Screenshot einmal erneut hochgeladen.
+ */
+export async function scanScreenshot(file: File, retries = 1): Promise<AxiosResponse> {
+  const formData = new FormData()
+  formData.append('file', file)
+  const job = await apiClient.post('/api/attendance/scan', formData, {
+    headers: { 'Content-Type': 'multipart/form-data' },
+  })
+
+  let done = job.data.status !== 'pending'
+  for (;;) {
+    if (!done) await new Promise((resolve) => setTimeout(resolve, 1000))
+    try {
+      const response = await apiClient.get(`/api/attendance/scan/${job.data.job_id}`)
+      if (response.data.status !== 'pending') return response
+    } catch (error) {
+      if (retries > 0 && axios.isAxiosError(error) && error.response?.status === 404) {
+        return scanScreenshot(file, retries - 1)
+      }
+      throw error
+    }
+    done = false
+  }
+}
@@ -184,6 +184,7 @@ export interface AttendanceSession {
   records: AttendanceRecord[]
   is_confirmed: boolean
   has_screenshot: boolean
+  has_thumbnail: boolean
   has_loot_session: boolean
   loot_session_id: number | null
   created_at: string
@@ -1,8 +1,8 @@
 import { Outlet, NavLink, useLocation } from 'react-router-dom'
 import { useAuthStore } from '../hooks/useAuth'
 import { useTheme } from '../hooks/useTheme'
-import { useQuery } from '@tanstack/react-query'
-import { apiClient } from '../api/client'
+import { useQuery, useQueryClient } from '@tanstack/react-query'
+import { apiClient, API_URL } from '../api/client'
 import type { PendingRequestsCount } from '../api/types'
 import {
   Home,
@@ -29,7 +29,7 @@ import {
   Crosshair,
   Wrench,
 } from 'lucide-react'
-import { useState, useRef } from 'react'
+import { useState, useRef, useEffect } from 'react'
 import clsx from 'clsx'
 
 // Dashboard (immer sichtbar, standalone)
@@ -127,9 +127,47 @@ export default function Layout() {
       return response.data
     },
     enabled: hasInventoryAccess,
-    refetchInterval: 30000, // Alle 30 Sekunden aktualisieren
   })
 
+  // Badge-Zähler per Server-Sent Events aktuell halten (statt Polling)
+  const queryClient = useQueryClient()
+  useEffect(() => {
+    if (!hasInventoryAccess || !localStorage.getItem('token')) return
+    let source: EventSource | null = null
+    let retryTimer: ReturnType<typeof setTimeout> | undefined
+    let closed = false
+
+    // Jede Verbindung holt ein frisches, kurzlebiges Ticket (kein JWT in der URL)
+    const connect = async () => {
+      try {
+        const response = await apiClient.post('/api/inventory/transfer-requests/stream-ticket')
+        if (closed) return
+        source = new EventSource(
+          `${API_URL}/api/inventory/transfer-requests/stream?ticket=${encodeURIComponent(response.data.ticket)}`
+        )
+        source.onmessage = (event) => {
+          queryClient.setQueryData(['transfer-requests', 'pending', 'count'], JSON.parse(event.data))
+        }
+        // Token abgelaufen: nicht neu verbinden, der nächste API-Call meldet ab
+        source.addEventListener('expired', () => source?.close())
+        // Verbindung weg: das Ticket ist dann abgelaufen, also mit neuem Ticket neu verbinden
+        source.onerror = () => {
+          source?.close()
+          if (!closed) retryTimer = setTimeout(connect, 5000)
+        }
+      } catch {
+        if (!closed) retryTimer = setTimeout(connect, 30000)
+      }
+    }
+    connect()
+
+    return () => {
+      closed = true
+      clearTimeout(retryTimer)
+      source?.close()
+    }
+  }, [hasInventoryAccess, queryClient])
+
   // Pending Merges für Admins laden
   const { data: pendingMergesCount } = useQuery<{ count: number }>({
     queryKey: ['pending-merges', 'count'],
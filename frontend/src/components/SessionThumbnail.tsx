@@ -0,0 +1,37 @@
+import { useEffect, useState } from 'react'
+import { apiClient } from '../api/client'
+
+interface SessionThumbnailProps {
+  sessionId: number
+  className?: string
+}
+
+/**
+ * WebP-Vorschau eines Anwesenheits-Screenshots für Listenansichten.
+ * Lädt über den API-Client (Auth-Header) statt <img src>, der Blob wird beim Unmount freigegeben.
+ */
+export default function SessionThumbnail({ sessionId, className }: SessionThumbnailProps) {
+  const [url, setUrl] = useState<string | null>(null)
+
+  useEffect(() => {
+    let objectUrl: string | null = null
+    let cancelled = false
+
+    apiClient
+      .get(`/api/attendance/${sessionId}/thumbnail`, { responseType: 'blob' })
+      .then((response) => {
+        if (cancelled) return
+        objectUrl = URL.createObjectURL(response.data)
+        setUrl(objectUrl)
+      })
+      .catch(() => setUrl(null))
+
+    return () => {
+      cancelled = true
+      if (objectUrl) URL.revokeObjectURL(objectUrl)
+    }
+  }, [sessionId])
+
+  if (!url) return null
+  return <img src={url} alt="Screenshot-Vorschau" loading="lazy" className={className} />
+}
@@ -12,6 +12,16 @@ interface SCImportStats {
   locations_updated: number
   errors: string[]
   sc_version: string | null
+  pages_skipped?: number
+}
+
+interface SCImportProgress {
+  status: 'idle' | 'running' | 'completed' | 'failed'
+  phase: string | null
+  pages_done: number
+  total_pages: number | null
+  error: string | null
+  stats: SCImportStats | null
 }
 
 interface SCStats {
@@ -43,6 +53,7 @@ export default function AdminPage() {
   const { user } = useAuthStore()
   const queryClient = useQueryClient()
   const [lastImport, setLastImport] = useState<SCImportStats | null>(null)
+  const [syncProgress, setSyncProgress] = useState<SCImportProgress | null>(null)
   const [csvResult, setCsvResult] = useState<CSVImportResult | null>(null)
   const [csvType, setCsvType] = useState<'inventory' | 'treasury' | 'members' | null>(null)
   const inventoryFileRef = useRef<HTMLInputElement>(null)
@@ -125,7 +136,21 @@ export default function AdminPage() {
   })
 
   const syncMutation = useMutation({
-    mutationFn: () => apiClient.post('/api/sc/sync').then((r) => r.data),
+    // Import läuft als Hintergrund-Job: starten, dann Fortschritt abfragen
+    mutationFn: async (): Promise<SCImportStats> => {
+      let progress: SCImportProgress = (await apiClient.post('/api/sc/sync')).data
+      while (progress.status === 'running') {
+        setSyncProgress(progress)
+        await new Promise((resolve) => setTimeout(resolve, 2000))
+        progress = (await apiClient.get('/api/sc/sync/progress')).data
+      }
+      setSyncProgress(null)
+      if (progress.status === 'failed' && !progress.stats) {
+        throw new Error(progress.error || 'Import fehlgeschlagen')
+      }
+      return progress.stats ?? { components_added: 0, components_updated: 0, locations_added: 0, locations_updated: 0, errors: [], sc_version: null }
+    },
+    onError: () => setSyncProgress(null),
     onSuccess: (data: SCImportStats) => {
       setLastImport(data)
       queryClient.invalidateQueries({ queryKey: ['sc-stats'] })
@@ -497,7 +522,11 @@ export default function AdminPage() {
             size={20}
             className={syncMutation.isPending ? 'animate-spin' : ''}
           />
-          {syncMutation.isPending ? 'Importiere Daten...' : 'SC-Daten synchronisieren'}
+          {syncMutation.isPending
+            ? syncProgress?.total_pages
+              ? `Importiere Daten... (Seite ${syncProgress.pages_done}/${syncProgress.total_pages})`
+              : 'Importiere Daten...'
+            : 'SC-Daten synchronisieren'}
         </button>
 
         {/* Import Results */}
@@ -532,6 +561,12 @@ export default function AdminPage() {
               </div>
             </div>
 
+            {!!lastImport.pages_skipped && (
+              <p className="mt-3 text-sm text-gray-400">
+                {lastImport.pages_skipped} unveränderte Seiten übersprungen
+              </p>
+            )}
+
             {lastImport.errors.length > 0 && (
               <div className="mt-4">
                 <span className="text-red-400 text-sm">
@@ -1,7 +1,9 @@
 import { useState, useEffect, useCallback } from 'react'
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 import { apiClient } from '../api/client'
+import { scanScreenshot } from '../api/ocr'
 import { useAuthStore } from '../hooks/useAuth'
+import SessionThumbnail from '../components/SessionThumbnail'
 import {
   Upload,
   Plus,
@@ -72,13 +74,8 @@ export default function AttendancePage() {
   })
 
   const scanMutation = useMutation({
-    mutationFn: (file: File) => {
-      const formData = new FormData()
-      formData.append('file', file)
-      return apiClient.post('/api/attendance/scan', formData, {
-        headers: { 'Content-Type': 'multipart/form-data' },
-      })
-    },
+    // OCR läuft im Hintergrund - scanScreenshot fragt das Ergebnis ab
+    mutationFn: (file: File) => scanScreenshot(file),
     onSuccess: (response) => {
       setScanResult(response.data)
       setSelectedUsers(response.data.matched.map((m: { user_id: number }) => m.user_id))
@@ -777,6 +774,12 @@ export default function AttendancePage() {
                     <ChevronDown size={20} />
                   )}
                 </button>
+                {session.has_thumbnail && (
+                  <SessionThumbnail
+                    sessionId={session.id}
+                    className="w-16 h-16 object-cover rounded border border-gray-700"
+                  />
+                )}
                 <div>
                   <h3 className="text-lg font-bold flex items-center gap-2">
                     {new Date(session.date).toLocaleDateString('de-DE', {
@@ -369,7 +369,7 @@ export default function InventoryPage() {
     queryKey: ['transfer-requests', 'pending', 'count'],
     queryFn: () => apiClient.get('/api/inventory/transfer-requests/pending/count').then((r) => r.data),
     enabled: hasInventory,
-    refetchInterval: 30000, // Alle 30 Sekunden aktualisieren
+    // Aktualisierung kommt per Server-Sent Events (siehe Layout)
   })
 
   // Transfer-Requests als gesehen markieren wenn geöffnet
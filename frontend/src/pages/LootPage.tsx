@@ -1,6 +1,7 @@
 import { useState, useMemo, useEffect, useCallback } from 'react'
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 import { apiClient } from '../api/client'
+import { scanScreenshot } from '../api/ocr'
 import { useAuthStore } from '../hooks/useAuth'
 import {
   Gift,
@@ -123,13 +124,7 @@ export default function LootPage() {
 
   // OCR-Scan Mutation
   const scanMutation = useMutation({
-    mutationFn: (file: File) => {
-      const formData = new FormData()
-      formData.append('file', file)
-      return apiClient.post('/api/attendance/scan', formData, {
-        headers: { 'Content-Type': 'multipart/form-data' },
-      })
-    },
+    mutationFn: (file: File) => scanScreenshot(file),
     onSuccess: (response) => {
       setScanResult(response.data)
       setSelectedUsers(response.data.matched.map((m: { user_id: number }) => m.user_id))
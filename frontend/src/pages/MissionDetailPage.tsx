@@ -11,6 +11,7 @@ import {
   Shield,
   Edit3,
   Copy,
+  CopyPlus,
   Check,
   Lock,
   CheckCircle,
@@ -135,6 +136,14 @@ export default function MissionDetailPage() {
     },
   })
 
+  const cloneMutation = useMutation({
+    mutationFn: () => apiClient.post(`/api/missions/${id}/clone`, {}).then((r) => r.data),
+    onSuccess: (clone) => {
+      queryClient.invalidateQueries({ queryKey: ['missions'] })
+      navigate(`/einsaetze/${clone.id}/bearbeiten`)
+    },
+  })
+
   const deleteMutation = useMutation({
     mutationFn: () => apiClient.delete(`/api/missions/${id}`),
     onSuccess: () => {
@@ -334,6 +343,17 @@ export default function MissionDetailPage() {
                 Abschließen
               </button>
             )}
+            {canManage && (
+              <button
+                onClick={() => cloneMutation.mutate()}
+                disabled={cloneMutation.isPending}
+                className="flex items-center gap-2 px-3 py-2 bg-krt-dark border border-gray-600 rounded hover:bg-gray-700 disabled:opacity-50"
+                title="Als neuen Entwurf kopieren"
+              >
+                <CopyPlus size={16} />
+                Kopieren
+              </button>
+            )}
             {canManage && (
               <button
                 onClick={() => setShowDeleteConfirm(true)}
@@ -4,6 +4,7 @@
 
 BACKUP_DIR="/home/poison/backups"
 DB_PATH="/home/poison/poison/backend/data/poison.db"
+BLOB_PATH="/home/poison/poison/backend/data/blobs"
 DATE=$(date +%Y-%m-%d)
 KEEP_DAYS=30
 
@@ -16,6 +17,16 @@ if command -v sqlite3 &> /dev/null; then
 else
     # Fallback: einfache Kopie (sicher wenn DB nicht gerade schreibt)
     cp "$DB_PATH" "$BACKUP_DIR/poison_$DATE.db"
+    # WAL-Modus: noch nicht zurückgeschriebene Änderungen mitsichern
+    if [ -f "$DB_PATH-wal" ]; then
+        cp "$DB_PATH-wal" "$BACKUP_DIR/poison_$DATE.db-wal"
+    fi
+fi
+
+# Screenshots aus dem Blob Store sichern (inhaltsadressiert -> nur neue Dateien kopieren)
+if [ -d "$BLOB_PATH" ]; then
+    mkdir -p "$BACKUP_DIR/blobs"
+    cp -ru "$BLOB_PATH/." "$BACKUP_DIR/blobs/"
 fi
 
 # Alte Backups löschen (älter als 30 Tage)